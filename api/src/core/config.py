@@ -17,6 +17,7 @@ class Settings(BaseSettings):
     default_voice_code: str | None = (
         None  # If set, overrides the first letter of voice name, though api call param still takes precedence
     )
+    warmup_languages: list[str] = []  # Language codes whose pipelines are built and warmed at startup, e.g. ["a", "b", "j"]
     use_gpu: bool = True  # Whether to use GPU acceleration if available
     device_type: str | None = (
         None  # Will be auto-detected if None, can be "cuda", "mps", or "cpu"
@@ -25,21 +26,86 @@ class Settings(BaseSettings):
         False  # Whether to allow saving combined voices locally
     )
 
+    # Inference Backend Settings
+    inference_backend: str = (
+        "pytorch"  # "pytorch", or "onnx" to run the model on ONNX Runtime on CPU
+    )
+    model_replicas: int = (
+        1  # Model replicas in this process sharing one copy of the weights, each runs one forward at a time in place of inference_workers
+    )
+    replica_threads: int = 0  # Torch threads per replica on CPU, 0 splits the cores between replicas
+    model_quantization: str = (
+        "none"  # "int8" for dynamic int8 Linear/LSTM weights with the PyTorch backend on CPU
+    )
+    onnx_sessions: int = 1  # ONNX Runtime sessions, forwards beyond this wait for a free one
+    onnx_intra_op_threads: int = 0  # Threads per ONNX forward pass, 0 lets onnxruntime decide
+    onnx_inter_op_threads: int = 0  # Threads for independent ONNX graph nodes, 0 lets onnxruntime decide
+
+    # Pre-fork Supervisor Settings
+    prefork_workers: int = 2  # Worker processes started by python -m api.src.supervisor
+    prefork_threads: int = 0  # Torch threads per worker, 0 splits the cores between workers
+    prefork_restart_delay: float = 1.0  # Seconds to wait before restarting a worker that crashed on startup
+
+    # Inference Executor Settings
+    inference_executor: str = (
+        "thread"  # "thread" for a shared worker pool, "device_queue" for one worker per device
+    )
+    inference_workers: int = 1  # Worker threads in "thread" mode, with a single model replica
+    batching_enabled: bool = (
+        False  # Batch forward passes from concurrent requests, needs inference_workers >= 2 and one model replica
+    )
+    batching_window_ms: float = 5.0  # How long to wait for more requests before running a batch
+    batching_max_batch_size: int = 8  # Maximum number of forward passes per batch
+
+    # Response Cache Settings
+    response_cache_enabled: bool = (
+        False  # Serve repeated /v1/audio/speech requests from a content-addressed cache
+    )
+    response_cache_memory_mb: float = 64.0  # Byte budget of the in-memory tier in MB
+    response_cache_disk_mb: float = 512.0  # Byte budget of the on-disk tier in MB per process, prefork workers can fill prefork_workers times this, 0 disables it
+    response_cache_dir: str = "api/response_cache"  # Directory for the on-disk tier
+
     # Container absolute paths
     model_dir: str = "/app/api/src/models"  # Absolute path in container
     voices_dir: str = "/app/api/src/voices/v1_0"  # Absolute path in container
 
     # Audio Settings
     sample_rate: int = 24000
+    encoder_pool_size: int = 2  # Prewarmed audio writers kept per format, 0 disables the pool
+    encoder_pool_formats: list[str] = ["mp3", "opus"]  # Formats prewarmed at startup
+    encode_queue_size: int = (
+        2  # Chunks buffered between inference and encoding, 0 encodes inline on the event loop
+    )
+    encode_workers: int = 2  # Encoder threads shared by all streams
     default_volume_multiplier: float = 1.0
+    max_concurrent_chunks: int = 4  # Chunks synthesized at the same time across all streams
+    scheduler_max_queue_depth: int = 64  # Waiting chunks above which new requests get 429, 0 for no limit
     # Text Processing Settings
     target_min_tokens: int = 175  # Target minimum tokens per chunk
     target_max_tokens: int = 250  # Target maximum tokens per chunk
     absolute_max_tokens: int = 450  # Absolute maximum tokens per chunk
+    first_chunk_max_tokens: int = 0  # Token budget of the first streamed chunk for faster first audio, 0 uses the targets above
+    chunk_growth_factor: float = 2.0  # How much each chunk after a small first chunk may grow until the targets are reached
     advanced_text_normalization: bool = True  # Preproesses the text before misiki
+    reuse_split_phonemes: bool = (
+        False  # Feed the splitter's espeak phonemes to the model instead of running G2P again (English, no timestamps)
+    )
     voice_weight_normalization: bool = (
         True  # Normalize the voice weights so they add up to 1
     )
+    voice_blend_cache_size: int = 64  # Maximum number of combined voices kept in memory
+    sentence_cache_enabled: bool = (
+        False  # Reuse audio of chunks already synthesized with the same voice, speed and language
+    )
+    sentence_cache_max_entries: int = 4096  # Maximum number of cached chunks, least recently used evicted first
+    sentence_cache_max_mb: float = 256.0  # Maximum memory used by cached chunk audio in MB
+    text_process_workers: int = 0  # Processes long texts are normalized and phonemized in parallel across, 0 keeps all text work in the server process
+    text_process_min_chars: int = 20000  # Minimum text length spread across the text processing workers
+    phonemizer_njobs: int = 1  # Worker processes espeak splits large sentence batches across when chunking
+    phoneme_cache_size: int = 20000  # Maximum number of texts whose G2P output is cached, 0 disables the cache
+    phoneme_cache_file: str | None = (
+        None  # JSON file the phoneme cache is loaded from at startup and saved to on shutdown
+    )
 
     gap_trim_ms: int = (
         1  # Base amount to trim from streaming chunk ends in milliseconds
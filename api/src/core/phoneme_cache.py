@@ -0,0 +1,212 @@
+"""Shared LRU cache of grapheme-to-phoneme results."""
+
+import copy
+import json
+import os
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+from misaki.token import MToken
+
+from .cache import LRUCache
+from .config import settings
+from .metrics import register_cache, registry
+
+# Bumped whenever the stored layout changes, older files are ignored
+FILE_VERSION = 1
+
+PHONEME_CACHE_REQUESTS = registry.counter(
+    "kokoro_phoneme_cache_requests_total",
+    "Phoneme lookups, by G2P backend and whether they were served from cache",
+    ["backend", "result"],
+)
+
+G2PResult = Tuple[str, Optional[List[MToken]]]
+
+
+class PhonemeCache:
+    """Bounded LRU of G2P output keyed by (backend, language, text).
+
+    Covers the espeak phonemizer used for chunk splitting ("espeak") and
+    the G2P of the KPipelines used for generation ("misaki"). Text is
+    normalized before it reaches either, so repeated sentences and short
+    phrases across requests resolve to the same key.
+    """
+
+    def __init__(self, max_entries: int):
+        """Initialize cache.
+
+        Args:
+            max_entries: Maximum number of cached texts, 0 disables caching
+        """
+        self._cache = LRUCache(max_entries=max(0, max_entries))
+        register_cache("phonemes", self._cache.stats)
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache.enabled
+
+    def get(self, backend: str, language: str, text: str) -> Any:
+        """Get cached G2P output, or None on a miss."""
+        if not self.enabled:
+            return None
+        value = self._cache.get((backend, language, text))
+        PHONEME_CACHE_REQUESTS.inc(
+            backend=backend, result="hit" if value is not None else "miss"
+        )
+        return value
+
+    def put(self, backend: str, language: str, text: str, value: Any) -> None:
+        """Store G2P output for text."""
+        self._cache.put((backend, language, text), value)
+
+    def get_or_compute(
+        self, backend: str, language: str, text: str, compute: Callable[[str], Any]
+    ) -> Any:
+        """Get cached G2P output, computing and storing it on a miss.
+
+        Args:
+            backend: G2P backend name
+            language: Language code
+            text: Normalized text
+            compute: Called with text on a miss
+
+        Returns:
+            G2P output for text
+        """
+        value = self.get(backend, language, text)
+        if value is None:
+            value = compute(text)
+            self.put(backend, language, text, value)
+        return value
+
+    def wrap_g2p(self, g2p: Callable[[str], G2PResult], language: str) -> "CachedG2P":
+        """Wrap a KPipeline G2P callable with this cache."""
+        return CachedG2P(g2p, language, self)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return self._cache.stats()
+
+    def save(self, path: str) -> int:
+        """Write all entries to a JSON file, least recently used first.
+
+        Args:
+            path: File to write
+
+        Returns:
+            Number of entries written
+        """
+        entries = [
+            [backend, language, text, _dump_value(value)]
+            for (backend, language, text), value in self._cache.items()
+        ]
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # Pre-forked workers all save to the same file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": FILE_VERSION, "entries": entries}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        return len(entries)
+
+    def load(self, path: str) -> int:
+        """Read entries written by save.
+
+        Args:
+            path: File to read
+
+        Returns:
+            Number of entries loaded
+        """
+        if not self.enabled or not os.path.exists(path):
+            return 0
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != FILE_VERSION:
+                logger.warning(f"Ignoring phoneme cache file {path} with old layout")
+                return 0
+            for backend, language, text, value in data["entries"]:
+                self._cache.put((backend, language, text), _load_value(value))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Failed to load phoneme cache file {path}: {e}")
+            return 0
+        return len(data["entries"])
+
+
+class CachedG2P:
+    """Drop-in replacement for KPipeline.g2p backed by a PhonemeCache.
+
+    KPipeline writes timestamps onto the returned tokens, so every call
+    gets its own copies of the cached tokens.
+    """
+
+    def __init__(self, g2p: Callable[[str], G2PResult], language: str, cache: PhonemeCache):
+        self.g2p = g2p
+        self.language = language
+        self.cache = cache
+        # Only the English pipelines use the tokens, the others just the phonemes
+        self.keep_tokens = language in ("a", "b")
+
+    def _compute(self, text: str) -> G2PResult:
+        ps, tokens = self.g2p(text)
+        return ps, list(tokens) if self.keep_tokens and tokens is not None else None
+
+    def __call__(self, text: str) -> G2PResult:
+        ps, tokens = self.cache.get_or_compute("misaki", self.language, text, self._compute)
+        if tokens is not None:
+            tokens = [copy.copy(token) for token in tokens]
+        return ps, tokens
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose the wrapped G2P's attributes (lexicon, fallback, ...)
+        if name == "g2p":
+            raise AttributeError(name)
+        return getattr(self.g2p, name)
+
+
+def _dump_token(token: MToken) -> Dict[str, Any]:
+    return {
+        "text": token.text,
+        "tag": token.tag,
+        "whitespace": token.whitespace,
+        "phonemes": token.phonemes,
+        "start_ts": token.start_ts,
+        "end_ts": token.end_ts,
+        "_": dict(token._) if token._ is not None else None,
+    }
+
+
+def _load_token(data: Dict[str, Any]) -> MToken:
+    underscore = data.pop("_")
+    return MToken(
+        **data, _=MToken.Underscore(underscore) if underscore is not None else None
+    )
+
+
+def _dump_value(value: Any) -> Any:
+    if isinstance(value, str):
+        return value
+    ps, tokens = value
+    return [ps, [_dump_token(t) for t in tokens] if tokens is not None else None]
+
+
+def _load_value(value: Any) -> Any:
+    if isinstance(value, str):
+        return value
+    ps, tokens = value
+    return ps, [_load_token(t) for t in tokens] if tokens is not None else None
+
+
+_instance: Optional[PhonemeCache] = None
+
+
+def get_phoneme_cache() -> PhonemeCache:
+    """Get the global phoneme cache, sized from settings."""
+    global _instance
+    if _instance is None:
+        _instance = PhonemeCache(settings.phoneme_cache_size)
+    return _instance
@@ -2,6 +2,7 @@
 
 from .base import BaseModelBackend
 from .kokoro_v1 import KokoroV1
+from .kokoro_v1_onnx import KokoroV1Onnx
 from .model_manager import ModelManager, get_manager
 
 __all__ = [
@@ -9,4 +10,5 @@ __all__ = [
     "ModelManager",
     "get_manager",
     "KokoroV1",
+    "KokoroV1Onnx",
 ]
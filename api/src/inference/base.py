@@ -21,19 +21,26 @@ class AudioChunk:
         self.output = output
 
     @staticmethod
-    def combine(audio_chunk_list: List):
-        output = AudioChunk(
-            audio_chunk_list[0].audio, audio_chunk_list[0].word_timestamps
-        )
-
-        for audio_chunk in audio_chunk_list[1:]:
-            output.audio = np.concatenate(
-                (output.audio, audio_chunk.audio), dtype=np.int16
-            )
-            if output.word_timestamps is not None:
-                output.word_timestamps += audio_chunk.word_timestamps
-
-        return output
+    def combine(audio_chunk_list: List["AudioChunk"]) -> "AudioChunk":
+        """Combine chunks into one, copying each chunk's audio exactly once.
+
+        The input chunks are left untouched, including their timestamp lists.
+        """
+        total_samples = sum(len(audio_chunk.audio) for audio_chunk in audio_chunk_list)
+        audio = np.empty(total_samples, dtype=np.int16)
+        offset = 0
+        for audio_chunk in audio_chunk_list:
+            audio[offset : offset + len(audio_chunk.audio)] = audio_chunk.audio
+            offset += len(audio_chunk.audio)
+
+        word_timestamps = None
+        if audio_chunk_list[0].word_timestamps is not None:
+            word_timestamps = []
+            for audio_chunk in audio_chunk_list:
+                if audio_chunk.word_timestamps:
+                    word_timestamps.extend(audio_chunk.word_timestamps)
+
+        return AudioChunk(audio, word_timestamps)
 
 
 class ModelBackend(ABC):
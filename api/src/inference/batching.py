@@ -0,0 +1,248 @@
+"""Dynamic micro-batching of model forward passes across requests."""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+import torch
+from kokoro import KModel
+from loguru import logger
+from torch.nn.utils.rnn import pack_padded_sequence, pad_packed_sequence, pad_sequence
+
+from ..core.metrics import STAGE_SECONDS
+from .executor import current_cancellation
+
+
+@dataclass
+class _BatchItem:
+    """A single forward pass waiting to be batched."""
+
+    input_ids: torch.LongTensor
+    ref_s: torch.FloatTensor
+    speed: float
+    future: Future = field(default_factory=Future)
+
+
+@torch.no_grad()
+def forward_batch(
+    model: KModel,
+    input_ids: List[torch.LongTensor],
+    ref_s: torch.FloatTensor,
+    speeds: torch.FloatTensor,
+) -> List[KModel.Output]:
+    """Run several forward passes with one batched text-side pass.
+
+    The BERT encoder, duration encoder, duration LSTM and text encoder all
+    take length masks, so they run once over the padded batch. Alignment,
+    F0/noise prediction and the decoder work on per-item frame counts and use
+    instance norm over time, so they run per item to keep the audio identical
+    to unbatched inference.
+
+    Args:
+        model: Loaded KModel
+        input_ids: Token ids per item, including the boundary tokens
+        ref_s: Reference style vectors, shape [batch, 256]
+        speeds: Speed multiplier per item, shape [batch]
+
+    Returns:
+        One KModel.Output per item, with audio and durations on CPU
+    """
+    device = model.device
+    input_lengths = torch.tensor([len(ids) for ids in input_ids], dtype=torch.long)
+    padded_ids = pad_sequence(input_ids, batch_first=True).to(device)
+    ref_s = ref_s.to(device)
+    speeds = speeds.to(device)
+
+    text_mask = torch.arange(padded_ids.shape[1]).unsqueeze(0)
+    text_mask = torch.gt(text_mask + 1, input_lengths.unsqueeze(1)).to(device)
+    bert_dur = model.bert(padded_ids, attention_mask=(~text_mask).int())
+    d_en = model.bert_encoder(bert_dur).transpose(-1, -2)
+    s = ref_s[:, 128:]
+    d = model.predictor.text_encoder(d_en, s, input_lengths, text_mask)
+    x = pack_padded_sequence(d, input_lengths, batch_first=True, enforce_sorted=False)
+    model.predictor.lstm.flatten_parameters()
+    x, _ = model.predictor.lstm(x)
+    x, _ = pad_packed_sequence(x, batch_first=True)
+    duration = model.predictor.duration_proj(x)
+    duration = torch.sigmoid(duration).sum(axis=-1) / speeds.unsqueeze(1)
+    t_en = model.text_encoder(padded_ids, input_lengths, text_mask)
+
+    outputs = []
+    for i, length in enumerate(input_lengths.tolist()):
+        pred_dur = torch.round(duration[i, :length]).clamp(min=1).long()
+        indices = torch.repeat_interleave(torch.arange(length, device=device), pred_dur)
+        pred_aln_trg = torch.zeros((length, indices.shape[0]), device=device)
+        pred_aln_trg[indices, torch.arange(indices.shape[0])] = 1
+        pred_aln_trg = pred_aln_trg.unsqueeze(0)
+        en = d[i : i + 1, :length].transpose(-1, -2) @ pred_aln_trg
+        F0_pred, N_pred = model.predictor.F0Ntrain(en, s[i : i + 1])
+        asr = t_en[i : i + 1, :, :length] @ pred_aln_trg
+        audio = model.decoder(asr, F0_pred, N_pred, ref_s[i : i + 1, :128]).squeeze()
+        outputs.append(KModel.Output(audio=audio.cpu(), pred_dur=pred_dur.cpu()))
+    return outputs
+
+
+class BatchScheduler:
+    """Collects forward passes from concurrent requests into batches.
+
+    Callers block in submit() on their inference worker thread. A dedicated
+    scheduler thread waits up to window_ms after the first pending item for
+    more items, up to max_batch_size, then runs them in one batched forward.
+    """
+
+    def __init__(self, model: KModel, window_ms: float = 5.0, max_batch_size: int = 8):
+        """Initialize scheduler.
+
+        Args:
+            model: Loaded KModel
+            window_ms: How long to wait for more items after the first one
+            max_batch_size: Maximum number of items per batch
+        """
+        self._model = model
+        self.window_s = max(window_ms, 0.0) / 1000
+        self.max_batch_size = max(1, max_batch_size)
+        self._queue: "queue.Queue[_BatchItem]" = queue.Queue()
+        self._stopped = threading.Event()
+        # Orders submits against shutdown, so nothing is queued once it stopped
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.items = 0
+        self.cancelled = 0
+        self.batch_sizes: Dict[int, int] = {}
+        self._thread = threading.Thread(
+            target=self._run, name="inference-batcher", daemon=True
+        )
+        self._thread.start()
+
+    def submit(
+        self, phonemes: str, ref_s: torch.FloatTensor, speed: float = 1
+    ) -> KModel.Output:
+        """Queue a forward pass and block until its batch has run.
+
+        Args:
+            phonemes: Phoneme string for one segment
+            ref_s: Reference style vector, shape [1, 256]
+            speed: Speed multiplier
+
+        Returns:
+            KModel.Output with audio and predicted durations
+        """
+        input_ids = [i for i in map(self._model.vocab.get, phonemes) if i is not None]
+        if len(input_ids) + 2 > self._model.context_length:
+            raise ValueError(
+                f"Phoneme sequence too long: {len(input_ids) + 2} > {self._model.context_length}"
+            )
+        item = _BatchItem(
+            input_ids=torch.LongTensor([0, *input_ids, 0]),
+            ref_s=ref_s.reshape(-1),
+            speed=float(speed),
+        )
+        # Drop the item from its batch if the request goes away while queued
+        cancellation = current_cancellation()
+        if cancellation is not None:
+            cancellation.add_callback(item.future.cancel)
+        with self._lock:
+            if self._stopped.is_set():
+                raise RuntimeError("Batch scheduler is shut down")
+            self._queue.put(item)
+        try:
+            return item.future.result()
+        finally:
+            if cancellation is not None:
+                cancellation.remove_callback(item.future.cancel)
+
+    def _collect(self) -> List[_BatchItem]:
+        """Wait for the first item, then gather more until the window closes."""
+        batch = [self._queue.get()]
+        deadline = time.perf_counter() + self.window_s
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                if remaining <= 0:
+                    batch.append(self._queue.get_nowait())
+                else:
+                    batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            batch = []
+            for item in self._collect():
+                if item is None:
+                    continue
+                # Items cancelled while queued are dropped, the rest can no
+                # longer be cancelled
+                if item.future.set_running_or_notify_cancel():
+                    batch.append(item)
+                else:
+                    self.cancelled += 1
+            if not batch:
+                continue
+            try:
+                with STAGE_SECONDS.time(stage="forward"):
+                    outputs = forward_batch(
+                        self._model,
+                        [item.input_ids for item in batch],
+                        torch.stack([item.ref_s for item in batch]),
+                        torch.tensor([item.speed for item in batch]),
+                    )
+                for item, output in zip(batch, outputs):
+                    item.future.set_result(output)
+            except Exception as e:
+                logger.error(f"Batched forward of {len(batch)} items failed: {e}")
+                for item in batch:
+                    item.future.set_exception(e)
+            self.batches += 1
+            self.items += len(batch)
+            self.batch_sizes[len(batch)] = self.batch_sizes.get(len(batch), 0) + 1
+        # Items queued before the shutdown that did not make it into a batch
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None and item.future.set_running_or_notify_cancel():
+                item.future.set_exception(RuntimeError("Batch scheduler is shut down"))
+
+    def stats(self) -> Dict[str, object]:
+        """Get batching statistics."""
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "mean_batch_size": self.items / self.batches if self.batches else 0.0,
+            "cancelled": self.cancelled,
+            "batch_sizes": dict(sorted(self.batch_sizes.items())),
+        }
+
+    def shutdown(self) -> None:
+        """Stop the scheduler thread, failing forwards it has not started."""
+        with self._lock:
+            self._stopped.set()
+            self._queue.put(None)
+
+
+class BatchedModel:
+    """Stands in for KModel inside KPipeline, routing forwards to a scheduler."""
+
+    def __init__(self, model: KModel, scheduler: BatchScheduler):
+        self._model = model
+        self._scheduler = scheduler
+
+    @property
+    def device(self):
+        return self._model.device
+
+    def __call__(
+        self,
+        phonemes: str,
+        ref_s: torch.FloatTensor,
+        speed: float = 1,
+        return_output: bool = False,
+    ):
+        output = self._scheduler.submit(phonemes, ref_s, speed)
+        return output if return_output else output.audio
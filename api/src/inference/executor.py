@@ -0,0 +1,195 @@
+"""Inference executors that keep model forward passes off the event loop."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncGenerator, Callable, Dict, Iterable, List, Optional
+
+from loguru import logger
+
+from ..core.config import settings
+
+# Queue message kinds passed from the worker thread back to the event loop
+_ITEM = "item"
+_ERROR = "error"
+_DONE = "done"
+
+# Cancellation of the iterate() call the current worker thread is producing for
+_local = threading.local()
+
+
+class Cancellation:
+    """Set once the consumer of a worker thread call has gone away.
+
+    Code running on the worker thread can register callbacks to abandon
+    work it is blocked on, such as a queued batch item.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._callbacks: List[Callable[[], Any]] = []
+        self._lock = threading.Lock()
+
+    def is_set(self) -> bool:
+        return self._event.is_set()
+
+    def set(self) -> None:
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def add_callback(self, callback: Callable[[], Any]) -> None:
+        """Call callback on cancellation, right away if already cancelled."""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def remove_callback(self, callback: Callable[[], Any]) -> None:
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+
+def current_cancellation() -> Optional[Cancellation]:
+    """Get the cancellation of the iterate() call running on this thread."""
+    return getattr(_local, "cancellation", None)
+
+
+class InferenceExecutor:
+    """Runs blocking backend calls on worker threads.
+
+    Two modes are supported:
+        thread: a shared pool of ``inference_workers`` threads
+        device_queue: a single worker per device, so forward passes on a
+            device are serialized in submission order
+    """
+
+    def __init__(self, mode: str, workers: int = 1, name: str = "inference"):
+        """Initialize executor.
+
+        Args:
+            mode: Executor mode ('thread' or 'device_queue')
+            workers: Number of worker threads
+            name: Thread name prefix
+        """
+        if mode not in ("thread", "device_queue"):
+            raise ValueError(f"Unsupported inference executor: {mode}")
+        self.mode = mode
+        self.workers = max(1, workers)
+        self.name = name
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix=name
+        )
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking call on a worker thread and await its result."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, lambda: fn(*args, **kwargs))
+
+    async def iterate(
+        self, fn: Callable[..., Iterable[Any]], *args, **kwargs
+    ) -> AsyncGenerator[Any, None]:
+        """Drive a blocking generator on a worker thread.
+
+        Each item produced by ``fn(*args, **kwargs)`` is handed back to the
+        caller through an asyncio queue as soon as it is ready, so the event
+        loop keeps serving other requests while the next item is computed.
+
+        If the consumer stops early or is cancelled, the worker stops after
+        the item it is currently producing, and work that item is blocked on
+        is abandoned through current_cancellation().
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        stop = Cancellation()
+
+        def publish(kind: str, payload: Any = None) -> None:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, (kind, payload))
+            except RuntimeError:
+                # Event loop already closed, nobody is listening anymore
+                pass
+
+        def produce() -> None:
+            _local.cancellation = stop
+            try:
+                if stop.is_set():
+                    return
+                for item in fn(*args, **kwargs):
+                    publish(_ITEM, item)
+                    if stop.is_set():
+                        break
+            except BaseException as e:
+                publish(_ERROR, e)
+            finally:
+                _local.cancellation = None
+                publish(_DONE)
+
+        loop.run_in_executor(self._pool, produce)
+        try:
+            while True:
+                kind, payload = await queue.get()
+                if kind == _DONE:
+                    break
+                if kind == _ERROR:
+                    raise payload
+                yield payload
+        finally:
+            stop.set()
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Shut down worker threads."""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+_executors: Dict[str, InferenceExecutor] = {}
+
+
+def get_executor(device: str = "cpu", replica: int = 0) -> InferenceExecutor:
+    """Get the inference executor for a device.
+
+    Args:
+        device: Device the backend runs on
+        replica: Model replica the executor serves, each replica gets its own
+
+    Returns:
+        Shared executor in 'thread' mode, per-device executor in 'device_queue'
+        mode, a single-worker executor per replica with several replicas
+    """
+    mode = settings.inference_executor
+    key = f"device_queue:{device}" if mode == "device_queue" else "thread"
+    name = f"inference-{device}"
+    if replica:
+        key += f":{replica}"
+        name += f"-{replica}"
+    if key not in _executors:
+        # Each replica runs one forward at a time on its share of the cores
+        single = mode == "device_queue" or settings.model_replicas > 1
+        workers = 1 if single else settings.inference_workers
+        _executors[key] = InferenceExecutor(mode, workers=workers, name=name)
+        logger.info(
+            f"Created {mode} inference executor for {name} with {workers} worker(s)"
+        )
+    return _executors[key]
+
+
+def get_encode_executor() -> InferenceExecutor:
+    """Get the executor that runs audio encoding next to inference."""
+    if "encode" not in _executors:
+        _executors["encode"] = InferenceExecutor(
+            "thread", workers=settings.encode_workers, name="encode"
+        )
+    return _executors["encode"]
+
+
+def shutdown_executors() -> None:
+    """Shut down all inference executors."""
+    for executor in _executors.values():
+        executor.shutdown()
+    _executors.clear()
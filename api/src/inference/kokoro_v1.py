@@ -1,6 +1,8 @@
 """Clean Kokoro implementation with controlled resource management."""
 
 import os
+import threading
+import time
 from typing import AsyncGenerator, Dict, Optional, Tuple, Union
 
 import numpy as np
@@ -10,21 +12,36 @@ from loguru import logger
 
 from ..core import paths
 from ..core.config import settings
+from ..core.metrics import STAGE_SECONDS
 from ..core.model_config import model_config
+from ..core.phoneme_cache import get_phoneme_cache
 from ..structures.schemas import WordTimestamp
 from .base import AudioChunk, BaseModelBackend
+from .batching import BatchedModel, BatchScheduler
+from .executor import get_executor
+from .quantization import load_quantized_model
+from .voice_manager import get_manager as get_voice_manager
 
 
 class KokoroV1(BaseModelBackend):
     """Kokoro backend with controlled resource management."""
 
-    def __init__(self):
-        """Initialize backend with environment-based configuration."""
+    def __init__(self, replica: int = 0):
+        """Initialize backend with environment-based configuration.
+
+        Args:
+            replica: Index of this model replica, picks its inference executor
+        """
         super().__init__()
         # Strictly respect settings.use_gpu
         self._device = settings.get_device()
         self._model: Optional[KModel] = None
+        self._batcher: Optional[BatchScheduler] = None
         self._pipelines: Dict[str, KPipeline] = {}  # Store pipelines by lang_code
+        # Held while a language's pipeline is built so it is only built once
+        self._pipeline_locks: Dict[str, threading.Lock] = {}
+        # Forward passes run here so they never block the event loop
+        self._executor = get_executor(self._device, replica)
 
     async def load_model(self, path: str) -> None:
         """Load pre-baked model.
@@ -47,8 +64,17 @@ class KokoroV1(BaseModelBackend):
             logger.info(f"Config path: {config_path}")
             logger.info(f"Model path: {model_path}")
 
-            # Load model and let KModel handle device mapping
-            self._model = KModel(config=config_path, model=model_path).eval()
+            if settings.model_quantization == "int8" and self._device == "cpu":
+                logger.info("Using dynamic int8 quantization")
+                self._model = load_quantized_model(config_path, model_path)
+            else:
+                if settings.model_quantization != "none":
+                    logger.warning(
+                        f"Ignoring model_quantization={settings.model_quantization}, "
+                        "only int8 on CPU is supported"
+                    )
+                # Load model and let KModel handle device mapping
+                self._model = KModel(config=config_path, model=model_path).eval()
             # For MPS, manually move ISTFT layers to CPU while keeping rest on MPS
             if self._device == "mps":
                 logger.info(
@@ -60,11 +86,83 @@ class KokoroV1(BaseModelBackend):
             else:
                 self._model = self._model.cpu()
 
+            self._time_forward_passes()
+            if settings.batching_enabled:
+                self._start_batcher()
+
         except FileNotFoundError as e:
             raise e
         except Exception as e:
             raise RuntimeError(f"Failed to load Kokoro model: {e}")
 
+    def share_model(self, other: "KokoroV1") -> None:
+        """Run forward passes on the model another replica loaded.
+
+        Weights are only read during inference, so replicas use the same
+        tensors instead of each holding a copy. Pipelines are shared too,
+        as they already are between the workers of one executor.
+
+        Args:
+            other: Replica with a loaded model
+        """
+        self._model = other._model
+        self._pipelines = other._pipelines
+        self._pipeline_locks = other._pipeline_locks
+        if settings.batching_enabled:
+            self._start_batcher()
+
+    def _time_forward_passes(self) -> None:
+        """Record each model forward pass in the stage latency histogram."""
+        started = threading.local()
+
+        def before_forward(module, args):
+            started.value = time.perf_counter()
+
+        def after_forward(module, args, output):
+            STAGE_SECONDS.observe(time.perf_counter() - started.value, stage="forward")
+
+        self._model.register_forward_pre_hook(before_forward)
+        self._model.register_forward_hook(after_forward)
+
+    def _start_batcher(self) -> None:
+        """Start the micro-batching scheduler for concurrent requests."""
+        if self._batcher is not None:
+            self._batcher.shutdown()
+            self._batcher = None
+        if (
+            settings.inference_executor != "thread"
+            or settings.inference_workers < 2
+            or settings.model_replicas > 1
+        ):
+            # One forward at a time would only wait out the window, never batch
+            logger.warning(
+                "Micro-batching disabled, it needs several inference workers to form "
+                "batches: set INFERENCE_EXECUTOR=thread, INFERENCE_WORKERS >= 2 and "
+                "MODEL_REPLICAS=1"
+            )
+            return
+        logger.info(
+            f"Micro-batching enabled (window {settings.batching_window_ms}ms, "
+            f"max batch {settings.batching_max_batch_size})"
+        )
+        self._batcher = BatchScheduler(
+            self._model,
+            window_ms=settings.batching_window_ms,
+            max_batch_size=settings.batching_max_batch_size,
+        )
+
+    @property
+    def _forward_model(self) -> Union[KModel, BatchedModel]:
+        """Model handed to the pipeline for forward passes."""
+        if self._batcher is not None:
+            return BatchedModel(self._model, self._batcher)
+        return self._model
+
+    @property
+    def _pipeline_model(self) -> Union[KModel, bool]:
+        """Model the pipeline is created with, forwards pass their own."""
+        return self._model
+
     def _get_pipeline(self, lang_code: str) -> KPipeline:
         """Get or create pipeline for language code.
 
@@ -78,12 +176,51 @@ class KokoroV1(BaseModelBackend):
             raise RuntimeError("Model not loaded")
 
         if lang_code not in self._pipelines:
-            logger.info(f"Creating new pipeline for language code: {lang_code}")
-            self._pipelines[lang_code] = KPipeline(
-                lang_code=lang_code, model=self._model, device=self._device
-            )
+            # Other languages can be built at the same time
+            with self._pipeline_locks.setdefault(lang_code, threading.Lock()):
+                if lang_code not in self._pipelines:
+                    logger.info(f"Creating new pipeline for language code: {lang_code}")
+                    pipeline = KPipeline(
+                        lang_code=lang_code,
+                        model=self._pipeline_model,
+                        device=self._device,
+                    )
+                    pipeline.g2p = get_phoneme_cache().wrap_g2p(pipeline.g2p, lang_code)
+                    self._pipelines[lang_code] = pipeline
         return self._pipelines[lang_code]
 
+    async def _resolve_voice(
+        self, voice: Union[str, Tuple[str, Union[torch.Tensor, str]]]
+    ) -> Tuple[str, torch.Tensor]:
+        """Resolve voice input to a name and a tensor the pipeline can use.
+
+        Voice files are served from the voice manager cache, so no temp files
+        are written and repeat requests skip the disk entirely.
+
+        Args:
+            voice: Either a voice path string or a tuple of (voice_name, voice_tensor/path)
+
+        Returns:
+            Tuple of (voice name, voice tensor)
+        """
+        if isinstance(voice, tuple):
+            voice_name, voice_data = voice
+        else:
+            voice_data = voice
+            voice_name = os.path.splitext(os.path.basename(voice))[0]
+
+        if isinstance(voice_data, str):
+            voice_manager = await get_voice_manager()
+            # KPipeline only accepts CPU float tensors and moves them to the
+            # model device itself
+            voice_tensor = await voice_manager.load_voice_from_path(
+                voice_data, device="cpu"
+            )
+        else:
+            voice_tensor = voice_data.cpu()
+
+        return voice_name, voice_tensor.float()
+
     async def generate_from_tokens(
         self,
         tokens: str,
@@ -114,38 +251,8 @@ class KokoroV1(BaseModelBackend):
                 if self._check_memory():
                     self._clear_memory()
 
-            # Handle voice input
-            voice_path: str
-            voice_name: str
-            if isinstance(voice, tuple):
-                voice_name, voice_data = voice
-                if isinstance(voice_data, str):
-                    voice_path = voice_data
-                else:
-                    # Save tensor to temporary file
-                    import tempfile
-
-                    temp_dir = tempfile.gettempdir()
-                    voice_path = os.path.join(temp_dir, f"{voice_name}.pt")
-                    # Save tensor with CPU mapping for portability
-                    torch.save(voice_data.cpu(), voice_path)
-            else:
-                voice_path = voice
-                voice_name = os.path.splitext(os.path.basename(voice_path))[0]
-
-            # Load voice tensor with proper device mapping
-            voice_tensor = await paths.load_voice_tensor(
-                voice_path, device=self._device
-            )
-            # Save back to a temporary file with proper device mapping
-            import tempfile
-
-            temp_dir = tempfile.gettempdir()
-            temp_path = os.path.join(
-                temp_dir, f"temp_voice_{os.path.basename(voice_path)}"
-            )
-            await paths.save_voice_tensor(voice_tensor, temp_path)
-            voice_path = temp_path
+            # Resolve voice to an in-memory tensor
+            voice_name, voice_tensor = await self._resolve_voice(voice)
 
             # Use provided lang_code, settings voice code override, or first letter of voice name
             if lang_code:  # api is given priority
@@ -155,13 +262,19 @@ class KokoroV1(BaseModelBackend):
             else:  # voice name is default/fallback
                 pipeline_lang_code = voice_name[0].lower()
 
-            pipeline = self._get_pipeline(pipeline_lang_code)
+            pipeline = await self._executor.run(
+                self._get_pipeline, pipeline_lang_code
+            )
 
             logger.debug(
                 f"Generating audio from tokens with lang_code '{pipeline_lang_code}': '{tokens[:100]}{'...' if len(tokens) > 100 else ''}'"
             )
-            for result in pipeline.generate_from_tokens(
-                tokens=tokens, voice=voice_path, speed=speed, model=self._model
+            async for result in self._executor.iterate(
+                pipeline.generate_from_tokens,
+                tokens=tokens,
+                voice=voice_tensor,
+                speed=speed,
+                model=self._forward_model,
             ):
                 if result.audio is not None:
                     logger.debug(f"Got audio chunk with shape: {result.audio.shape}")
@@ -213,38 +326,8 @@ class KokoroV1(BaseModelBackend):
                 if self._check_memory():
                     self._clear_memory()
 
-            # Handle voice input
-            voice_path: str
-            voice_name: str
-            if isinstance(voice, tuple):
-                voice_name, voice_data = voice
-                if isinstance(voice_data, str):
-                    voice_path = voice_data
-                else:
-                    # Save tensor to temporary file
-                    import tempfile
-
-                    temp_dir = tempfile.gettempdir()
-                    voice_path = os.path.join(temp_dir, f"{voice_name}.pt")
-                    # Save tensor with CPU mapping for portability
-                    torch.save(voice_data.cpu(), voice_path)
-            else:
-                voice_path = voice
-                voice_name = os.path.splitext(os.path.basename(voice_path))[0]
-
-            # Load voice tensor with proper device mapping
-            voice_tensor = await paths.load_voice_tensor(
-                voice_path, device=self._device
-            )
-            # Save back to a temporary file with proper device mapping
-            import tempfile
-
-            temp_dir = tempfile.gettempdir()
-            temp_path = os.path.join(
-                temp_dir, f"temp_voice_{os.path.basename(voice_path)}"
-            )
-            await paths.save_voice_tensor(voice_tensor, temp_path)
-            voice_path = temp_path
+            # Resolve voice to an in-memory tensor
+            voice_name, voice_tensor = await self._resolve_voice(voice)
 
             # Use provided lang_code, settings voice code override, or first letter of voice name
             pipeline_lang_code = (
@@ -256,13 +339,21 @@ class KokoroV1(BaseModelBackend):
                     else voice_name[0].lower()
                 )
             )
-            pipeline = self._get_pipeline(pipeline_lang_code)
+            pipeline = await self._executor.run(
+                self._get_pipeline, pipeline_lang_code
+            )
 
             logger.debug(
                 f"Generating audio for text with lang_code '{pipeline_lang_code}': '{text[:100]}{'...' if len(text) > 100 else ''}'"
             )
-            for result in pipeline(
-                text, voice=voice_path, speed=speed, model=self._model
+            # G2P and the forward pass run on the inference executor, each
+            # segment is handed back as soon as it is ready
+            async for result in self._executor.iterate(
+                pipeline,
+                text,
+                voice=voice_tensor,
+                speed=speed,
+                model=self._forward_model,
             ):
                 if result.audio is not None:
                     logger.debug(f"Got audio chunk with shape: {result.audio.shape}")
@@ -349,6 +440,9 @@ class KokoroV1(BaseModelBackend):
 
     def unload(self) -> None:
         """Unload model and free resources."""
+        if self._batcher is not None:
+            self._batcher.shutdown()
+            self._batcher = None
         if self._model is not None:
             del self._model
             self._model = None
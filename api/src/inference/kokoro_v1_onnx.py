@@ -0,0 +1,302 @@
+"""Kokoro V1 on ONNX Runtime's CPU execution provider."""
+
+import io
+import json
+import os
+import queue
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Union
+
+import numpy as np
+import torch
+from kokoro import KModel
+from kokoro.model import KModelForONNX
+from loguru import logger
+
+from ..core import paths
+from ..core.config import settings
+from ..core.metrics import STAGE_SECONDS
+from .executor import get_executor
+from .kokoro_v1 import KokoroV1
+
+try:
+    import onnxruntime as ort
+
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
+# Opset of the exported graph, the custom STFT of disable_complex needs 17
+ONNX_OPSET = 17
+INPUT_NAMES = ["input_ids", "ref_s", "speed"]
+OUTPUT_NAMES = ["waveform", "duration"]
+
+
+def get_onnx_path(model_path: str) -> str:
+    """Get where the ONNX export of a model is cached, next to its config.json."""
+    return os.path.splitext(model_path)[0] + ".onnx"
+
+
+def export_onnx(config: Union[str, Dict], model_path: str) -> bytes:
+    """Export KModel weights to an ONNX graph with dynamic input length.
+
+    The model is built with disable_complex, since ONNX has no complex
+    tensors, and exported on CPU.
+
+    Args:
+        config: Path to config.json or the loaded config
+        model_path: Path to the PyTorch weights
+
+    Returns:
+        Serialized ONNX model
+    """
+    model = KModel(config=config, model=model_path, disable_complex=True).eval()
+    input_ids = torch.LongTensor([[0, *range(1, 49), 0]])
+    ref_s = torch.zeros(1, 256)
+    speed = torch.ones(1)
+    buffer = io.BytesIO()
+    torch.onnx.export(
+        KModelForONNX(model).eval(),
+        (input_ids, ref_s, speed),
+        buffer,
+        input_names=INPUT_NAMES,
+        output_names=OUTPUT_NAMES,
+        opset_version=ONNX_OPSET,
+        dynamic_axes={
+            "input_ids": {1: "input_ids_len"},
+            "waveform": {0: "num_samples"},
+            "duration": {0: "input_ids_len"},
+        },
+        do_constant_folding=True,
+    )
+    return buffer.getvalue()
+
+
+class _SessionInfo:
+    """An inference session and its usage."""
+
+    def __init__(self, session: "ort.InferenceSession"):
+        self.session = session
+        self.runs = 0
+        self.last_used = time.time()
+
+
+class OnnxSessionPool:
+    """Fixed set of ONNX Runtime sessions shared by the inference workers.
+
+    A session runs one forward at a time on its own intra-op thread pool,
+    so concurrent forwards beyond the pool size wait for a free session
+    instead of oversubscribing the cores.
+    """
+
+    def __init__(
+        self,
+        model: Union[str, bytes],
+        size: int = 1,
+        intra_op_threads: int = 0,
+        inter_op_threads: int = 0,
+    ):
+        """Initialize pool.
+
+        Args:
+            model: Path to the ONNX model or the serialized model
+            size: Number of sessions
+            intra_op_threads: Threads per forward pass, 0 lets onnxruntime decide
+            inter_op_threads: Threads for independent graph nodes, 0 lets onnxruntime decide
+        """
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = max(0, intra_op_threads)
+        options.inter_op_num_threads = max(0, inter_op_threads)
+        if inter_op_threads > 1:
+            options.execution_mode = ort.ExecutionMode.ORT_PARALLEL
+
+        self.model = model if isinstance(model, str) else "<in memory>"
+        self._max_size = max(1, size)
+        self._sessions: List[_SessionInfo] = [
+            _SessionInfo(
+                ort.InferenceSession(
+                    model, sess_options=options, providers=["CPUExecutionProvider"]
+                )
+            )
+            for _ in range(self._max_size)
+        ]
+        self._available: "queue.Queue[_SessionInfo]" = queue.Queue()
+        for info in self._sessions:
+            self._available.put(info)
+
+    @contextmanager
+    def session(self) -> Iterator["ort.InferenceSession"]:
+        """Borrow a session, waiting for one to be free."""
+        info = self._available.get()
+        try:
+            yield info.session
+        finally:
+            info.runs += 1
+            info.last_used = time.time()
+            self._available.put(info)
+
+    def stats(self) -> Dict[str, object]:
+        """Get session usage."""
+        now = time.time()
+        return {
+            "model": self.model,
+            "max_sessions": self._max_size,
+            "available_sessions": self._available.qsize(),
+            "sessions": [
+                {"runs": info.runs, "idle_seconds": round(now - info.last_used, 3)}
+                for info in self._sessions
+            ],
+        }
+
+
+class OnnxModel:
+    """Stands in for KModel inside KPipeline, running forwards on ONNX Runtime."""
+
+    device = "cpu"
+
+    def __init__(self, vocab: Dict[str, int], context_length: int, pool: OnnxSessionPool):
+        self.vocab = vocab
+        self.context_length = context_length
+        self.pool = pool
+
+    def __call__(
+        self,
+        phonemes: str,
+        ref_s: torch.FloatTensor,
+        speed: float = 1,
+        return_output: bool = False,
+    ) -> Union[KModel.Output, torch.FloatTensor]:
+        input_ids = [i for i in map(self.vocab.get, phonemes) if i is not None]
+        if len(input_ids) + 2 > self.context_length:
+            raise ValueError(
+                f"Phoneme sequence too long: {len(input_ids) + 2} > {self.context_length}"
+            )
+        inputs = {
+            "input_ids": np.array([[0, *input_ids, 0]], dtype=np.int64),
+            "ref_s": ref_s.reshape(1, -1).cpu().numpy().astype(np.float32),
+            "speed": np.array([speed], dtype=np.float32),
+        }
+        with STAGE_SECONDS.time(stage="forward"), self.pool.session() as session:
+            waveform, duration = session.run(OUTPUT_NAMES, inputs)
+        audio = torch.from_numpy(waveform)
+        if not return_output:
+            return audio
+        return KModel.Output(audio=audio, pred_dur=torch.from_numpy(duration).long())
+
+
+class KokoroV1Onnx(KokoroV1):
+    """Kokoro backend running the model on ONNX Runtime on CPU.
+
+    G2P, chunking and timestamps stay with KPipeline, only the forward
+    pass is swapped for the exported graph. The export is written once next
+    to the model's config.json and reused while it is newer than the weights.
+    """
+
+    def __init__(self, replica: int = 0):
+        """Initialize backend on CPU.
+
+        Args:
+            replica: Index of this model replica, picks its inference executor
+        """
+        super().__init__(replica)
+        self._device = "cpu"
+        self._executor = get_executor(self._device, replica)
+        self._session_pool: Optional[OnnxSessionPool] = None
+
+    async def load_model(self, path: str) -> None:
+        """Load the ONNX export of a model, exporting it first if needed.
+
+        Args:
+            path: Path to the PyTorch model file
+
+        Raises:
+            RuntimeError: If onnxruntime is missing or loading fails
+        """
+        if not ONNX_AVAILABLE:
+            raise RuntimeError(
+                "onnxruntime is not installed, install the onnx extra or set INFERENCE_BACKEND=pytorch"
+            )
+        try:
+            model_path = await paths.get_model_path(path)
+            config_path = os.path.join(os.path.dirname(model_path), "config.json")
+            if not os.path.exists(config_path):
+                raise RuntimeError(f"Config file not found: {config_path}")
+            with open(config_path, "r", encoding="utf-8") as f:
+                config = json.load(f)
+
+            onnx_model = await self._executor.run(
+                self._load_or_export, config_path, model_path
+            )
+            self._session_pool = OnnxSessionPool(
+                onnx_model,
+                size=settings.onnx_sessions,
+                intra_op_threads=settings.onnx_intra_op_threads,
+                inter_op_threads=settings.onnx_inter_op_threads,
+            )
+            self._model = OnnxModel(
+                config["vocab"],
+                config["plbert"]["max_position_embeddings"],
+                self._session_pool,
+            )
+            logger.info(
+                f"Loaded ONNX model with {settings.onnx_sessions} session(s) on CPU"
+            )
+            if settings.batching_enabled:
+                logger.warning("Micro-batching is not supported with the ONNX backend")
+
+        except FileNotFoundError as e:
+            raise e
+        except Exception as e:
+            raise RuntimeError(f"Failed to load ONNX model: {e}")
+
+    @staticmethod
+    def _load_or_export(config_path: str, model_path: str) -> Union[str, bytes]:
+        """Get the cached export, exporting and caching it if missing or stale.
+
+        Returns:
+            Path to the cached export, or the export itself if it cannot be cached
+        """
+        onnx_path = get_onnx_path(model_path)
+        if os.path.exists(onnx_path) and os.path.getmtime(onnx_path) >= os.path.getmtime(
+            model_path
+        ):
+            logger.info(f"Using cached ONNX export: {onnx_path}")
+            return onnx_path
+
+        logger.info(f"Exporting {model_path} to ONNX, this only happens once")
+        start = time.perf_counter()
+        onnx_model = export_onnx(config_path, model_path)
+        logger.info(f"Exported ONNX model in {time.perf_counter() - start:.1f}s")
+        tmp_path = f"{onnx_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(onnx_model)
+            os.replace(tmp_path, onnx_path)
+        except OSError as e:
+            logger.warning(f"Could not cache ONNX export at {onnx_path}: {e}")
+            return onnx_model
+        return onnx_path
+
+    def share_model(self, other: "KokoroV1Onnx") -> None:
+        """Run forward passes on the sessions another replica loaded."""
+        self._model = other._model
+        self._pipelines = other._pipelines
+        self._pipeline_locks = other._pipeline_locks
+        self._session_pool = other._session_pool
+
+    @property
+    def _pipeline_model(self) -> bool:
+        """No model, KPipeline would load a PyTorch one for anything but a KModel."""
+        return False
+
+    @property
+    def session_pool(self) -> Optional[OnnxSessionPool]:
+        """Sessions the forward passes run on."""
+        return self._session_pool
+
+    def unload(self) -> None:
+        """Unload sessions and pipelines."""
+        self._session_pool = None
+        super().unload()
@@ -1,14 +1,34 @@
 """Kokoro V1 model management."""
 
-from typing import Optional
+import asyncio
+import os
+import time
+from typing import Dict, List, Optional, Tuple
 
+import torch
 from loguru import logger
 
 from ..core import paths
 from ..core.config import settings
+from ..core.metrics import registry
 from ..core.model_config import ModelConfig, model_config
-from .base import BaseModelBackend
+from .base import AudioChunk, BaseModelBackend
 from .kokoro_v1 import KokoroV1
+from .kokoro_v1_onnx import KokoroV1Onnx, OnnxSessionPool
+from .replicas import ReplicaDispatcher
+
+# Short text in each KPipeline language for warming up its G2P
+WARMUP_TEXTS = {
+    "a": "Warmup text for initialization.",
+    "b": "Warmup text for initialization.",
+    "e": "Texto de calentamiento.",
+    "f": "Texte de préchauffage.",
+    "h": "प्रारंभिक पाठ।",
+    "i": "Testo di riscaldamento.",
+    "j": "ウォームアップのテキストです。",
+    "p": "Texto de aquecimento.",
+    "z": "预热文本。",
+}
 
 
 class ModelManager:
@@ -26,21 +46,53 @@ class ModelManager:
         self._config = config or model_config
         self._backend: Optional[KokoroV1] = None  # Explicitly type as KokoroV1
         self._device: Optional[str] = None
+        # Every replica including the primary _backend, dispatched least-loaded
+        self._replicas: Optional[ReplicaDispatcher] = None
+        # Set once the startup language pipelines are warm
+        self._ready = False
 
     def _determine_device(self) -> str:
         """Determine device based on settings."""
+        if settings.inference_backend == "onnx":
+            return "cpu"
         return "cuda" if settings.use_gpu else "cpu"
 
     async def initialize(self) -> None:
         """Initialize Kokoro V1 backend."""
         try:
+            if settings.inference_backend not in ("pytorch", "onnx"):
+                raise ValueError(
+                    f"Unknown inference backend: {settings.inference_backend}"
+                )
             self._device = self._determine_device()
-            logger.info(f"Initializing Kokoro V1 on {self._device}")
-            self._backend = KokoroV1()
+            logger.info(
+                f"Initializing Kokoro V1 ({settings.inference_backend}) on {self._device}"
+            )
+            backend_class = (
+                KokoroV1Onnx if settings.inference_backend == "onnx" else KokoroV1
+            )
+            replicas = max(1, settings.model_replicas)
+            if replicas > 1 and self._device == "cpu":
+                self._partition_threads(replicas)
+            backends = [backend_class(replica) for replica in range(replicas)]
+            self._backend = backends[0]
+            self._replicas = ReplicaDispatcher(backends)
 
         except Exception as e:
             raise RuntimeError(f"Failed to initialize Kokoro V1: {e}")
 
+    @staticmethod
+    def _partition_threads(replicas: int) -> None:
+        """Split the CPU cores between replicas running at the same time.
+
+        The torch thread count applies to each thread running a forward
+        pass, so with one forward per replica at a time the replicas
+        together use about all cores instead of each trying to use them all.
+        """
+        threads = settings.replica_threads or max(1, (os.cpu_count() or 1) // replicas)
+        torch.set_num_threads(threads)
+        logger.info(f"Running {replicas} model replicas with {threads} torch threads each")
+
     async def initialize_with_warmup(self, voice_manager) -> tuple[str, str, int]:
         """Initialize and warm up model.
 
@@ -53,17 +105,19 @@ class ModelManager:
         Raises:
             RuntimeError: If initialization fails
         """
-        import time
-
         start = time.perf_counter()
 
         try:
-            # Initialize backend
-            await self.initialize()
+            if self._backend is not None and self._backend.is_loaded:
+                # Loaded before the process was forked, see supervisor
+                logger.info("Using preloaded model")
+            else:
+                # Initialize backend
+                await self.initialize()
 
-            # Load model
-            model_path = self._config.pytorch_kokoro_v1_file
-            await self.load_model(model_path)
+                # Load model
+                model_path = self._config.pytorch_kokoro_v1_file
+                await self.load_model(model_path)
 
             # Use paths module to get voice path
             try:
@@ -83,7 +137,7 @@ class ModelManager:
             ms = int((time.perf_counter() - start) * 1000)
             logger.info(f"Warmup completed in {ms}ms")
 
-            return self._device, "kokoro_v1", len(voices)
+            return self._device, self.current_backend, len(voices)
         except FileNotFoundError as e:
             logger.error("""
 Model files not found! You need to download the Kokoro V1 model:
@@ -98,6 +152,65 @@ Model files not found! You need to download the Kokoro V1 model:
         except Exception as e:
             raise RuntimeError(f"Warmup failed: {e}")
 
+    async def warmup_languages(self, lang_codes: List[str]) -> Dict[str, int]:
+        """Build and warm the pipelines of several languages in parallel.
+
+        The first request in a language otherwise waits for its G2P to load.
+        A language that fails to warm up is logged and left to be built on
+        first use. The manager is ready once this returns.
+
+        Args:
+            lang_codes: Language codes to prepare, ones already built are skipped
+
+        Returns:
+            Warmup time in milliseconds by language code
+        """
+        backend = self.get_backend()
+        pending = [
+            lang_code
+            for lang_code in dict.fromkeys(lang_codes)
+            if lang_code not in backend._pipelines
+        ]
+        try:
+            voice_name = settings.default_voice
+            voice_path = await paths.get_voice_path(voice_name)
+            timings = await asyncio.gather(
+                *(
+                    self._warmup_language(lang_code, (voice_name, voice_path))
+                    for lang_code in pending
+                )
+            )
+            return {
+                lang_code: ms
+                for lang_code, ms in zip(pending, timings)
+                if ms is not None
+            }
+        finally:
+            self._ready = True
+
+    async def _warmup_language(
+        self, lang_code: str, voice: Tuple[str, str]
+    ) -> Optional[int]:
+        start = time.perf_counter()
+        try:
+            # Pipelines are built off the inference executor, which runs
+            # one forward at a time, so several languages load at once
+            await asyncio.to_thread(self._backend._get_pipeline, lang_code)
+            text = WARMUP_TEXTS.get(lang_code, WARMUP_TEXTS["a"])
+            async for _ in self.generate(text, voice, lang_code=lang_code):
+                pass
+        except Exception as e:
+            logger.warning(f"Failed to warm up language '{lang_code}': {e}")
+            return None
+        ms = int((time.perf_counter() - start) * 1000)
+        logger.info(f"Warmed up language '{lang_code}' in {ms}ms")
+        return ms
+
+    @property
+    def ready(self) -> bool:
+        """Whether the model is loaded and the startup languages are warm."""
+        return self._ready
+
     def get_backend(self) -> BaseModelBackend:
         """Get initialized backend.
 
@@ -125,6 +238,8 @@ Model files not found! You need to download the Kokoro V1 model:
 
         try:
             await self._backend.load_model(path)
+            for replica in self._replicas.replicas[1:]:
+                replica.backend.share_model(self._backend)
         except FileNotFoundError as e:
             raise e
         except Exception as e:
@@ -140,24 +255,60 @@ Model files not found! You need to download the Kokoro V1 model:
             raise RuntimeError("Backend not initialized")
 
         try:
-            async for chunk in self._backend.generate(*args, **kwargs):
-                if settings.default_volume_multiplier != 1.0:
-                    chunk.audio *= settings.default_volume_multiplier
-                yield chunk
+            async with self._replicas.acquire() as replica:
+                async for chunk in replica.backend.generate(*args, **kwargs):
+                    if settings.default_volume_multiplier != 1.0:
+                        chunk.audio *= settings.default_volume_multiplier
+                    yield chunk
+        except Exception as e:
+            raise RuntimeError(f"Generation failed: {e}")
+
+    async def generate_from_tokens(self, *args, **kwargs):
+        """Generate audio from phonemes using initialized backend.
+
+        Raises:
+            RuntimeError: If generation fails
+        """
+        if not self._backend:
+            raise RuntimeError("Backend not initialized")
+
+        try:
+            async with self._replicas.acquire() as replica:
+                async for audio in replica.backend.generate_from_tokens(*args, **kwargs):
+                    chunk = AudioChunk(audio, word_timestamps=None)
+                    if settings.default_volume_multiplier != 1.0:
+                        chunk.audio *= settings.default_volume_multiplier
+                    yield chunk
         except Exception as e:
             raise RuntimeError(f"Generation failed: {e}")
 
     def unload_all(self) -> None:
         """Unload model and free resources."""
-        if self._backend:
-            self._backend.unload()
-            self._backend = None
+        if self._replicas:
+            for replica in self._replicas.replicas:
+                replica.backend.unload()
+            self._replicas = None
+        self._backend = None
+        self._ready = False
+
+    def replica_stats(self) -> List[Dict[str, object]]:
+        """Get load of every model replica."""
+        return self._replicas.stats() if self._replicas else []
 
     @property
     def current_backend(self) -> str:
         """Get current backend type."""
+        if isinstance(self._backend, KokoroV1Onnx):
+            return "kokoro_v1_onnx"
         return "kokoro_v1"
 
+    @property
+    def session_pools(self) -> Dict[str, OnnxSessionPool]:
+        """Get ONNX Runtime session pools by device, empty for PyTorch."""
+        if isinstance(self._backend, KokoroV1Onnx) and self._backend.session_pool:
+            return {"cpu": self._backend.session_pool}
+        return {}
+
 
 async def get_manager(config: Optional[ModelConfig] = None) -> ModelManager:
     """Get model manager instance.
@@ -171,3 +322,18 @@ async def get_manager(config: Optional[ModelConfig] = None) -> ModelManager:
     if ModelManager._instance is None:
         ModelManager._instance = ModelManager(config)
     return ModelManager._instance
+
+
+def _collect_active() -> Dict[Tuple[str], float]:
+    manager = ModelManager._instance
+    if manager is None or manager._replicas is None:
+        return {}
+    return manager._replicas.active_counts()
+
+
+registry.gauge(
+    "kokoro_replica_active_generations",
+    "Generations running on each model replica",
+    ["replica"],
+    collect=_collect_active,
+)
@@ -0,0 +1,97 @@
+"""Dynamic int8 quantization of Kokoro for CPU inference."""
+
+import os
+import tempfile
+import time
+
+import torch
+import torch.ao.nn.quantized.dynamic as nnqd
+from kokoro import KModel
+from loguru import logger
+
+# Layers whose weights are stored in int8, activations are quantized on the fly
+QUANTIZED_LAYERS = {torch.nn.Linear, torch.nn.LSTM}
+
+
+def get_quantized_path(model_path: str) -> str:
+    """Get where the quantized weights of a model are cached, next to its config.json."""
+    return os.path.splitext(model_path)[0] + ".int8.pth"
+
+
+def quantize_dynamic_int8(model: KModel) -> KModel:
+    """Quantize the Linear and LSTM layers of a model to int8 in place.
+
+    In place because weight-normed convolutions cannot be deep-copied.
+    """
+    torch.ao.quantization.quantize_dynamic(
+        model, QUANTIZED_LAYERS, dtype=torch.qint8, inplace=True
+    )
+    for module in model.modules():
+        if isinstance(module, nnqd.LSTM):
+            # Kokoro flattens its LSTM weights before every call, packed
+            # int8 weights have nothing to flatten
+            module.flatten_parameters = _no_flatten
+    return model
+
+
+def _no_flatten() -> None:
+    pass
+
+
+def _load_cached(config_path: str, quantized_path: str) -> KModel:
+    # Packed int8 weights are TorchScript objects, allow just those
+    with torch.serialization.safe_globals([torch.ScriptObject]):
+        cached = torch.load(quantized_path, map_location="cpu", weights_only=True)
+    if cached.get("torch_version") != torch.__version__:
+        raise ValueError(
+            f"cached for torch {cached.get('torch_version')}, running {torch.__version__}"
+        )
+    # Build the quantized layout from an untrained model, then fill in the weights
+    with tempfile.TemporaryDirectory() as tmp:
+        empty_path = os.path.join(tmp, "empty.pth")
+        torch.save({}, empty_path)
+        model = KModel(config=config_path, model=empty_path).eval()
+    quantize_dynamic_int8(model)
+    model.load_state_dict(cached["state_dict"])
+    return model
+
+
+def load_quantized_model(config_path: str, model_path: str) -> KModel:
+    """Load a model with int8 Linear and LSTM weights on CPU.
+
+    The quantized weights are cached once next to the model and reused while
+    they are newer than the model and were written by the same torch
+    version, whose packed weight format they depend on.
+
+    Args:
+        config_path: Path to config.json
+        model_path: Path to the fp32 weights
+
+    Returns:
+        Quantized model in eval mode
+    """
+    quantized_path = get_quantized_path(model_path)
+    if os.path.exists(quantized_path) and os.path.getmtime(
+        quantized_path
+    ) >= os.path.getmtime(model_path):
+        try:
+            model = _load_cached(config_path, quantized_path)
+            logger.info(f"Using cached int8 model: {quantized_path}")
+            return model
+        except Exception as e:
+            logger.warning(f"Ignoring cached int8 model {quantized_path}: {e}")
+
+    start = time.perf_counter()
+    model = quantize_dynamic_int8(KModel(config=config_path, model=model_path).eval())
+    logger.info(f"Quantized model to int8 in {time.perf_counter() - start:.1f}s")
+
+    tmp_path = f"{quantized_path}.{os.getpid()}.tmp"
+    try:
+        torch.save(
+            {"torch_version": str(torch.__version__), "state_dict": model.state_dict()},
+            tmp_path,
+        )
+        os.replace(tmp_path, quantized_path)
+    except OSError as e:
+        logger.warning(f"Could not cache int8 model at {quantized_path}: {e}")
+    return model
@@ -0,0 +1,105 @@
+"""Least-loaded dispatch of generations across model replicas."""
+
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+from ..core.metrics import registry
+from .base import BaseModelBackend
+
+REPLICA_REQUESTS = registry.counter(
+    "kokoro_replica_requests_total",
+    "Generations dispatched to each model replica",
+    ["replica"],
+)
+REPLICA_BUSY_SECONDS = registry.counter(
+    "kokoro_replica_busy_seconds_total",
+    "Time each model replica spent with at least one generation running",
+    ["replica"],
+)
+
+
+class Replica:
+    """A model replica and its load."""
+
+    def __init__(self, index: int, backend: BaseModelBackend):
+        self.index = index
+        self.backend = backend
+        self.active = 0
+        self.requests = 0
+        self.busy_seconds = 0.0
+        self._busy_since: Optional[float] = None
+
+    def _start(self) -> None:
+        self.active += 1
+        self.requests += 1
+        REPLICA_REQUESTS.inc(replica=str(self.index))
+        if self.active == 1:
+            self._busy_since = time.perf_counter()
+
+    def _finish(self) -> None:
+        self.active -= 1
+        if self.active == 0 and self._busy_since is not None:
+            busy = time.perf_counter() - self._busy_since
+            self._busy_since = None
+            self.busy_seconds += busy
+            REPLICA_BUSY_SECONDS.inc(busy, replica=str(self.index))
+
+
+class ReplicaDispatcher:
+    """Routes each generation to the replica with the fewest running.
+
+    Ties go round-robin, so light traffic still spreads over all replicas
+    and keeps their pipelines warm.
+    """
+
+    def __init__(self, backends: Sequence[BaseModelBackend]):
+        """Initialize dispatcher.
+
+        Args:
+            backends: Loaded replicas, the first one is the primary
+        """
+        if not backends:
+            raise ValueError("At least one replica is required")
+        self.replicas: List[Replica] = [
+            Replica(index, backend) for index, backend in enumerate(backends)
+        ]
+        self._next = 0
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Replica]:
+        """Pick the least loaded replica and count a generation on it for the block."""
+        replica = self._pick()
+        replica._start()
+        try:
+            yield replica
+        finally:
+            replica._finish()
+
+    def _pick(self) -> Replica:
+        count = len(self.replicas)
+        candidates = (self.replicas[(self._next + i) % count] for i in range(count))
+        replica = min(candidates, key=lambda r: r.active)
+        self._next = (replica.index + 1) % count
+        return replica
+
+    def stats(self) -> List[Dict[str, object]]:
+        """Get load of every replica."""
+        now = time.perf_counter()
+        return [
+            {
+                "replica": replica.index,
+                "active": replica.active,
+                "requests": replica.requests,
+                "busy_seconds": round(
+                    replica.busy_seconds
+                    + (now - replica._busy_since if replica._busy_since else 0.0),
+                    3,
+                ),
+            }
+            for replica in self.replicas
+        ]
+
+    def active_counts(self) -> Dict[Tuple[str], float]:
+        """Get the number of running generations per replica."""
+        return {(str(replica.index),): replica.active for replica in self.replicas}
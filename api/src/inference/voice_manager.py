@@ -1,13 +1,16 @@
 """Voice management with controlled resource handling."""
 
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 import aiofiles
 import torch
 from loguru import logger
 
 from ..core import paths
+from ..core.cache import LRUCache
 from ..core.config import settings
+from ..core.metrics import register_cache
+from ..core.model_config import model_config
 
 
 class VoiceManager:
@@ -20,7 +23,14 @@ class VoiceManager:
         """Initialize voice manager."""
         # Strictly respect settings.use_gpu
         self._device = settings.get_device()
-        self._voices: Dict[str, torch.Tensor] = {}
+        # Voice tensors keyed by (voice path, device), bounded by model_config
+        self._voices = LRUCache(
+            max_entries=model_config.voice_cache_size
+            if model_config.cache_voices
+            else 0,
+            size_fn=lambda tensor: tensor.nbytes,
+        )
+        register_cache("voices", self._voices.stats)
 
     async def get_voice_path(self, voice_name: str) -> str:
         """Get path to voice file.
@@ -53,13 +63,36 @@ class VoiceManager:
         """
         try:
             voice_path = await self.get_voice_path(voice_name)
-            target_device = device or self._device
-            voice = await paths.load_voice_tensor(voice_path, target_device)
-            self._voices[voice_name] = voice
-            return voice
+            return await self.load_voice_from_path(voice_path, device)
         except Exception as e:
             raise RuntimeError(f"Failed to load voice {voice_name}: {e}")
 
+    async def load_voice_from_path(
+        self, voice_path: str, device: Optional[str] = None
+    ) -> torch.Tensor:
+        """Load voice tensor from a file, serving repeat loads from the cache.
+
+        Args:
+            voice_path: Path to voice file
+            device: Optional override for target device
+
+        Returns:
+            Voice tensor
+
+        Raises:
+            RuntimeError: If file cannot be read
+        """
+        target_device = device or self._device
+        key = (voice_path, target_device)
+        voice = self._voices.get(key)
+        if voice is not None:
+            return voice
+
+        logger.debug(f"Voice cache miss, loading {voice_path} to {target_device}")
+        voice = await paths.load_voice_tensor(voice_path, target_device)
+        self._voices.put(key, voice)
+        return voice
+
     async def combine_voices(
         self, voices: List[str], device: Optional[str] = None
     ) -> torch.Tensor:
@@ -95,13 +128,21 @@ class VoiceManager:
         """
         return await paths.list_voices()
 
-    def cache_info(self) -> Dict[str, int]:
+    def cache_info(self) -> Dict[str, Any]:
         """Get cache statistics.
 
         Returns:
             Dict with cache statistics
         """
-        return {"loaded_voices": len(self._voices), "device": self._device}
+        stats = self._voices.stats()
+        return {
+            "loaded_voices": stats["entries"],
+            "device": self._device,
+            "cache_size": stats["max_entries"],
+            "hits": stats["hits"],
+            "misses": stats["misses"],
+            "evictions": stats["evictions"],
+        }
 
 
 async def get_manager() -> VoiceManager:
@@ -2,8 +2,10 @@
 FastAPI OpenAI Compatible API
 """
 
+import asyncio
 import os
 import sys
+import time
 from contextlib import asynccontextmanager
 from pathlib import Path
 
@@ -11,6 +13,7 @@ import torch
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from loguru import logger
 
 from .core.config import settings
@@ -47,13 +50,21 @@ setup_logger()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for model initialization"""
+    from .core.phoneme_cache import get_phoneme_cache
     from .inference.model_manager import get_manager
     from .inference.voice_manager import get_manager as get_voice_manager
+    from .services.encoder_pool import get_encoder_pool
     from .services.temp_manager import cleanup_temp_files
+    from .services.text_processing.process_pool import get_text_process_pool
 
     # Clean old temp files on startup
     await cleanup_temp_files()
 
+    phoneme_cache = get_phoneme_cache()
+    if settings.phoneme_cache_file:
+        loaded = phoneme_cache.load(settings.phoneme_cache_file)
+        logger.info(f"Loaded {loaded} cached phonemizations")
+
     logger.info("Loading TTS model and voice packs...")
 
     try:
@@ -105,8 +116,46 @@ async def lifespan(app: FastAPI):
     startup_msg += f"\n{boundary}\n"
     logger.info(startup_msg)
 
+    # Prepare audio encoders in the background for the first requests
+    encoder_pool = get_encoder_pool()
+    encoder_pool.prewarm(settings.encoder_pool_formats, sample_rate=settings.sample_rate)
+
+    # Spawn the text processing workers before the first long request
+    text_process_pool = get_text_process_pool()
+    text_process_pool.prewarm()
+
+    # Build the other languages' pipelines, /health/ready waits for them
+    language_warmup = asyncio.create_task(
+        warmup_languages(model_manager, settings.warmup_languages)
+    )
+
     yield
 
+    language_warmup.cancel()
+
+    from .inference.executor import shutdown_executors
+
+    shutdown_executors()
+    encoder_pool.shutdown()
+    text_process_pool.shutdown()
+
+    if settings.phoneme_cache_file:
+        try:
+            saved = phoneme_cache.save(settings.phoneme_cache_file)
+            logger.info(f"Saved {saved} cached phonemizations")
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to save phoneme cache: {e}")
+
+
+async def warmup_languages(model_manager, lang_codes: list[str]) -> None:
+    """Warm up the configured languages and log how long each took."""
+    start = time.perf_counter()
+    timings = await model_manager.warmup_languages(lang_codes)
+    if timings:
+        ms = int((time.perf_counter() - start) * 1000)
+        summary = ", ".join(f"{lang}: {t}ms" for lang, t in timings.items())
+        logger.info(f"Language warmup completed in {ms}ms ({summary})")
+
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -142,6 +191,17 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/health/ready")
+async def readiness_check():
+    """Readiness check, fails until the startup languages are warmed up"""
+    from .inference.model_manager import get_manager
+
+    model_manager = await get_manager()
+    if not model_manager.ready:
+        return JSONResponse(status_code=503, content={"status": "warming_up"})
+    return {"status": "ready"}
+
+
 @app.get("/v1/test")
 async def test_endpoint():
     """Test endpoint to verify routing"""
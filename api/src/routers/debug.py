@@ -1,10 +1,11 @@
 import threading
-import time
 from datetime import datetime
 
 import psutil
 import torch
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
+
+from ..core.metrics import CONTENT_TYPE, registry
 
 try:
     import GPUtil
@@ -16,6 +17,12 @@ except ImportError:
 router = APIRouter(tags=["debug"])
 
 
+@router.get("/metrics")
+async def get_metrics():
+    """Prometheus metrics in the text exposition format."""
+    return Response(content=registry.render(), media_type=CONTENT_TYPE)
+
+
 @router.get("/debug/threads")
 async def get_thread_info():
     process = psutil.Process()
@@ -157,53 +164,46 @@ async def get_session_pool_info():
     from ..inference.model_manager import get_manager
 
     manager = await get_manager()
-    pools = manager._session_pools
-    current_time = time.time()
-
-    pool_info = {}
-
-    # Get CPU pool info
-    if "onnx_cpu" in pools:
-        cpu_pool = pools["onnx_cpu"]
-        pool_info["cpu"] = {
-            "active_sessions": len(cpu_pool._sessions),
-            "max_sessions": cpu_pool._max_size,
-            "sessions": [
-                {"model": path, "age_seconds": current_time - info.last_used}
-                for path, info in cpu_pool._sessions.items()
-            ],
-        }
+    return {device: pool.stats() for device, pool in manager.session_pools.items()}
 
-    # Get GPU pool info
-    if "onnx_gpu" in pools:
-        gpu_pool = pools["onnx_gpu"]
-        pool_info["gpu"] = {
-            "active_sessions": len(gpu_pool._sessions),
-            "max_streams": gpu_pool._max_size,
-            "available_streams": len(gpu_pool._available_streams),
-            "sessions": [
-                {
-                    "model": path,
-                    "age_seconds": current_time - info.last_used,
-                    "stream_id": info.stream_id,
-                }
-                for path, info in gpu_pool._sessions.items()
-            ],
-        }
 
-        # Add GPU memory info if available
-        if GPU_AVAILABLE:
-            try:
-                gpus = GPUtil.getGPUs()
-                if gpus:
-                    gpu = gpus[0]  # Assume first GPU
-                    pool_info["gpu"]["memory"] = {
-                        "total_mb": gpu.memoryTotal,
-                        "used_mb": gpu.memoryUsed,
-                        "free_mb": gpu.memoryFree,
-                        "percent_used": (gpu.memoryUsed / gpu.memoryTotal) * 100,
-                    }
-            except Exception:
-                pass
-
-    return pool_info
+@router.get("/debug/replicas")
+async def get_replica_info():
+    """Get load of every model replica."""
+    from ..inference.model_manager import get_manager
+
+    manager = await get_manager()
+    return {"replicas": manager.replica_stats()}
+
+
+@router.get("/debug/response_cache")
+async def get_response_cache_info():
+    """Get hit rate and size of the speech response cache."""
+    from ..services.response_cache import get_response_cache
+
+    return get_response_cache().stats()
+
+
+@router.get("/debug/sentence_cache")
+async def get_sentence_cache_info():
+    """Get hit rate and size of the shared sentence audio cache."""
+    from .openai_compatible import get_tts_service
+
+    tts_service = await get_tts_service()
+    return tts_service.sentence_cache_info()
+
+
+@router.get("/debug/phoneme_cache")
+async def get_phoneme_cache_info():
+    """Get hit rate and size of the shared phoneme cache."""
+    from ..core.phoneme_cache import get_phoneme_cache
+
+    return get_phoneme_cache().stats()
+
+
+@router.get("/debug/scheduler")
+async def get_scheduler_info():
+    """Get synthesis slot usage and queue depths of the chunk scheduler."""
+    from ..services.scheduler import get_scheduler
+
+    return get_scheduler().stats()
@@ -13,8 +13,11 @@ from kokoro import KPipeline
 from loguru import logger
 
 from ..core.config import settings
+from ..core.metrics import ERRORS, REQUESTS
 from ..inference.base import AudioChunk
 from ..services.audio import AudioNormalizer, AudioService
+from ..services.encoder_pool import get_encoder_pool
+from ..services.scheduler import SchedulerFullError, get_scheduler
 from ..services.streaming_audio_writer import StreamingAudioWriter
 from ..services.temp_manager import TempFileWriter
 from ..services.text_processing import smart_split
@@ -26,7 +29,11 @@ from ..structures.text_schemas import (
     PhonemeRequest,
     PhonemeResponse,
 )
-from .openai_compatible import process_and_validate_voices, stream_audio_chunks
+from .openai_compatible import (
+    process_and_validate_voices,
+    server_busy_error,
+    stream_audio_chunks,
+)
 
 router = APIRouter(tags=["text processing"])
 
@@ -166,6 +173,7 @@ async def create_captioned_speech(
     tts_service: TTSService = Depends(get_tts_service),
 ):
     """Generate audio with word-level timestamps using streaming approach"""
+    REQUESTS.inc(endpoint="captioned_speech", stream=str(request.stream).lower())
 
     try:
         # model_name = get_model_name(request.model)
@@ -182,7 +190,10 @@ async def create_captioned_speech(
             "pcm": "audio/pcm",
         }.get(request.response_format, f"audio/{request.response_format}")
 
-        writer = StreamingAudioWriter(request.response_format, sample_rate=24000)
+        # Turn the request away now if the queue is full, before any audio is sent
+        get_scheduler().check_admission(request.priority)
+
+        writer = get_encoder_pool().acquire(request.response_format, sample_rate=24000)
         # Check if streaming is requested (default for OpenAI client)
         if request.stream:
             # Create generator but don't start it yet
@@ -322,6 +333,7 @@ async def create_captioned_speech(
                 volume_multiplier=request.volume_multiplier,
                 normalization_options=request.normalization_options,
                 lang_code=request.lang_code,
+                priority=request.priority,
             )
 
             audio_data = await AudioService.convert_audio(
@@ -360,9 +372,14 @@ async def create_captioned_speech(
                 },
             )
 
+    except SchedulerFullError as e:
+        logger.warning(f"Rejected request: {str(e)}")
+        ERRORS.inc(type=type(e).__name__)
+        raise server_busy_error(e)
     except ValueError as e:
         # Handle validation errors
         logger.warning(f"Invalid request: {str(e)}")
+        ERRORS.inc(type=type(e).__name__)
 
         try:
             writer.close()
@@ -380,6 +397,7 @@ async def create_captioned_speech(
     except RuntimeError as e:
         # Handle runtime/processing errors
         logger.error(f"Processing error: {str(e)}")
+        ERRORS.inc(type=type(e).__name__)
 
         try:
             writer.close()
@@ -397,6 +415,7 @@ async def create_captioned_speech(
     except Exception as e:
         # Handle unexpected errors
         logger.error(f"Unexpected error in captioned speech generation: {str(e)}")
+        ERRORS.inc(type=type(e).__name__)
 
         try:
             writer.close()
@@ -1,11 +1,13 @@
 """OpenAI-compatible router for text-to-speech"""
 
+import asyncio
 import io
 import json
 import os
 import re
 import tempfile
-from typing import AsyncGenerator, Dict, List, Tuple, Union
+import time
+from typing import AsyncGenerator, Dict, List, Optional, Tuple, Union
 from urllib import response
 
 import aiofiles
@@ -16,8 +18,12 @@ from fastapi.responses import FileResponse, StreamingResponse
 from loguru import logger
 
 from ..core.config import settings
+from ..core.metrics import ERRORS, INFLIGHT_STREAMS, REQUESTS, TTFB_SECONDS
 from ..inference.base import AudioChunk
 from ..services.audio import AudioService
+from ..services.encoder_pool import get_encoder_pool
+from ..services.response_cache import get_response_cache, iter_cached
+from ..services.scheduler import SchedulerFullError, get_scheduler
 from ..services.streaming_audio_writer import StreamingAudioWriter
 from ..services.tts_service import TTSService
 from ..structures import OpenAISpeechRequest
@@ -50,6 +56,9 @@ router = APIRouter(
 _tts_service = None
 _init_lock = None
 
+# How often streaming responses check whether their client is still connected
+DISCONNECT_POLL_SECONDS = 0.1
+
 
 async def get_tts_service() -> TTSService:
     """Get global TTSService instance"""
@@ -132,20 +141,87 @@ async def process_and_validate_voices(
     return "".join(voices)
 
 
+def server_busy_error(e: SchedulerFullError) -> HTTPException:
+    """Build the 429 response for a request the scheduler turned away"""
+    return HTTPException(
+        status_code=429,
+        detail={
+            "error": "server_busy",
+            "message": str(e),
+            "type": "rate_limit_error",
+        },
+        headers={"Retry-After": str(e.retry_after)},
+    )
+
+
+async def client_disconnected(client_request: Request) -> bool:
+    """Check whether the client has gone away"""
+    is_disconnected = client_request.is_disconnected
+    if callable(is_disconnected):
+        is_disconnected = await is_disconnected()
+    return bool(is_disconnected)
+
+
+async def wait_for_disconnect(client_request: Request) -> None:
+    """Return once the client has gone away"""
+    while not await client_disconnected(client_request):
+        await asyncio.sleep(DISCONNECT_POLL_SECONDS)
+
+
+async def cancel_on_disconnect(
+    chunks: AsyncGenerator[AudioChunk, None], client_request: Request
+) -> AsyncGenerator[AudioChunk, None]:
+    """Pass chunks through, cancelling their generation when the client disconnects.
+
+    Each chunk is awaited against a disconnect watcher, so a disconnect
+    interrupts the queue wait or forward pass in progress instead of being
+    noticed only once the next chunk is done. The cancellation releases the
+    request's scheduler slot and stops its inference worker after the item
+    it is producing.
+    """
+    watcher = asyncio.ensure_future(wait_for_disconnect(client_request))
+    try:
+        while True:
+            next_chunk = asyncio.ensure_future(chunks.__anext__())
+            await asyncio.wait({next_chunk, watcher}, return_when=asyncio.FIRST_COMPLETED)
+            if watcher.done():
+                next_chunk.cancel()
+                try:
+                    await next_chunk
+                except (asyncio.CancelledError, StopAsyncIteration):
+                    pass
+                logger.info("Client disconnected, stopping audio generation")
+                return
+            try:
+                chunk_data = next_chunk.result()
+            except StopAsyncIteration:
+                return
+            yield chunk_data
+    finally:
+        watcher.cancel()
+        await chunks.aclose()
+
+
 async def stream_audio_chunks(
     tts_service: TTSService,
     request: Union[OpenAISpeechRequest, CaptionedSpeechRequest],
     client_request: Request,
     writer: StreamingAudioWriter,
+    start_time: Optional[float] = None,
+    failed_chunks: Optional[List[str]] = None,
 ) -> AsyncGenerator[AudioChunk, None]:
     """Stream audio chunks as they're generated with client disconnect handling"""
+    if start_time is None:
+        start_time = time.perf_counter()
     voice_name = await process_and_validate_voices(request.voice, tts_service)
     unique_properties = {"return_timestamps": False}
     if hasattr(request, "return_timestamps"):
         unique_properties["return_timestamps"] = request.return_timestamps
 
+    first_byte = True
+    INFLIGHT_STREAMS.inc()
     try:
-        async for chunk_data in tts_service.generate_audio_stream(
+        chunks = tts_service.generate_audio_stream(
             text=request.input,
             voice=voice_name,
             writer=writer,
@@ -155,20 +231,22 @@ async def stream_audio_chunks(
             volume_multiplier=request.volume_multiplier,
             normalization_options=request.normalization_options,
             return_timestamps=unique_properties["return_timestamps"],
-        ):
-            # Check if client is still connected
-            is_disconnected = client_request.is_disconnected
-            if callable(is_disconnected):
-                is_disconnected = await is_disconnected()
-            if is_disconnected:
-                logger.info("Client disconnected, stopping audio generation")
-                break
-
+            first_chunk_max_tokens=request.first_chunk_max_tokens,
+            priority=request.priority,
+            failed_chunks=failed_chunks,
+        )
+        async for chunk_data in cancel_on_disconnect(chunks, client_request):
+            if first_byte and chunk_data.output:
+                TTFB_SECONDS.observe(time.perf_counter() - start_time, stream="true")
+                first_byte = False
             yield chunk_data
     except Exception as e:
         logger.error(f"Error in audio streaming: {str(e)}")
+        ERRORS.inc(type=type(e).__name__)
         # Let the exception propagate to trigger cleanup
         raise
+    finally:
+        INFLIGHT_STREAMS.dec()
 
 
 @router.post("/audio/speech")
@@ -178,8 +256,11 @@ async def create_speech(
     x_raw_response: str = Header(None, alias="x-raw-response"),
 ):
     """OpenAI-compatible endpoint for text-to-speech"""
+    start_time = time.perf_counter()
+    REQUESTS.inc(endpoint="speech", stream=str(request.stream).lower())
     # Validate model before processing request
     if request.model not in _openai_mappings["models"]:
+        ERRORS.inc(type="invalid_model")
         raise HTTPException(
             status_code=400,
             detail={
@@ -204,13 +285,48 @@ async def create_speech(
             "pcm": "audio/pcm",
         }.get(request.response_format, f"audio/{request.response_format}")
 
-        writer = StreamingAudioWriter(request.response_format, sample_rate=24000)
+        # Serve repeated requests straight from the response cache
+        response_cache = get_response_cache()
+        cache_key = None
+        if response_cache.enabled and not request.return_download_link:
+            cache_key = response_cache.make_key(request, voice_name)
+            cached = await response_cache.get(cache_key)
+            if cached is not None:
+                headers = {
+                    "Content-Disposition": f"attachment; filename=speech.{request.response_format}",
+                    "Cache-Control": "no-cache",
+                    "X-Cache": "HIT",
+                }
+                TTFB_SECONDS.observe(
+                    time.perf_counter() - start_time,
+                    stream=str(request.stream).lower(),
+                )
+                if request.stream:
+                    headers["X-Accel-Buffering"] = "no"
+                    return StreamingResponse(
+                        iter_cached(cached), media_type=content_type, headers=headers
+                    )
+                return Response(
+                    content=cached, media_type=content_type, headers=headers
+                )
+
+        # Turn the request away now if the queue is full, before any audio is sent
+        get_scheduler().check_admission(request.priority)
+
+        writer = get_encoder_pool().acquire(request.response_format, sample_rate=24000)
+        # Chunks the service skipped after a failure, such audio is never cached
+        failed_chunks = []
 
         # Check if streaming is requested (default for OpenAI client)
         if request.stream:
             # Create generator but don't start it yet
             generator = stream_audio_chunks(
-                tts_service, request, client_request, writer
+                tts_service,
+                request,
+                client_request,
+                writer,
+                start_time,
+                failed_chunks=failed_chunks,
             )
 
             # If download link requested, wrap generator with temp file writer
@@ -268,26 +384,37 @@ async def create_speech(
                 )
 
             async def single_output():
+                parts = [] if cache_key else None
                 try:
                     # Stream chunks
                     async for chunk_data in generator:
                         if chunk_data.output:  # Skip empty chunks
+                            if parts is not None:
+                                parts.append(chunk_data.output)
                             yield chunk_data.output
+                    # Only complete responses are cached
+                    if (
+                        parts is not None
+                        and not failed_chunks
+                        and not await client_disconnected(client_request)
+                    ):
+                        await response_cache.put(cache_key, b"".join(parts))
                 except Exception as e:
                     logger.error(f"Error in single output streaming: {e}")
                     writer.close()
                     raise
 
             # Standard streaming without download link
+            headers = {
+                "Content-Disposition": f"attachment; filename=speech.{request.response_format}",
+                "X-Accel-Buffering": "no",
+                "Cache-Control": "no-cache",
+                "Transfer-Encoding": "chunked",
+            }
+            if cache_key:
+                headers["X-Cache"] = "MISS"
             return StreamingResponse(
-                single_output(),
-                media_type=content_type,
-                headers={
-                    "Content-Disposition": f"attachment; filename=speech.{request.response_format}",
-                    "X-Accel-Buffering": "no",
-                    "Cache-Control": "no-cache",
-                    "Transfer-Encoding": "chunked",
-                },
+                single_output(), media_type=content_type, headers=headers
             )
         else:
             headers = {
@@ -304,6 +431,8 @@ async def create_speech(
                 volume_multiplier=request.volume_multiplier,
                 normalization_options=request.normalization_options,
                 lang_code=request.lang_code,
+                priority=request.priority,
+                failed_chunks=failed_chunks,
             )
 
             audio_data = await AudioService.convert_audio(
@@ -323,6 +452,11 @@ async def create_speech(
             )
             output = audio_data.output + final.output
 
+            if cache_key:
+                if not failed_chunks:
+                    await response_cache.put(cache_key, output)
+                headers["X-Cache"] = "MISS"
+
             if request.return_download_link:
                 from ..services.temp_manager import TempFileWriter
 
@@ -352,18 +486,24 @@ async def create_speech(
                         await temp_writer.__aexit__(None, None, None)
                     writer.close()
 
+            TTFB_SECONDS.observe(time.perf_counter() - start_time, stream="false")
             return Response(
                 content=output,
                 media_type=content_type,
                 headers=headers,
             )
 
+    except SchedulerFullError as e:
+        logger.warning(f"Rejected request: {str(e)}")
+        ERRORS.inc(type=type(e).__name__)
+        raise server_busy_error(e)
     except ValueError as e:
         # Handle validation errors
         logger.warning(f"Invalid request: {str(e)}")
+        ERRORS.inc(type=type(e).__name__)
 
         try:
-            writer.close()
+            get_encoder_pool().release(writer)
         except:
             pass
 
@@ -378,9 +518,10 @@ async def create_speech(
     except RuntimeError as e:
         # Handle runtime/processing errors
         logger.error(f"Processing error: {str(e)}")
+        ERRORS.inc(type=type(e).__name__)
 
         try:
-            writer.close()
+            get_encoder_pool().release(writer)
         except:
             pass
 
@@ -395,9 +536,10 @@ async def create_speech(
     except Exception as e:
         # Handle unexpected errors
         logger.error(f"Unexpected error in speech generation: {str(e)}")
+        ERRORS.inc(type=type(e).__name__)
 
         try:
-            writer.close()
+            get_encoder_pool().release(writer)
         except:
             pass
 
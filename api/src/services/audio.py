@@ -14,6 +14,7 @@ from pydub import AudioSegment
 from torch import norm
 
 from ..core.config import settings
+from ..core.metrics import STAGE_SECONDS
 from ..inference.base import AudioChunk
 from .streaming_audio_writer import StreamingAudioWriter
 
@@ -77,22 +78,15 @@ class AudioNormalizer:
             10 ** (silence_threshold_db / 20)
         )
         # Find the first samples above the silence threshold at the start and end of the audio
-        non_silent_index_start, non_silent_index_end = None, None
-
-        for X in range(0, len(audio_data)):
-            if abs(audio_data[X]) > amplitude_threshold:
-                non_silent_index_start = X
-                break
-
-        for X in range(len(audio_data) - 1, -1, -1):
-            if abs(audio_data[X]) > amplitude_threshold:
-                non_silent_index_end = X
-                break
+        non_silent = np.abs(audio_data) > amplitude_threshold
 
         # Handle the case where the entire audio is silent
-        if non_silent_index_start == None or non_silent_index_end == None:
+        if not non_silent.any():
             return 0, len(audio_data)
 
+        non_silent_index_start = int(non_silent.argmax())
+        non_silent_index_end = len(audio_data) - 1 - int(non_silent[::-1].argmax())
+
         return max(non_silent_index_start - self.samples_to_pad_start, 0), min(
             non_silent_index_end + math.ceil(samples_to_pad_end / speed),
             len(audio_data),
@@ -178,21 +172,7 @@ class AudioService:
                     audio_chunk, chunk_text, speed, is_last_chunk, normalizer
                 )
 
-            # Write audio data first
-            if len(audio_chunk.audio) > 0:
-                chunk_data = writer.write_chunk(audio_chunk.audio)
-
-            # Then finalize if this is the last chunk
-            if is_last_chunk:
-                final_data = writer.write_chunk(finalize=True)
-
-                if final_data:
-                    audio_chunk.output = final_data
-                return audio_chunk
-
-            if chunk_data:
-                audio_chunk.output = chunk_data
-            return audio_chunk
+            return AudioService.write_audio(audio_chunk, writer, is_last_chunk)
 
         except Exception as e:
             logger.error(f"Error converting audio stream to {output_format}: {str(e)}")
@@ -200,6 +180,43 @@ class AudioService:
                 f"Failed to convert audio stream to {output_format}: {str(e)}"
             )
 
+    @staticmethod
+    def write_audio(
+        audio_chunk: AudioChunk,
+        writer: StreamingAudioWriter,
+        is_last_chunk: bool = False,
+    ) -> AudioChunk:
+        """Encode normalized audio with the writer, finalizing it on the last chunk
+
+        This is blocking codec work, so streams run it on the encode executor.
+
+        Args:
+            audio_chunk: Chunk with int16 audio
+            writer: The StreamingAudioWriter to use
+            is_last_chunk: Whether this is the last chunk
+
+        Returns:
+            The chunk with its encoded bytes in output
+        """
+        chunk_data = b""
+        # Write audio data first
+        if len(audio_chunk.audio) > 0:
+            with STAGE_SECONDS.time(stage="encode"):
+                chunk_data = writer.write_chunk(audio_chunk.audio)
+
+        # Then finalize if this is the last chunk
+        if is_last_chunk:
+            with STAGE_SECONDS.time(stage="encode"):
+                final_data = writer.write_chunk(finalize=True)
+
+            if final_data:
+                audio_chunk.output = final_data
+            return audio_chunk
+
+        if chunk_data:
+            audio_chunk.output = chunk_data
+        return audio_chunk
+
     @staticmethod
     def trim_audio(
         audio_chunk: AudioChunk,
@@ -220,6 +237,7 @@ class AudioService:
         Returns:
             Trimmed audio data
         """
+        start_time = time.perf_counter()
         if normalizer is None:
             normalizer = AudioNormalizer()
 
@@ -245,4 +263,5 @@ class AudioService:
             for timestamp in audio_chunk.word_timestamps:
                 timestamp.start_time -= trimed_samples / 24000
                 timestamp.end_time -= trimed_samples / 24000
+        STAGE_SECONDS.observe(time.perf_counter() - start_time, stage="trim")
         return audio_chunk
@@ -0,0 +1,174 @@
+"""Pool of prewarmed StreamingAudioWriter instances."""
+
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, Dict, Iterable, Optional, Tuple
+
+from loguru import logger
+
+from ..core.config import settings
+from ..core.metrics import registry
+from .streaming_audio_writer import StreamingAudioWriter
+
+# Formats whose writers carry codec and container state worth prewarming
+POOLED_FORMATS = {"mp3", "opus", "aac", "flac", "wav"}
+
+EncoderKey = Tuple[str, int, int]
+
+ENCODER_POOL_REQUESTS = registry.counter(
+    "kokoro_encoder_pool_requests_total",
+    "Audio writers handed out, by whether they came prewarmed from the pool",
+    ["format", "result"],
+)
+
+
+class EncoderPool:
+    """Keeps a bounded number of ready-to-use writers per encoder config.
+
+    A PyAV container cannot be reopened once it has written its trailer, so
+    writers are reused only if no audio was written to them. Otherwise the
+    pool is refilled with freshly prewarmed writers on a background thread,
+    keeping codec and container setup off the request path.
+    """
+
+    def __init__(self, size: int):
+        """Initialize pool.
+
+        Args:
+            size: Maximum number of idle writers per (format, sample_rate, bit_rate)
+        """
+        self.size = max(0, size)
+        self._idle: Dict[EncoderKey, Deque[StreamingAudioWriter]] = {}
+        self._pending: Dict[EncoderKey, int] = {}
+        self._lock = threading.Lock()
+        self._refill_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="encoder-pool"
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0
+
+    def idle_counts(self) -> Dict[Tuple[str], float]:
+        """Get the number of idle writers per format."""
+        counts: Dict[Tuple[str], float] = {}
+        with self._lock:
+            for (format, _, _), writers in self._idle.items():
+                counts[(format,)] = counts.get((format,), 0) + len(writers)
+        return counts
+
+    @staticmethod
+    def _create(key: EncoderKey) -> StreamingAudioWriter:
+        format, sample_rate, bit_rate = key
+        writer = StreamingAudioWriter(format, sample_rate=sample_rate, bit_rate=bit_rate)
+        writer.prewarm()
+        return writer
+
+    def acquire(
+        self, format: str, sample_rate: int = 24000, bit_rate: int = 128000
+    ) -> StreamingAudioWriter:
+        """Get a writer, prewarmed from the pool when one is available.
+
+        Args:
+            format: Output format
+            sample_rate: Sample rate in Hz
+            bit_rate: Target bit rate for lossy codecs
+
+        Returns:
+            Writer ready for write_chunk
+        """
+        format = format.lower()
+        if not self.enabled or format not in POOLED_FORMATS:
+            return StreamingAudioWriter(format, sample_rate=sample_rate, bit_rate=bit_rate)
+
+        key = (format, sample_rate, bit_rate)
+        with self._lock:
+            writers = self._idle.get(key)
+            writer = writers.popleft() if writers else None
+
+        ENCODER_POOL_REQUESTS.inc(format=format, result="hit" if writer else "miss")
+        if writer is None:
+            writer = StreamingAudioWriter(format, sample_rate=sample_rate, bit_rate=bit_rate)
+        self._schedule_refill(key)
+        return writer
+
+    def release(self, writer: StreamingAudioWriter) -> None:
+        """Return an unused writer to the pool, or close it."""
+        key = (writer.format, writer.sample_rate, writer.bit_rate)
+        if self.enabled and writer.format in POOLED_FORMATS and writer.is_fresh:
+            with self._lock:
+                writers = self._idle.setdefault(key, deque())
+                if len(writers) < self.size:
+                    writers.append(writer)
+                    return
+        writer.close()
+
+    def prewarm(self, formats: Iterable[str], sample_rate: int = 24000, bit_rate: int = 128000) -> None:
+        """Fill the pool for the given formats in the background."""
+        for format in formats:
+            format = format.lower()
+            if format in POOLED_FORMATS:
+                self._schedule_refill((format, sample_rate, bit_rate))
+
+    def _schedule_refill(self, key: EncoderKey) -> None:
+        with self._lock:
+            missing = (
+                self.size
+                - len(self._idle.get(key, ()))
+                - self._pending.get(key, 0)
+            )
+            if missing <= 0:
+                return
+            self._pending[key] = self._pending.get(key, 0) + missing
+        try:
+            self._refill_executor.submit(self._refill, key, missing)
+        except RuntimeError:
+            # Pool shut down
+            with self._lock:
+                self._pending[key] -= missing
+
+    def _refill(self, key: EncoderKey, count: int) -> None:
+        for _ in range(count):
+            try:
+                writer = self._create(key)
+            except Exception as e:
+                logger.warning(f"Failed to prewarm {key[0]} encoder: {e}")
+                with self._lock:
+                    self._pending[key] -= 1
+                continue
+            with self._lock:
+                self._pending[key] -= 1
+                writers = self._idle.setdefault(key, deque())
+                if len(writers) < self.size:
+                    writers.append(writer)
+                    writer = None
+            if writer is not None:
+                writer.close()
+
+    def shutdown(self) -> None:
+        """Stop refilling and close idle writers."""
+        self._refill_executor.shutdown(wait=True)
+        with self._lock:
+            idle = [writer for writers in self._idle.values() for writer in writers]
+            self._idle.clear()
+        for writer in idle:
+            writer.close()
+
+
+_instance: Optional[EncoderPool] = None
+
+registry.gauge(
+    "kokoro_encoder_pool_idle",
+    "Prewarmed writers waiting in the pool",
+    ["format"],
+    collect=lambda: _instance.idle_counts() if _instance else {},
+)
+
+
+def get_encoder_pool() -> EncoderPool:
+    """Get the global encoder pool, sized from settings."""
+    global _instance
+    if _instance is None:
+        _instance = EncoderPool(settings.encoder_pool_size)
+    return _instance
@@ -0,0 +1,241 @@
+"""Content-addressed cache for complete speech responses."""
+
+import hashlib
+import json
+import os
+import unicodedata
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Dict, Optional
+
+import aiofiles
+from loguru import logger
+
+from ..core.cache import LRUCache
+from ..core.config import settings
+from ..core.metrics import register_cache
+from ..core.model_config import model_config
+from ..structures import OpenAISpeechRequest
+
+# Size of the pieces a cached response is streamed back in
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+@lru_cache(maxsize=None)
+def config_fingerprint() -> str:
+    """Hash of the server configuration that shapes the audio.
+
+    Part of every key, so disk entries written under another backend,
+    quantization, model file or trim settings are never served. Computed
+    once, the configuration is fixed for the life of the process.
+    """
+    api_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    model_path = os.path.join(
+        api_dir, settings.model_dir, model_config.pytorch_kokoro_v1_file
+    )
+    try:
+        model_mtime = os.path.getmtime(model_path)
+    except OSError:
+        model_mtime = None
+    payload = {
+        "inference_backend": settings.inference_backend,
+        "model_quantization": settings.model_quantization,
+        "model_path": os.path.abspath(model_path),
+        "model_mtime": model_mtime,
+        "sample_rate": settings.sample_rate,
+        "default_voice_code": settings.default_voice_code,
+        "default_volume_multiplier": settings.default_volume_multiplier,
+        "gap_trim_ms": settings.gap_trim_ms,
+        "dynamic_gap_trim_padding_ms": settings.dynamic_gap_trim_padding_ms,
+        "dynamic_gap_trim_padding_char_multiplier": (
+            settings.dynamic_gap_trim_padding_char_multiplier
+        ),
+    }
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+class ResponseCache:
+    """Two-tier (memory, disk) LRU cache of encoded speech responses.
+
+    Keys are a hash of everything that determines the output audio, so a
+    repeated request can be answered without G2P, inference or encoding.
+    Disk hits are promoted to the memory tier.
+
+    Each process keeps its own index of the disk tier and evicts against
+    the full disk budget, so prefork workers sharing cache_dir can together
+    hold up to PREFORK_WORKERS times that budget on disk.
+    """
+
+    def __init__(self, memory_bytes: int, disk_bytes: int, cache_dir: str):
+        """Initialize cache.
+
+        Args:
+            memory_bytes: Byte budget of the memory tier
+            disk_bytes: Byte budget of the disk tier
+            cache_dir: Directory holding the disk tier
+        """
+        self._memory = LRUCache(max_bytes=memory_bytes, size_fn=len)
+        # Disk tier index maps key -> file size, files are removed on eviction
+        self._disk = LRUCache(
+            max_bytes=disk_bytes,
+            size_fn=lambda size: size,
+            on_evict=lambda key, size: self._remove_file(key),
+        )
+        self._cache_dir = cache_dir
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        if self._disk.enabled:
+            self._load_index()
+        register_cache("responses_memory", self._memory.stats)
+        register_cache("responses_disk", self._disk.stats)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether either tier can hold entries."""
+        return self._memory.enabled or self._disk.enabled
+
+    @staticmethod
+    def make_key(request: OpenAISpeechRequest, voice_name: str) -> str:
+        """Build the cache key for a speech request.
+
+        Args:
+            request: Speech request
+            voice_name: Validated voice spec, with OpenAI names already mapped
+
+        Returns:
+            Hex digest identifying the response
+        """
+        normalization_options = request.normalization_options
+        payload = {
+            "config": config_fingerprint(),
+            "input": unicodedata.normalize("NFC", request.input).strip(),
+            "voice": voice_name,
+            "speed": request.speed,
+            "lang_code": request.lang_code,
+            "volume_multiplier": request.volume_multiplier,
+            "normalization_options": (
+                normalization_options.model_dump() if normalization_options else None
+            ),
+            "response_format": request.response_format,
+            "first_chunk_max_tokens": request.first_chunk_max_tokens,
+        }
+        return hashlib.sha256(
+            json.dumps(payload, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._cache_dir, f"{key}.bin")
+
+    def _remove_file(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def _load_index(self) -> None:
+        """Index existing disk entries, oldest first so LRU order survives restarts."""
+        os.makedirs(self._cache_dir, exist_ok=True)
+        entries = []
+        with os.scandir(self._cache_dir) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith(".bin"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.name[:-4], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._disk.put(key, size)
+        if entries:
+            logger.info(
+                f"Response cache indexed {len(self._disk)} entries "
+                f"({self._disk.total_bytes / 1024 / 1024:.1f}MB) from {self._cache_dir}"
+            )
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get a cached response, checking memory first and then disk."""
+        data = self._memory.get(key)
+        if data is not None:
+            self.memory_hits += 1
+            return data
+
+        if self._disk.get(key) is not None:
+            try:
+                async with aiofiles.open(self._path(key), "rb") as f:
+                    data = await f.read()
+            except OSError as e:
+                logger.warning(f"Dropping unreadable response cache entry {key}: {e}")
+                self._disk.pop(key)
+            else:
+                self._memory.put(key, data)
+                self.disk_hits += 1
+                return data
+
+        self.misses += 1
+        return None
+
+    async def put(self, key: str, data: bytes) -> None:
+        """Store a complete response in both tiers."""
+        if not data:
+            return
+        self._memory.put(key, data)
+        if not self._disk.enabled or len(data) > self._disk.max_bytes:
+            return
+        path = self._path(key)
+        # Per process, workers sharing the directory may write the same key
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            async with aiofiles.open(tmp_path, "wb") as f:
+                await f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write response cache entry {key}: {e}")
+            return
+        self._disk.put(key, len(data))
+
+    def clear(self) -> None:
+        """Remove all entries from both tiers."""
+        self._memory.clear()
+        for key in self._disk.keys():
+            self._disk.pop(key)
+            self._remove_file(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit-rate and size statistics for both tiers."""
+        hits = self.memory_hits + self.disk_hits
+        lookups = hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "hits": hits,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "memory": self._memory.stats(),
+            "disk": self._disk.stats(),
+        }
+
+
+async def iter_cached(data: bytes) -> AsyncGenerator[bytes, None]:
+    """Stream a cached response back in fixed-size pieces."""
+    for start in range(0, len(data), STREAM_CHUNK_SIZE):
+        yield data[start : start + STREAM_CHUNK_SIZE]
+
+
+_instance: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the global response cache, sized from settings."""
+    global _instance
+    if _instance is None:
+        enabled = settings.response_cache_enabled
+        _instance = ResponseCache(
+            memory_bytes=int(settings.response_cache_memory_mb * 1024 * 1024)
+            if enabled
+            else 0,
+            disk_bytes=int(settings.response_cache_disk_mb * 1024 * 1024)
+            if enabled
+            else 0,
+            cache_dir=settings.response_cache_dir,
+        )
+    return _instance
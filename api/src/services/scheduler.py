@@ -0,0 +1,204 @@
+"""Admission control and fair scheduling of chunk synthesis across streams."""
+
+import asyncio
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict, Optional, Tuple
+
+from ..core.config import settings
+from ..core.metrics import registry
+
+# Scheduling classes, highest priority first
+PRIORITIES = ("interactive", "batch")
+
+QUEUE_WAIT_SECONDS = registry.histogram(
+    "kokoro_scheduler_queue_wait_seconds",
+    "Time chunks waited for a synthesis slot",
+    ["priority"],
+)
+REJECTED = registry.counter(
+    "kokoro_scheduler_rejected_total",
+    "Requests rejected because the queue was full",
+    ["priority"],
+)
+
+
+class SchedulerFullError(RuntimeError):
+    """Raised when a request is turned away because too many chunks are queued."""
+
+    def __init__(self, priority: str, depth: int, retry_after: int):
+        super().__init__(
+            f"Server is busy: {depth} chunks queued ahead of this {priority} request"
+        )
+        self.priority = priority
+        self.depth = depth
+        self.retry_after = retry_after
+
+
+class SchedulerStream:
+    """Chunks of one stream waiting for a slot, in the order they asked."""
+
+    def __init__(self, scheduler: "ChunkScheduler", priority: str):
+        self.scheduler = scheduler
+        self.priority = priority
+        self.waiters: Deque[asyncio.Future] = deque()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one synthesis slot for the duration of the block."""
+        await self.scheduler._acquire(self)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.scheduler._release(time.perf_counter() - start)
+
+
+class ChunkScheduler:
+    """Hands out a fixed number of synthesis slots to chunks of all streams.
+
+    Interactive chunks always go before batch chunks. Within a priority,
+    slots go round-robin between streams, so a long stream gets one chunk
+    in turn with every other waiting stream instead of all its chunks
+    first. Requests are refused at admission once too many chunks of
+    their priority or higher are already waiting.
+    """
+
+    def __init__(self, max_concurrent: int, max_queue_depth: int = 0):
+        """Initialize scheduler.
+
+        Args:
+            max_concurrent: Number of chunks synthesized at the same time
+            max_queue_depth: Waiting chunks above which requests are rejected, 0 for no limit
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queue_depth = max(0, max_queue_depth)
+        self._free = self.max_concurrent
+        # Streams with waiting chunks, per priority, in round-robin order
+        self._ready: Dict[str, Deque[SchedulerStream]] = {p: deque() for p in PRIORITIES}
+        self._waiting: Dict[str, int] = {p: 0 for p in PRIORITIES}
+        # Moving average of how long a chunk holds its slot, for Retry-After
+        self._average_hold = 1.0
+
+    def open_stream(self, priority: str = "interactive") -> SchedulerStream:
+        """Register a stream whose chunks are scheduled together."""
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority: {priority}")
+        return SchedulerStream(self, priority)
+
+    def queue_depth(self, priority: str = "interactive") -> int:
+        """Number of chunks a new chunk of this priority would wait behind."""
+        index = PRIORITIES.index(priority)
+        return sum(self._waiting[p] for p in PRIORITIES[: index + 1])
+
+    def retry_after(self, depth: int) -> int:
+        """Estimate in seconds until a queue of depth chunks has drained."""
+        return max(1, math.ceil(depth * self._average_hold / self.max_concurrent))
+
+    def check_admission(self, priority: str = "interactive") -> None:
+        """Reject a new request if its priority already has a full queue.
+
+        Raises:
+            SchedulerFullError: If max_queue_depth chunks are already waiting
+        """
+        if not self.max_queue_depth:
+            return
+        depth = self.queue_depth(priority)
+        if depth >= self.max_queue_depth:
+            REJECTED.inc(priority=priority)
+            raise SchedulerFullError(priority, depth, self.retry_after(depth))
+
+    def stats(self) -> Dict[str, object]:
+        """Get slot usage and queue depths."""
+        return {
+            "max_concurrent": self.max_concurrent,
+            "active": self.max_concurrent - self._free,
+            "max_queue_depth": self.max_queue_depth,
+            "waiting": dict(self._waiting),
+            "average_hold_seconds": round(self._average_hold, 3),
+        }
+
+    def waiting_counts(self) -> Dict[Tuple[str], float]:
+        """Get the number of waiting chunks per priority."""
+        return {(priority,): count for priority, count in self._waiting.items()}
+
+    async def _acquire(self, stream: SchedulerStream) -> None:
+        if self._free > 0 and not any(self._waiting.values()):
+            self._free -= 1
+            QUEUE_WAIT_SECONDS.observe(0.0, priority=stream.priority)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        if not stream.waiters:
+            self._ready[stream.priority].append(stream)
+        stream.waiters.append(future)
+        self._waiting[stream.priority] += 1
+        start = time.perf_counter()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just before the cancellation, pass the slot on
+                self._release(None)
+            else:
+                self._remove(stream, future)
+            raise
+        QUEUE_WAIT_SECONDS.observe(time.perf_counter() - start, priority=stream.priority)
+
+    def _remove(self, stream: SchedulerStream, future: asyncio.Future) -> None:
+        if future not in stream.waiters:
+            # Already taken off the queue by _dispatch
+            return
+        stream.waiters.remove(future)
+        self._waiting[stream.priority] -= 1
+        if not stream.waiters:
+            self._ready[stream.priority].remove(stream)
+
+    def _release(self, held: Optional[float]) -> None:
+        if held is not None:
+            self._average_hold = 0.9 * self._average_hold + 0.1 * held
+        self._free += 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        for priority in PRIORITIES:
+            ready = self._ready[priority]
+            while ready and self._free > 0:
+                stream = ready.popleft()
+                future = stream.waiters.popleft()
+                self._waiting[priority] -= 1
+                if stream.waiters:
+                    # Back of the line until every other stream had a turn
+                    ready.append(stream)
+                if future.done():
+                    # Cancelled, its task has not run its handler yet
+                    continue
+                self._free -= 1
+                future.set_result(None)
+
+
+_instance: Optional[ChunkScheduler] = None
+
+
+def get_scheduler() -> ChunkScheduler:
+    """Get the global chunk scheduler, sized from settings."""
+    global _instance
+    if _instance is None:
+        _instance = ChunkScheduler(
+            settings.max_concurrent_chunks, settings.scheduler_max_queue_depth
+        )
+    return _instance
+
+
+def _collect_waiting() -> Dict[Tuple[str], float]:
+    return _instance.waiting_counts() if _instance is not None else {}
+
+
+registry.gauge(
+    "kokoro_scheduler_queue_depth",
+    "Chunks waiting for a synthesis slot",
+    ["priority"],
+    collect=_collect_waiting,
+)
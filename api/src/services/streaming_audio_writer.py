@@ -14,12 +14,18 @@ from pydub import AudioSegment
 class StreamingAudioWriter:
     """Handles streaming audio format conversions"""
 
-    def __init__(self, format: str, sample_rate: int, channels: int = 1):
+    def __init__(
+        self, format: str, sample_rate: int, channels: int = 1, bit_rate: int = 128000
+    ):
         self.format = format.lower()
         self.sample_rate = sample_rate
         self.channels = channels
+        self.bit_rate = bit_rate
         self.bytes_written = 0
         self.pts = 0
+        self.closed = False
+        # Set once audio was written or the stream finalized, pcm keeps no pts
+        self._used = False
 
         codec_map = {
             "wav": "pcm_s16le",
@@ -52,11 +58,26 @@ class StreamingAudioWriter:
                 )
                 # Set bit_rate only for codecs where it's applicable and useful
                 if self.format in ['mp3', 'aac', 'opus']:
-                    self.stream.bit_rate = 128000
+                    self.stream.bit_rate = self.bit_rate
         else:
             raise ValueError(f"Unsupported format: {self.format}") # Use self.format here
 
+    def prewarm(self) -> None:
+        """Open the codec and write the container header ahead of the first chunk.
+
+        The header is buffered and returned with the first write_chunk call,
+        so the output bytes are the same as for a writer that was not prewarmed.
+        """
+        if hasattr(self, "container"):
+            self.container.start_encoding()
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether no audio has been written yet, so the writer can be reused."""
+        return not self.closed and not self._used
+
     def close(self):
+        self.closed = True
         if hasattr(self, "container"):
             self.container.close()
 
@@ -72,6 +93,8 @@ class StreamingAudioWriter:
             audio_data: Audio data to write, or None if finalizing
             finalize: Whether this is the final write to close the stream
         """
+        if finalize or (audio_data is not None and len(audio_data) > 0):
+            self._used = True
 
         if finalize:
             if self.format != "pcm":
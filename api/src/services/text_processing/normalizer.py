@@ -187,9 +187,98 @@ NUMBER_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
+# Whitespace-free tokens that may contain a URL or email address. The full
+# patterns backtrack at every position, so they only run on these tokens
+URL_CANDIDATE_PATTERN = re.compile(r"(?<!\S)(?=\S*?(?:\.\w|(?i:localhost)))\S+")
+EMAIL_CANDIDATE_PATTERN = re.compile(r"(?<!\S)(?=\S*?@)\S+")
+
+OPTIONAL_PLURAL_PATTERN = re.compile(r"\(s\)")
+
+PHONE_PATTERN = re.compile(
+    r"(\+?\d{1,2})?([ .-]?)(\(?\d{3}\)?)[\s.-](\d{3})[\s.-](\d{4})"
+)
+
+# Quotes, brackets and CJK punctuation, applied in one str.translate
+CHAR_REPLACEMENTS = str.maketrans(
+    {
+        chr(8216): "'",
+        chr(8217): "'",
+        "«": '"',
+        "»": '"',
+        chr(8220): '"',
+        chr(8221): '"',
+        **{a: b + " " for a, b in zip("、。！，：；？–", ",.!,:;?-")},
+    }
+)
+
+# Whitespace runs other than a single space
+WHITESPACE_PATTERN = re.compile(r"\s{2,}|[^\S ]")
+OTHER_WHITESPACE_PATTERN = re.compile(r"[^\S \n]")
+MULTI_SPACE_PATTERN = re.compile(r"  +")
+BLANK_LINE_PATTERN = re.compile(r"(?<=\n) +(?=\n)")
+
+# Titles, abbreviations, common words and thousands separators, in the order
+# they used to be applied one after another
+WORD_RULES = ["doctor", "mister", "miss", "mrs", "etc", "yeah", "digit_comma"]
+WORD_PATTERN = re.compile(
+    r"(?P<doctor>\bD[Rr]\.(?= [A-Z]))"
+    r"|(?P<mister>\b(?:Mr\.|MR\.(?= [A-Z])))"
+    r"|(?P<miss>\b(?:Ms\.|MS\.(?= [A-Z])))"
+    r"|(?P<mrs>\b(?:Mrs\.|MRS\.(?= [A-Z])))"
+    r"|(?P<etc>\betc\.(?! [A-Z]))"
+    r"|(?P<yeah>(?i:\byeah?\b))"
+    r"|(?P<digit_comma>(?<=\d),(?=\d))"
+)
+WORD_REPLACEMENTS = {
+    "doctor": "Doctor",
+    "mister": "Mister",
+    "miss": "Miss",
+    "mrs": "Mrs",
+    "etc": "etc",
+    "digit_comma": "",
+}
+
+DECIMAL_PATTERN = re.compile(r"\d*\.\d+")
+
+SYMBOL_TRANSLATION = str.maketrans(SYMBOL_REPLACEMENTS)
+
+# Ranges, unit suffixes and possessives after numbers and capitals
+FORMAT_PATTERN = re.compile(
+    r"(?P<range>(?<=\d)-(?=\d))"
+    r"|(?P<spaced_s>(?<=\d)S)"
+    r"|(?P<possessive>(?<=[BCDFGHJ-NP-TV-Z])'?s\b)"
+    # The possessive rule used to run first and could put an apostrophe right
+    # after this S, so a following lowercase possessive s counts as a boundary
+    r"|(?P<x_possessive>(?<=X')S(?:\b|(?=s\b)))"
+)
+
+# Dotted initialisms followed by a lowercase word, and dots between letters
+INITIALISM_PATTERN = re.compile(
+    r"(?P<initialism>(?:[A-Za-z]\.){2,} [a-z])|(?i:(?<=[A-Z])\.(?=[A-Z]))"
+)
+
+EXTRA_WHITESPACE_PATTERN = re.compile(r"\s{2,}")
+
 INFLECT_ENGINE = inflect.engine()
 
 
+# inflect type checks every call at runtime and documents repeat the same
+# numbers and units, so its conversions are memoized
+@lru_cache(maxsize=4096, typed=True)
+def number_to_words(*args, **kwargs) -> str:
+    return INFLECT_ENGINE.number_to_words(*args, **kwargs)
+
+
+@lru_cache(maxsize=1024, typed=True)
+def plural(*args, **kwargs) -> str:
+    return INFLECT_ENGINE.plural(*args, **kwargs)
+
+
+@lru_cache(maxsize=1024, typed=True)
+def no(*args, **kwargs) -> str:
+    return INFLECT_ENGINE.no(*args, **kwargs)
+
+
 def handle_units(u: re.Match[str]) -> str:
     """Converts units to their full form"""
     unit_string = u.group(6).strip()
@@ -205,7 +294,7 @@ def handle_units(u: re.Match[str]) -> str:
                 unit[0] = unit[0][:-3] + "byte"
 
         number = u.group(1).strip()
-        unit[0] = INFLECT_ENGINE.no(unit[0], number)
+        unit[0] = no(unit[0], number)
     return " ".join(unit)
 
 
@@ -232,7 +321,7 @@ def translate_multiplier(multiplier: str) -> str:
 def split_four_digit(number: float):
     part1 = str(conditional_int(number))[:2]
     part2 = str(conditional_int(number))[2:]
-    return f"{INFLECT_ENGINE.number_to_words(part1)} {INFLECT_ENGINE.number_to_words(part2)}"
+    return f"{number_to_words(part1)} {number_to_words(part2)}"
 
 
 def handle_numbers(n: re.Match[str]) -> str:
@@ -260,7 +349,7 @@ def handle_numbers(n: re.Match[str]) -> str:
         ):
             return split_four_digit(number)
 
-    return f"{INFLECT_ENGINE.number_to_words(number)}{multiplier}"
+    return f"{number_to_words(number)}{multiplier}"
 
 
 def handle_money(m: re.Match[str]) -> str:
@@ -284,11 +373,11 @@ def handle_money(m: re.Match[str]) -> str:
         multiplier = f" {multiplier}"
 
     if number % 1 == 0 or multiplier != "":
-        text_number = f"{INFLECT_ENGINE.number_to_words(conditional_int(number))}{multiplier} {INFLECT_ENGINE.plural(bill, count=number)}"
+        text_number = f"{number_to_words(conditional_int(number))}{multiplier} {plural(bill, count=number)}"
     else:
         sub_number = int(str(number).split(".")[-1].ljust(2, "0"))
 
-        text_number = f"{INFLECT_ENGINE.number_to_words(int(math.floor(number)))} {INFLECT_ENGINE.plural(bill, count=number)} and {INFLECT_ENGINE.number_to_words(sub_number)} {INFLECT_ENGINE.plural(coin, count=sub_number)}"
+        text_number = f"{number_to_words(int(math.floor(number)))} {plural(bill, count=number)} and {number_to_words(sub_number)} {plural(coin, count=sub_number)}"
 
     return text_number
 
@@ -363,15 +452,15 @@ def handle_phone_number(p: re.Match[str]) -> str:
     country_code = ""
     if p[0] is not None:
         p[0] = p[0].replace("+", "")
-        country_code += INFLECT_ENGINE.number_to_words(p[0])
+        country_code += number_to_words(p[0])
 
-    area_code = INFLECT_ENGINE.number_to_words(
+    area_code = number_to_words(
         p[2].replace("(", "").replace(")", ""), group=1, comma=""
     )
 
-    telephone_prefix = INFLECT_ENGINE.number_to_words(p[3], group=1, comma="")
+    telephone_prefix = number_to_words(p[3], group=1, comma="")
 
-    line_number = INFLECT_ENGINE.number_to_words(p[4], group=1, comma="")
+    line_number = number_to_words(p[4], group=1, comma="")
 
     return ",".join([country_code, area_code, telephone_prefix, line_number])
 
@@ -382,9 +471,9 @@ def handle_time(t: re.Match[str]) -> str:
     time_parts = t[0].split(":")
 
     numbers = []
-    numbers.append(INFLECT_ENGINE.number_to_words(time_parts[0].strip()))
+    numbers.append(number_to_words(time_parts[0].strip()))
 
-    minute_number = INFLECT_ENGINE.number_to_words(time_parts[1].strip())
+    minute_number = number_to_words(time_parts[1].strip())
     if int(time_parts[1]) < 10:
         if int(time_parts[1]) != 0:
             numbers.append(f"oh {minute_number}")
@@ -393,8 +482,8 @@ def handle_time(t: re.Match[str]) -> str:
 
     half = ""
     if len(time_parts) > 2:
-        seconds_number = INFLECT_ENGINE.number_to_words(time_parts[2].strip())
-        second_word = INFLECT_ENGINE.plural("second", int(time_parts[2].strip()))
+        seconds_number = number_to_words(time_parts[2].strip())
+        second_word = plural("second", int(time_parts[2].strip()))
         numbers.append(f"and {seconds_number} {second_word}")
     else:
         if t[2] is not None:
@@ -406,16 +495,77 @@ def handle_time(t: re.Match[str]) -> str:
     return " ".join(numbers) + half
 
 
+@lru_cache(maxsize=256)
+def clean_whitespace(run: str) -> str:
+    """Normalize a run of whitespace characters
+
+    Newlines become spaces, so "\n\n" turns into two spaces and later rules
+    still see the gap before the final collapse.
+    """
+    run = OTHER_WHITESPACE_PATTERN.sub(" ", run)
+    run = MULTI_SPACE_PATTERN.sub(" ", run)
+    run = BLANK_LINE_PATTERN.sub("", run)
+    return run.replace("\n", " ")
+
+
+def handle_whitespace(w: re.Match[str]) -> str:
+    return clean_whitespace(w.group())
+
+
+def replace_word_rules(text: str) -> str:
+    """Apply the title, abbreviation, yeah and digit comma rules in one pass"""
+    # (end, rule index) of the previous replacement. A rule that starts with
+    # \b right where an earlier rule's replacement ended would not have
+    # matched when the rules ran one after another, since all replacements
+    # end in a letter where the original text ended in a dot
+    previous = [-1, len(WORD_RULES)]
+
+    def dispatch(m: re.Match[str]) -> str:
+        rule = m.lastgroup
+        index = WORD_RULES.index(rule)
+        if rule != "digit_comma" and m.start() == previous[0] and previous[1] < index:
+            previous[0] = -1
+            return m.group()
+        previous[0], previous[1] = m.end(), index
+        if rule == "yeah":
+            return m.group()[0] + "e'a"
+        return WORD_REPLACEMENTS[rule]
+
+    return WORD_PATTERN.sub(dispatch, text)
+
+
+def handle_format(f: re.Match[str]) -> str:
+    rule = f.lastgroup
+    if rule == "range":
+        return " to "
+    if rule == "spaced_s":
+        return " S"
+    if rule == "possessive":
+        # The X possessive rule used to turn "X'S" back into "X's" afterwards
+        return "'s" if f.string[f.start() - 1] == "X" else "'S"
+    return "s"
+
+
+def handle_initialism(i: re.Match[str]) -> str:
+    if i.lastgroup == "initialism":
+        return i.group().replace(".", "-")
+    return "-"
+
+
 def normalize_text(text: str, normalization_options: NormalizationOptions) -> str:
     """Normalize text for TTS processing"""
     
     # Handle email addresses first if enabled
-    if normalization_options.email_normalization:
-        text = EMAIL_PATTERN.sub(handle_email, text)
+    if normalization_options.email_normalization and "@" in text:
+        text = EMAIL_CANDIDATE_PATTERN.sub(
+            lambda m: EMAIL_PATTERN.sub(handle_email, m.group()), text
+        )
 
     # Handle URLs if enabled
     if normalization_options.url_normalization:
-        text = URL_PATTERN.sub(handle_url, text)
+        text = URL_CANDIDATE_PATTERN.sub(
+            lambda m: URL_PATTERN.sub(handle_url, m.group()), text
+        )
 
     # Pre-process numbers with units if enabled
     if normalization_options.unit_normalization:
@@ -423,24 +573,14 @@ def normalize_text(text: str, normalization_options: NormalizationOptions) -> st
 
     # Replace optional pluralization
     if normalization_options.optional_pluralization_normalization:
-        text = re.sub(r"\(s\)", "s", text)
+        text = OPTIONAL_PLURAL_PATTERN.sub("s", text)
 
     # Replace phone numbers:
     if normalization_options.phone_normalization:
-        text = re.sub(
-            r"(\+?\d{1,2})?([ .-]?)(\(?\d{3}\)?)[\s.-](\d{3})[\s.-](\d{4})",
-            handle_phone_number,
-            text,
-        )
+        text = PHONE_PATTERN.sub(handle_phone_number, text)
 
-    # Replace quotes and brackets (additional cleanup)
-    text = text.replace(chr(8216), "'").replace(chr(8217), "'")
-    text = text.replace("«", chr(8220)).replace("»", chr(8221))
-    text = text.replace(chr(8220), '"').replace(chr(8221), '"')
-
-    # Handle CJK punctuation and some non standard chars
-    for a, b in zip("、。！，：；？–", ",.!,:;?-"):
-        text = text.replace(a, b + " ")
+    # Replace quotes and brackets, CJK punctuation and some non standard chars
+    text = text.translate(CHAR_REPLACEMENTS)
 
     # Handle simple time in the format of HH:MM:SS (am/pm)
     text = TIME_PATTERN.sub(
@@ -448,28 +588,12 @@ def normalize_text(text: str, normalization_options: NormalizationOptions) -> st
         text,
     )
 
-    # Clean up whitespace
-    text = re.sub(r"[^\S \n]", " ", text)
-    text = re.sub(r"  +", " ", text)
-    text = re.sub(r"(?<=\n) +(?=\n)", "", text)
-
-    # Handle special characters that might cause audio artifacts first
-    # Replace newlines with spaces (or pauses if needed)
-    text = text.replace('\n', ' ')
-    text = text.replace('\r', ' ')
-    
-    # Handle titles and abbreviations
-    text = re.sub(r"\bD[Rr]\.(?= [A-Z])", "Doctor", text)
-    text = re.sub(r"\b(?:Mr\.|MR\.(?= [A-Z]))", "Mister", text)
-    text = re.sub(r"\b(?:Ms\.|MS\.(?= [A-Z]))", "Miss", text)
-    text = re.sub(r"\b(?:Mrs\.|MRS\.(?= [A-Z]))", "Mrs", text)
-    text = re.sub(r"\betc\.(?! [A-Z])", "etc", text)
+    # Clean up whitespace and replace newlines with spaces
+    text = WHITESPACE_PATTERN.sub(handle_whitespace, text)
 
-    # Handle common words
-    text = re.sub(r"(?i)\b(y)eah?\b", r"\1e'a", text)
-
-    # Handle numbers and money BEFORE replacing special characters
-    text = re.sub(r"(?<=\d),(?=\d)", "", text)
+    # Handle titles, abbreviations and common words, and remove thousands
+    # separators before numbers and money are processed
+    text = replace_word_rules(text)
 
     text = MONEY_PATTERN.sub(
         handle_money,
@@ -478,23 +602,16 @@ def normalize_text(text: str, normalization_options: NormalizationOptions) -> st
 
     text = NUMBER_PATTERN.sub(handle_numbers, text)
 
-    text = re.sub(r"\d*\.\d+", handle_decimal, text)
+    text = DECIMAL_PATTERN.sub(handle_decimal, text)
 
     # Handle other problematic symbols AFTER money/number processing
     if normalization_options.replace_remaining_symbols:
-        for symbol, replacement in SYMBOL_REPLACEMENTS.items():
-            text = text.replace(symbol, replacement)
+        text = text.translate(SYMBOL_TRANSLATION)
 
     # Handle various formatting
-    text = re.sub(r"(?<=\d)-(?=\d)", " to ", text)
-    text = re.sub(r"(?<=\d)S", " S", text)
-    text = re.sub(r"(?<=[BCDFGHJ-NP-TV-Z])'?s\b", "'S", text)
-    text = re.sub(r"(?<=X')S\b", "s", text)
-    text = re.sub(
-        r"(?:[A-Za-z]\.){2,} [a-z]", lambda m: m.group().replace(".", "-"), text
-    )
-    text = re.sub(r"(?i)(?<=[A-Z])\.(?=[A-Z])", "-", text)
+    text = FORMAT_PATTERN.sub(handle_format, text)
+    text = INITIALISM_PATTERN.sub(handle_initialism, text)
 
-    text = re.sub(r"\s{2,}", " ", text)
+    text = EXTRA_WHITESPACE_PATTERN.sub(" ", text)
 
     return text
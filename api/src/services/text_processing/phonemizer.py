@@ -1,13 +1,20 @@
+import os
 import re
 from abc import ABC, abstractmethod
+from typing import List
 
 import phonemizer
+from phonemizer.backend.espeak.wrapper import EspeakWrapper
 
+from ...core.phoneme_cache import get_phoneme_cache
 from .normalizer import normalize_text
 from ...structures.schemas import NormalizationOptions
 
 phonemizers = {}
 
+# Fewest texts per worker before a batch is split across processes
+MIN_TEXTS_PER_JOB = 32
+
 
 class PhonemizerBackend(ABC):
     """Abstract base class for phonemization backends"""
@@ -51,8 +58,24 @@ class EspeakBackend(PhonemizerBackend):
         """
         # Phonemize text
         ps = self.backend.phonemize([text])
-        ps = ps[0] if ps else ""
+        return self._postprocess(ps[0] if ps else "")
+
+    def phonemize_batch(self, texts: List[str], njobs: int = 1) -> List[str]:
+        """Convert several texts to phonemes in one espeak call
+
+        Args:
+            texts: Non-empty texts to convert to phonemes
+            njobs: Number of worker processes to split the texts across
+
+        Returns:
+            Phonemized texts, in input order
+        """
+        if njobs > 1:
+            _export_espeak_paths()
+        ps = self.backend.phonemize(texts, njobs=njobs)
+        return [self._postprocess(p) for p in ps]
 
+    def _postprocess(self, ps: str) -> str:
         # Handle special cases
         ps = ps.replace("kəkˈoːɹoʊ", "kˈoʊkəɹoʊ").replace("kəkˈɔːɹəʊ", "kˈəʊkəɹəʊ")
         ps = ps.replace("ʲ", "j").replace("r", "ɹ").replace("x", "k").replace("ɬ", "l")
@@ -66,6 +89,17 @@ class EspeakBackend(PhonemizerBackend):
         return ps.strip()
 
 
+def _export_espeak_paths() -> None:
+    """Pass the espeak library chosen in this process on to worker processes.
+
+    The library is usually set with EspeakWrapper.set_library (misaki points
+    it at espeakng_loader), which spawned phonemizer workers do not inherit.
+    """
+    os.environ.setdefault("PHONEMIZER_ESPEAK_LIBRARY", str(EspeakWrapper.library()))
+    if EspeakWrapper._ESPEAK_DATA_PATH:
+        os.environ.setdefault("ESPEAK_DATA_PATH", str(EspeakWrapper._ESPEAK_DATA_PATH))
+
+
 def create_phonemizer(language: str = "a") -> PhonemizerBackend:
     """Factory function to create phonemizer backend
 
@@ -101,7 +135,40 @@ def phonemize(text: str, language: str = "a") -> str:
     
     if language not in phonemizers:
         phonemizers[language] = create_phonemizer(language)
-    
-    result = phonemizers[language].phonemize(text)
+
     # Final strip to ensure no leading/trailing spaces in phonemes
-    return result.strip()
+    return get_phoneme_cache().get_or_compute(
+        "espeak", language, text, lambda text: phonemizers[language].phonemize(text).strip()
+    )
+
+
+def phonemize_batch(texts: List[str], language: str = "a", njobs: int = 1) -> List[str]:
+    """Convert several texts to phonemes, sending all uncached ones to espeak at once
+
+    Args:
+        texts: Texts to convert to phonemes
+        language: Language code ('a' for US English, 'b' for British English)
+        njobs: Number of worker processes for large batches
+
+    Returns:
+        Phonemized texts, in input order, each equal to phonemize(text, language)
+    """
+    texts = [text.strip() for text in texts]
+    if language not in phonemizers:
+        phonemizers[language] = create_phonemizer(language)
+
+    cache = get_phoneme_cache()
+    results = [cache.get("espeak", language, text) if text else "" for text in texts]
+    missing = sorted({text for text, result in zip(texts, results) if result is None})
+    if missing:
+        njobs = max(1, min(njobs, len(missing) // MIN_TEXTS_PER_JOB))
+        phonemized = dict(
+            zip(missing, phonemizers[language].phonemize_batch(missing, njobs=njobs))
+        )
+        for text, ps in phonemized.items():
+            cache.put("espeak", language, text, ps)
+        results = [
+            phonemized[text] if result is None else result
+            for text, result in zip(texts, results)
+        ]
+    return results
@@ -0,0 +1,123 @@
+"""Worker processes that normalize and phonemize long texts in parallel."""
+
+import asyncio
+import multiprocessing
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, AsyncIterator, Callable, Deque, Iterable, Optional
+
+from loguru import logger
+
+from ...core.config import settings
+from ...structures.schemas import NormalizationOptions
+
+
+def _init_worker() -> None:
+    """Load inflect and the espeak backends once per worker process."""
+    from .text_processor import process_piece
+
+    process_piece("Warm up 1 worker at 5:00 pm.", "a", NormalizationOptions())
+
+
+def _ping() -> None:
+    pass
+
+
+class TextProcessPool:
+    """Spreads pieces of long texts over a pool of prewarmed worker processes.
+
+    Normalization and espeak hold the GIL, so in the server process a long
+    document occupies one core however many are free. Workers are spawned
+    rather than forked, as the server runs threads whose locks a forked
+    child could inherit held.
+    """
+
+    def __init__(self, workers: int, min_chars: int):
+        """Initialize pool.
+
+        Args:
+            workers: Number of worker processes, 0 disables the pool
+            min_chars: Minimum text length handed to the workers
+        """
+        self.workers = max(0, workers)
+        self.min_chars = min_chars
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0
+
+    def should_use(self, text: str) -> bool:
+        """Whether text is long enough to be worth sending to the workers."""
+        return self.enabled and len(text) >= self.min_chars
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                )
+            return self._executor
+
+    def prewarm(self) -> None:
+        """Start all workers in the background, ahead of the first long text."""
+        if not self.enabled:
+            return
+        executor = self._get_executor()
+        for _ in range(self.workers):
+            executor.submit(_ping)
+        logger.info(f"Starting {self.workers} text processing workers")
+
+    async def map(
+        self, fn: Callable[..., Any], items: Iterable[Any], *args: Any
+    ) -> AsyncIterator[Any]:
+        """Run fn(item, *args) in the workers, yielding results in item order.
+
+        Items are pulled lazily with up to twice as many in flight as there
+        are workers, and results are yielded as soon as they are next in
+        order, so the first result does not wait for the rest.
+        """
+        executor = self._get_executor()
+        pending: Deque[asyncio.Future] = deque()
+        try:
+            for item in items:
+                pending.append(asyncio.wrap_future(executor.submit(fn, item, *args)))
+                while pending and (pending[0].done() or len(pending) >= 2 * self.workers):
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        except BrokenProcessPool:
+            # A worker died, start a fresh pool for the next request
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+            executor.shutdown(wait=False)
+            raise
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+_instance: Optional[TextProcessPool] = None
+
+
+def get_text_process_pool() -> TextProcessPool:
+    """Get the global text process pool, sized from settings."""
+    global _instance
+    if _instance is None:
+        _instance = TextProcessPool(
+            settings.text_process_workers, settings.text_process_min_chars
+        )
+    return _instance
@@ -1,16 +1,28 @@
 """Unified text processing for TTS with smart chunking."""
 
+import math
 import re
 import time
-from typing import AsyncGenerator, Dict, List, Tuple, Optional
+from typing import (
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 from loguru import logger
 
 from ...core.config import settings
+from ...core.metrics import STAGE_SECONDS
 from ...structures.schemas import NormalizationOptions
 from .normalizer import normalize_text
-from .phonemizer import phonemize
-from .vocabulary import tokenize
+from .phonemizer import phonemize, phonemize_batch
+from .process_pool import get_text_process_pool
+from .vocabulary import SPACE_TOKEN, tokenize
 
 # Pre-compiled regex patterns for performance
 # Updated regex to be more strict and avoid matching isolated brackets
@@ -18,6 +30,24 @@ from .vocabulary import tokenize
 CUSTOM_PHONEMES = re.compile(r"(\[[^\[\]]*?\]\(\/[^\/\(\)]*?\/\))")
 # Pattern to find pause tags like [pause:0.5s]
 PAUSE_TAG_PATTERN = re.compile(r"\[pause:(\d+(?:\.\d+)?)s\]", re.IGNORECASE)
+# Whitespace after sentence-ending punctuation, where raw text may be cut
+SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
+
+# Raw text parts are normalized and phonemized in pieces, starting small so
+# the first chunk is ready early and doubling up to the max for throughput
+STREAM_FIRST_PIECE_CHARS = 400
+STREAM_MAX_PIECE_CHARS = 8000
+# Raw text on each side of a cut checked for normalization rules spanning it
+CUT_CHECK_CHARS = 200
+
+
+def get_phonemizer_language(lang_code: str) -> str:
+    """Map a pipeline language code to the espeak phonemizer used for splitting.
+
+    British English gets its own phonemizer, everything else is counted with
+    US English as before.
+    """
+    return "b" if lang_code in ("b", "en-gb") else "a"
 
 
 def process_text_chunk(
@@ -52,7 +82,8 @@ def process_text_chunk(
         t1 = time.time()
 
         t0 = time.time()
-        phonemes = phonemize(text, language)
+        with STAGE_SECONDS.time(stage="g2p"):
+            phonemes = phonemize(text, language)
         # Strip phonemes result to ensure no extra spaces
         phonemes = phonemes.strip()
         t1 = time.time()
@@ -69,6 +100,23 @@ def process_text_chunk(
     return tokens
 
 
+def process_text_chunks(texts: List[str], language: str = "a") -> List[List[int]]:
+    """Phonemize and tokenize several chunks with one batched espeak call.
+
+    Args:
+        texts: Text chunks to process
+        language: Language code for phonemization
+
+    Returns:
+        List of token IDs per chunk, same as process_text_chunk for each
+    """
+    if not texts:
+        return []
+    with STAGE_SECONDS.time(stage="g2p"):
+        phonemes = phonemize_batch(texts, language, njobs=settings.phonemizer_njobs)
+    return [tokenize(ps) for ps in phonemes]
+
+
 async def yield_chunk(
     text: str, tokens: List[int], chunk_count: int
 ) -> Tuple[str, List[int]]:
@@ -99,19 +147,20 @@ def process_text(text: str, language: str = "a") -> List[int]:
     return process_text_chunk(text, language)
 
 
-def get_sentence_info(
-    text: str, lang_code: str = "a"
-) -> List[Tuple[str, List[int], int]]:
-    """Process all sentences and return info"""
-    # Detect Chinese text
-    is_chinese = lang_code.startswith("z") or re.search(r"[\u4e00-\u9fff]", text)
-    if is_chinese:
+def is_chinese_text(text: str, lang_code: str = "a") -> bool:
+    """Whether text is split on Chinese punctuation."""
+    return bool(lang_code.startswith("z") or re.search(r"[\u4e00-\u9fff]", text))
+
+
+def split_sentences(text: str, lang_code: str = "a") -> List[str]:
+    """Split text into stripped sentences, each ending with its punctuation."""
+    if is_chinese_text(text, lang_code):
         # Split using Chinese punctuation
         sentences = re.split(r"([，。！？；])+", text)
     else:
         sentences = re.split(r"([.!?;:])(?=\s|$)", text)
 
-    results = []
+    fulls = []
     for i in range(0, len(sentences), 2):
         sentence = sentences[i].strip()
         punct = sentences[i + 1] if i + 1 < len(sentences) else ""
@@ -122,9 +171,167 @@ def get_sentence_info(
         full = full.strip()
         if not full:  # Skip if empty after stripping
             continue
-        tokens = process_text_chunk(full)
-        results.append((full, tokens, len(tokens)))
-    return results
+        fulls.append(full)
+    return fulls
+
+
+def get_sentence_info(
+    text: str, lang_code: str = "a"
+) -> List[Tuple[str, List[int], int]]:
+    """Process all sentences and return info"""
+    fulls = split_sentences(text, lang_code)
+
+    # Phonemize all sentences of the text in one espeak call
+    token_lists = process_text_chunks(fulls, get_phonemizer_language(lang_code))
+    return [(full, tokens, len(tokens)) for full, tokens in zip(fulls, token_lists)]
+
+
+def normalize_part(
+    text: str, lang_code: str, normalization_options: NormalizationOptions
+) -> str:
+    """Normalize raw text, leaving custom phoneme markup untouched."""
+    if not (
+        settings.advanced_text_normalization
+        and normalization_options.normalize
+        and lang_code in ["a", "b", "en-us", "en-gb"]
+    ):
+        return text
+    processed_text = CUSTOM_PHONEMES.split(text)
+    for index in range(0, len(processed_text), 2):
+        processed_text[index] = normalize_text(processed_text[index], normalization_options)
+    return "".join(processed_text).strip()
+
+
+def is_safe_cut(text: str, cut: int, process: Callable[[str], List[str]]) -> bool:
+    """Check that cutting raw text at cut gives the same sentences as not cutting.
+
+    Normalization rules only look a few characters around a match, so it is
+    enough to compare the text on both sides of the cut with and without it.
+    """
+    left = text[max(0, cut - CUT_CHECK_CHARS) : cut]
+    right = text[cut : cut + CUT_CHECK_CHARS]
+    return process(left + right) == process(left) + process(right)
+
+
+def iter_pieces(text: str, process: Callable[[str], List[str]]) -> Iterator[str]:
+    """Cut raw text at sentence breaks into pieces that process like the whole.
+
+    Args:
+        text: Raw text part
+        process: Normalizes and splits raw text into sentences
+
+    Yields:
+        Consecutive pieces of text, growing from STREAM_FIRST_PIECE_CHARS
+    """
+    start = 0
+    size = STREAM_FIRST_PIECE_CHARS
+    for match in SENTENCE_BREAK.finditer(text):
+        cut = match.end()
+        if cut - start < size or cut == len(text):
+            continue
+        if not is_safe_cut(text, cut, process):
+            continue
+        yield text[start:cut]
+        start = cut
+        size = min(size * 2, STREAM_MAX_PIECE_CHARS)
+    yield text[start:]
+
+
+def iter_text_pieces(
+    text: str, lang_code: str, normalization_options: NormalizationOptions
+) -> Iterator[str]:
+    """Cut a raw text part into pieces that can be processed independently."""
+
+    def process(piece: str) -> List[str]:
+        return split_sentences(
+            normalize_part(piece, lang_code, normalization_options), lang_code
+        )
+
+    if is_chinese_text(text, lang_code):
+        # Chinese detection must see the whole part, so it is not cut
+        return iter([text])
+    return iter_pieces(text, process)
+
+
+def process_piece(
+    piece: str, lang_code: str, normalization_options: NormalizationOptions
+) -> List[Tuple[str, List[int], int]]:
+    """Normalize, split and phonemize one piece of raw text."""
+    with STAGE_SECONDS.time(stage="normalize"):
+        processed_text = normalize_part(piece, lang_code, normalization_options)
+    with STAGE_SECONDS.time(stage="split"):
+        return get_sentence_info(processed_text, lang_code=lang_code)
+
+
+def iter_sentence_info(
+    text: str, lang_code: str, normalization_options: NormalizationOptions
+) -> Iterator[Tuple[str, List[int], int]]:
+    """Normalize, split and phonemize a raw text part incrementally.
+
+    Yields the same sentences as get_sentence_info on the whole normalized
+    part, but only processes the text one piece ahead of the consumer, so
+    time to the first chunk does not grow with the length of the text.
+    """
+    for piece in iter_text_pieces(text, lang_code, normalization_options):
+        yield from process_piece(piece, lang_code, normalization_options)
+
+
+async def aiter_sentence_info(
+    text: str, lang_code: str, normalization_options: NormalizationOptions
+) -> AsyncIterator[Tuple[str, List[int], int]]:
+    """Like iter_sentence_info, processing the pieces of long texts in parallel.
+
+    Texts of at least settings.text_process_min_chars are spread over the
+    text process pool when it is enabled, keeping the event loop free while
+    the workers run.
+    """
+    pool = get_text_process_pool()
+    if not pool.should_use(text):
+        for sentence_info in iter_sentence_info(text, lang_code, normalization_options):
+            yield sentence_info
+        return
+
+    pieces = iter_text_pieces(text, lang_code, normalization_options)
+    async for sentences in pool.map(process_piece, pieces, lang_code, normalization_options):
+        for sentence_info in sentences:
+            yield sentence_info
+
+
+class ChunkSizeSchedule:
+    """Token targets for consecutive chunks, ramping up from a small first chunk.
+
+    While ramping, chunks are only bounded from above and each may be at
+    most growth times the size of the previous one, so the next chunk is
+    synthesized while the previous one plays. Once the regular targets are
+    reached, chunks are built exactly as without a schedule.
+    """
+
+    def __init__(self, first_chunk_max_tokens: int = 0, growth: float = 2.0):
+        """Initialize schedule.
+
+        Args:
+            first_chunk_max_tokens: Token budget of the first chunk, 0 to use the regular targets
+            growth: Factor by which the budget grows after each chunk
+        """
+        self.growth = max(growth, 1.1)
+        if 0 < first_chunk_max_tokens < settings.target_max_tokens:
+            self.max_tokens = first_chunk_max_tokens
+        else:
+            self.max_tokens = settings.target_max_tokens
+
+    @property
+    def ramping(self) -> bool:
+        return self.max_tokens < settings.target_max_tokens
+
+    @property
+    def min_tokens(self) -> int:
+        return 0 if self.ramping else settings.target_min_tokens
+
+    def advance(self) -> None:
+        """Move on to the next chunk."""
+        self.max_tokens = min(
+            settings.target_max_tokens, math.ceil(self.max_tokens * self.growth)
+        )
 
 
 def handle_custom_phonemes(s: re.Match[str], phenomes_list: Dict[str, str]) -> str:
@@ -138,9 +345,14 @@ async def smart_split(
     max_tokens: int = settings.absolute_max_tokens,
     lang_code: str = "a",
     normalization_options: NormalizationOptions = NormalizationOptions(),
+    first_chunk_max_tokens: int = 0,
 ) -> AsyncGenerator[Tuple[str, List[int], Optional[float]], None]:
     """Build optimal chunks targeting 300-400 tokens, never exceeding max_tokens.
-    
+
+    With first_chunk_max_tokens set, the first chunk is kept under that many
+    tokens, splitting a long first sentence on commas, and the following
+    chunks grow by settings.chunk_growth_factor up to the regular targets.
+
     Yields:
         Tuple of (text_chunk, tokens, pause_duration_s).
         If pause_duration_s is not None, it's a pause chunk with empty text/tokens.
@@ -148,6 +360,7 @@ async def smart_split(
     """
     start_time = time.time()
     chunk_count = 0
+    sizes = ChunkSizeSchedule(first_chunk_max_tokens, settings.chunk_growth_factor)
     logger.info(f"Starting smart split for {len(text)} chars")
 
     # --- Step 1: Split by Pause Tags FIRST ---
@@ -165,49 +378,44 @@ async def smart_split(
             # Strip leading and trailing spaces to prevent pause tag splitting artifacts
             text_part_raw = text_part_raw.strip()
 
-            # Normalize text (original logic)
-            processed_text = text_part_raw
-            if settings.advanced_text_normalization and normalization_options.normalize:
-                if lang_code in ["a", "b", "en-us", "en-gb"]:
-                    processed_text = CUSTOM_PHONEMES.split(processed_text)
-                    for index in range(0, len(processed_text), 2):
-                        processed_text[index] = normalize_text(processed_text[index], normalization_options)
-
-
-                    processed_text = "".join(processed_text).strip()
-                else:
-                    logger.info(
-                        "Skipping text normalization as it is only supported for english"
-                    )
+            if (
+                settings.advanced_text_normalization
+                and normalization_options.normalize
+                and lang_code not in ["a", "b", "en-us", "en-gb"]
+            ):
+                logger.info(
+                    "Skipping text normalization as it is only supported for english"
+                )
 
-            # Process all sentences (original logic)
-            sentences = get_sentence_info(processed_text, lang_code=lang_code)
+            # Normalize and split sentences one piece at a time, so the first
+            # chunks are yielded before the rest of the part is processed
+            sentences = aiter_sentence_info(text_part_raw, lang_code, normalization_options)
 
             current_chunk = []
             current_tokens = []
             current_count = 0
 
-            for sentence, tokens, count in sentences:
+            async for sentence, tokens, count in sentences:
                 # Handle sentences that exceed max tokens (original logic)
-                if count > max_tokens:
+                if count > max_tokens or (
+                    sizes.ramping and not current_chunk and count > sizes.max_tokens
+                ):
                     # Yield current chunk if any
                     if current_chunk:
                         chunk_text = " ".join(current_chunk).strip()
                         chunk_count += 1
                         logger.debug(
-                            f"Yielding chunk {chunk_count}: '{chunk_text[:50]}{'...' if len(processed_text) > 50 else ''}' ({current_count} tokens)"
+                            f"Yielding chunk {chunk_count}: '{chunk_text[:50]}{'...' if len(chunk_text) > 50 else ''}' ({current_count} tokens)"
                         )
                         yield chunk_text, current_tokens, None
+                        sizes.advance()
                         current_chunk = []
                         current_tokens = []
                         current_count = 0
 
                     # Split long sentence on commas (original logic)
                     clauses = re.split(r"([,])", sentence)
-                    clause_chunk = []
-                    clause_tokens = []
-                    clause_count = 0
-
+                    full_clauses = []
                     for j in range(0, len(clauses), 2):
                         clause = clauses[j].strip()
                         comma = clauses[j + 1] if j + 1 < len(clauses) else ""
@@ -215,17 +423,28 @@ async def smart_split(
                         if not clause:
                             continue
 
-                        full_clause = clause + comma
+                        full_clauses.append(clause + comma)
+
+                    clause_chunk = []
+                    clause_tokens = []
+                    clause_count = 0
 
-                        tokens = process_text_chunk(full_clause)
+                    for full_clause, tokens in zip(
+                        full_clauses,
+                        process_text_chunks(
+                            full_clauses, get_phonemizer_language(lang_code)
+                        ),
+                    ):
                         count = len(tokens)
 
                         # If adding clause keeps us under max and not optimal yet
                         if (
                             clause_count + count <= max_tokens
-                            and clause_count + count <= settings.target_max_tokens
+                            and clause_count + count <= sizes.max_tokens
                         ):
                             clause_chunk.append(full_clause)
+                            if clause_tokens:
+                                clause_tokens.append(SPACE_TOKEN)
                             clause_tokens.extend(tokens)
                             clause_count += count
                         else:
@@ -234,9 +453,10 @@ async def smart_split(
                                 chunk_text = " ".join(clause_chunk).strip()
                                 chunk_count += 1
                                 logger.debug(
-                                    f"Yielding clause chunk {chunk_count}: '{chunk_text[:50]}{'...' if len(processed_text) > 50 else ''}' ({clause_count} tokens)"
+                                    f"Yielding clause chunk {chunk_count}: '{chunk_text[:50]}{'...' if len(chunk_text) > 50 else ''}' ({clause_count} tokens)"
                                 )
                                 yield chunk_text, clause_tokens, None
+                                sizes.advance()
                             clause_chunk = [full_clause]
                             clause_tokens = tokens
                             clause_count = count
@@ -246,37 +466,43 @@ async def smart_split(
                         chunk_text = " ".join(clause_chunk).strip()
                         chunk_count += 1
                         logger.debug(
-                            f"Yielding final clause chunk {chunk_count}: '{chunk_text[:50]}{'...' if len(processed_text) > 50 else ''}' ({clause_count} tokens)"
+                            f"Yielding final clause chunk {chunk_count}: '{chunk_text[:50]}{'...' if len(chunk_text) > 50 else ''}' ({clause_count} tokens)"
                         )
                         yield chunk_text, clause_tokens, None
+                        sizes.advance()
 
                 # Regular sentence handling (original logic)
                 elif (
-                    current_count >= settings.target_min_tokens
-                    and current_count + count > settings.target_max_tokens
+                    current_count >= sizes.min_tokens
+                    and current_count + count > sizes.max_tokens
                 ):
                     # If we have a good sized chunk and adding next sentence exceeds target,
                     # yield current chunk and start new one
                     chunk_text = " ".join(current_chunk).strip()
                     chunk_count += 1
                     logger.info(
-                        f"Yielding chunk {chunk_count}: '{chunk_text[:50]}{'...' if len(processed_text) > 50 else ''}' ({current_count} tokens)"
+                        f"Yielding chunk {chunk_count}: '{chunk_text[:50]}{'...' if len(chunk_text) > 50 else ''}' ({current_count} tokens)"
                     )
                     yield chunk_text, current_tokens, None
+                    sizes.advance()
                     current_chunk = [sentence]
                     current_tokens = tokens
                     current_count = count
-                elif current_count + count <= settings.target_max_tokens:
+                elif current_count + count <= sizes.max_tokens:
                     # Keep building chunk while under target max
                     current_chunk.append(sentence)
+                    if current_tokens:
+                        current_tokens.append(SPACE_TOKEN)
                     current_tokens.extend(tokens)
                     current_count += count
                 elif (
                     current_count + count <= max_tokens
-                    and current_count < settings.target_min_tokens
+                    and current_count < sizes.min_tokens
                 ):
                     # Only exceed target max if we haven't reached minimum size yet
                     current_chunk.append(sentence)
+                    if current_tokens:
+                        current_tokens.append(SPACE_TOKEN)
                     current_tokens.extend(tokens)
                     current_count += count
                 else:
@@ -285,9 +511,10 @@ async def smart_split(
                         chunk_text = " ".join(current_chunk).strip()
                         chunk_count += 1
                         logger.info(
-                            f"Yielding chunk {chunk_count}: '{chunk_text[:50]}{'...' if len(processed_text) > 50 else ''}' ({current_count} tokens)"
+                            f"Yielding chunk {chunk_count}: '{chunk_text[:50]}{'...' if len(chunk_text) > 50 else ''}' ({current_count} tokens)"
                         )
                         yield chunk_text, current_tokens, None
+                        sizes.advance()
                     current_chunk = [sentence]
                     current_tokens = tokens
                     current_count = count
@@ -297,9 +524,10 @@ async def smart_split(
                 chunk_text = " ".join(current_chunk).strip()
                 chunk_count += 1
                 logger.info(
-                    f"Yielding final chunk {chunk_count} for part: '{chunk_text[:50]}{'...' if len(processed_text) > 50 else ''}' ({current_count} tokens)"
+                    f"Yielding final chunk {chunk_count} for part: '{chunk_text[:50]}{'...' if len(chunk_text) > 50 else ''}' ({current_count} tokens)"
                 )
                 yield chunk_text, current_tokens, None
+                sizes.advance()
 
         # --- Handle Pause Part ---
         # Check if the next part is a pause duration string
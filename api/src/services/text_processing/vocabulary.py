@@ -13,6 +13,9 @@ def get_vocab():
 # Initialize vocabulary
 VOCAB = get_vocab()
 
+# Token separating joined sentences, mirrors the space used to join chunk text
+SPACE_TOKEN = VOCAB[" "]
+
 
 def tokenize(phonemes: str) -> list[int]:
     """Convert phonemes string to token IDs
@@ -1,40 +1,59 @@
 """TTS service using model and voice managers."""
 
 import asyncio
-import os
 import re
-import tempfile
 import time
-from typing import AsyncGenerator, List, Optional, Tuple, Union
+from typing import AsyncGenerator, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import torch
 from kokoro import KPipeline
 from loguru import logger
 
+from ..core.cache import LRUCache
 from ..core.config import settings
+from ..core.metrics import AUDIO_SECONDS, CHUNKS, register_cache
 from ..inference.base import AudioChunk
+from ..inference.executor import get_encode_executor
 from ..inference.kokoro_v1 import KokoroV1
 from ..inference.model_manager import get_manager as get_model_manager
 from ..inference.voice_manager import get_manager as get_voice_manager
-from ..structures.schemas import NormalizationOptions
+from ..structures.schemas import NormalizationOptions, WordTimestamp
 from .audio import AudioNormalizer, AudioService
+from .scheduler import SchedulerStream, get_scheduler
 from .streaming_audio_writer import StreamingAudioWriter
 from .text_processing import tokenize
-from .text_processing.text_processor import process_text_chunk, smart_split
+from .text_processing.text_processor import (
+    CUSTOM_PHONEMES,
+    process_text_chunk,
+    smart_split,
+)
+from .text_processing.vocabulary import decode_tokens
+
+# Longest phoneme string the model accepts in a single forward pass
+MAX_PHONEME_LENGTH = 510
 
 
 class TTSService:
     """Text-to-speech service."""
 
-    # Limit concurrent chunk processing
-    _chunk_semaphore = asyncio.Semaphore(4)
-
     def __init__(self, output_dir: str = None):
         """Initialize service."""
         self.output_dir = output_dir
         self.model_manager = None
         self._voice_manager = None
+        # Blended voice tensors keyed by canonical blend
+        self._voice_blends = LRUCache(max_entries=settings.voice_blend_cache_size)
+        # Trimmed int16 audio of previously synthesized chunks, shared across requests
+        self._sentence_cache = LRUCache(
+            max_entries=settings.sentence_cache_max_entries
+            if settings.sentence_cache_enabled
+            else 0,
+            max_bytes=int(settings.sentence_cache_max_mb * 1024 * 1024),
+            size_fn=lambda chunks: sum(audio.nbytes for audio, _ in chunks),
+        )
+        register_cache("voice_blends", self._voice_blends.stats)
+        register_cache("sentences", self._sentence_cache.stats)
 
     @classmethod
     async def create(cls, output_dir: str = None) -> "TTSService":
@@ -49,7 +68,7 @@ class TTSService:
         chunk_text: str,
         tokens: List[int],
         voice_name: str,
-        voice_path: str,
+        voice_path: Union[str, torch.Tensor],
         speed: float,
         writer: StreamingAudioWriter,
         output_format: Optional[str] = None,
@@ -59,9 +78,28 @@ class TTSService:
         normalizer: Optional[AudioNormalizer] = None,
         lang_code: Optional[str] = None,
         return_timestamps: Optional[bool] = False,
+        phonemes: Optional[str] = None,
+        cache_stats: Optional[Dict[str, int]] = None,
+        scheduler_stream: Optional[SchedulerStream] = None,
+        failed_chunks: Optional[List[str]] = None,
     ) -> AsyncGenerator[AudioChunk, None]:
-        """Process tokens into audio."""
-        async with self._chunk_semaphore:
+        """Process tokens into audio.
+
+        If phonemes are given they are fed to the model directly, skipping the
+        pipeline's own G2P pass over chunk_text.
+
+        Kokoro V1 chunks are looked up in the sentence cache first, hits and
+        misses are counted in cache_stats when given.
+
+        The chunk waits for a slot from the scheduler as part of
+        scheduler_stream, or as a stream of its own when none is given.
+
+        Failures are logged and skipped, the chunk text is appended to
+        failed_chunks when given so callers can tell the audio is incomplete.
+        """
+        if scheduler_stream is None:
+            scheduler_stream = get_scheduler().open_stream()
+        async with scheduler_stream.slot():
             try:
                 # Handle stream finalization
                 if is_last:
@@ -92,16 +130,81 @@ class TTSService:
 
                 # Generate audio using pre-warmed model
                 if isinstance(backend, KokoroV1):
+                    cache_key = None
+                    if self._sentence_cache.enabled:
+                        cache_key = (
+                            phonemes or chunk_text,
+                            bool(phonemes),
+                            voice_name,
+                            speed,
+                            lang_code,
+                            volume_multiplier,
+                            bool(return_timestamps),
+                        )
+                        cached = self._sentence_cache.get(cache_key)
+                        if cache_stats is not None:
+                            cache_stats["hits" if cached is not None else "misses"] += 1
+                        if cached is not None:
+                            for audio, word_timestamps in cached:
+                                chunk_data = AudioChunk(
+                                    audio,
+                                    word_timestamps=self._copy_timestamps(
+                                        word_timestamps
+                                    ),
+                                )
+                                if output_format:
+                                    try:
+                                        chunk_data = await AudioService.convert_audio(
+                                            chunk_data,
+                                            output_format,
+                                            writer,
+                                            speed,
+                                            chunk_text,
+                                            is_last_chunk=is_last,
+                                            trim_audio=False,
+                                            normalizer=normalizer,
+                                        )
+                                    except Exception as e:
+                                        logger.error(
+                                            f"Failed to convert audio: {str(e)}"
+                                        )
+                                        if failed_chunks is not None:
+                                            failed_chunks.append(chunk_text)
+                                        continue
+                                yield chunk_data
+                            return
+
+                    generated = []
                     chunk_index = 0
-                    # For Kokoro V1, pass text and voice info with lang_code
-                    async for chunk_data in self.model_manager.generate(
-                        chunk_text,
-                        (voice_name, voice_path),
-                        speed=speed,
-                        lang_code=lang_code,
-                        return_timestamps=return_timestamps,
-                    ):
+                    if phonemes:
+                        # Reuse the phonemes produced while splitting
+                        chunk_generator = self.model_manager.generate_from_tokens(
+                            phonemes,
+                            (voice_name, voice_path),
+                            speed=speed,
+                            lang_code=lang_code,
+                        )
+                    else:
+                        # For Kokoro V1, pass text and voice info with lang_code
+                        chunk_generator = self.model_manager.generate(
+                            chunk_text,
+                            (voice_name, voice_path),
+                            speed=speed,
+                            lang_code=lang_code,
+                            return_timestamps=return_timestamps,
+                        )
+                    async for chunk_data in chunk_generator:
                         chunk_data.audio*=volume_multiplier
+                        chunk_data = AudioService.trim_audio(
+                            chunk_data, chunk_text, speed, is_last, normalizer
+                        )
+                        if cache_key is not None:
+                            generated.append(
+                                (
+                                    chunk_data.audio,
+                                    self._copy_timestamps(chunk_data.word_timestamps),
+                                )
+                            )
                         # For streaming, convert to bytes
                         if output_format:
                             try:
@@ -112,17 +215,20 @@ class TTSService:
                                     speed,
                                     chunk_text,
                                     is_last_chunk=is_last,
+                                    trim_audio=False,
                                     normalizer=normalizer,
                                 )
                                 yield chunk_data
                             except Exception as e:
                                 logger.error(f"Failed to convert audio: {str(e)}")
+                                if failed_chunks is not None:
+                                    failed_chunks.append(chunk_text)
                         else:
-                            chunk_data = AudioService.trim_audio(
-                                chunk_data, chunk_text, speed, is_last, normalizer
-                            )
                             yield chunk_data
                         chunk_index += 1
+                    # Only cache chunks that were generated completely
+                    if cache_key is not None and generated:
+                        self._sentence_cache.put(cache_key, generated)
                 else:
                     # For legacy backends, load voice tensor
                     voice_tensor = await self._voice_manager.load_voice(
@@ -137,10 +243,14 @@ class TTSService:
                     
                     if chunk_data.audio is None:
                         logger.error("Model generated None for audio chunk")
+                        if failed_chunks is not None:
+                            failed_chunks.append(chunk_text)
                         return
 
                     if len(chunk_data.audio) == 0:
                         logger.error("Model generated empty audio chunk")
+                        if failed_chunks is not None:
+                            failed_chunks.append(chunk_text)
                         return
 
                     chunk_data.audio*=volume_multiplier
@@ -160,6 +270,8 @@ class TTSService:
                             yield chunk_data
                         except Exception as e:
                             logger.error(f"Failed to convert audio: {str(e)}")
+                            if failed_chunks is not None:
+                                failed_chunks.append(chunk_text)
                     else:
                         trimmed = AudioService.trim_audio(
                             chunk_data, chunk_text, speed, is_last, normalizer
@@ -167,6 +279,21 @@ class TTSService:
                         yield trimmed
             except Exception as e:
                 logger.error(f"Failed to process tokens: {str(e)}")
+                if failed_chunks is not None:
+                    failed_chunks.append(chunk_text)
+
+    @staticmethod
+    def _copy_timestamps(
+        word_timestamps: Optional[List[WordTimestamp]],
+    ) -> Optional[List[WordTimestamp]]:
+        """Copy timestamps so offsetting them in a stream never touches the cache."""
+        if word_timestamps is None:
+            return None
+        return [timestamp.model_copy() for timestamp in word_timestamps]
+
+    def sentence_cache_info(self) -> Dict[str, object]:
+        """Get sentence cache statistics."""
+        return self._sentence_cache.stats()
 
     async def _load_voice_from_path(self, path: str, weight: float):
         # Check if the path is None and raise a ValueError if it is not
@@ -176,14 +303,20 @@ class TTSService:
         logger.debug(f"Loading voice tensor from path: {path}")
         return torch.load(path, map_location="cpu") * weight
 
-    async def _get_voices_path(self, voice: str) -> Tuple[str, str]:
+    async def _get_voices_path(
+        self, voice: str
+    ) -> Tuple[str, Union[str, torch.Tensor]]:
         """Get voice path, handling combined voices.
 
+        Combined voices are blended once and then served from an in-memory
+        cache keyed by their canonical blend, so repeat requests for the same
+        mix skip loading and combining the component voices.
+
         Args:
             voice: Voice name or combined voice names (e.g., 'af_jadzia+af_jessica')
 
         Returns:
-            Tuple of (voice name to use, voice path to use)
+            Tuple of (voice name to use, voice path or blended voice tensor to use)
 
         Raises:
             RuntimeError: If voice not found
@@ -223,6 +356,12 @@ class TTSService:
             if settings.voice_weight_normalization == False:
                 total_weight = 1
 
+            blend_key = self._get_blend_key(split_voice, total_weight)
+            cached_blend = self._voice_blends.get(blend_key)
+            if cached_blend is not None:
+                logger.debug(f"Using cached voice blend for: {voice}")
+                return voice, cached_blend
+
             # Load the first voice as the starting point for voices to be combined onto
             path = await self._voice_manager.get_voice_path(split_voice[0][0])
             combined_tensor = await self._load_voice_from_path(
@@ -245,16 +384,40 @@ class TTSService:
                 else:
                     combined_tensor -= voice_tensor
 
-            # Save the new combined voice so it can be loaded latter
-            temp_dir = tempfile.gettempdir()
-            combined_path = os.path.join(temp_dir, f"{voice}.pt")
-            logger.debug(f"Saving combined voice to: {combined_path}")
-            torch.save(combined_tensor, combined_path)
-            return voice, combined_path
+            # Keep the blend in memory so it can be reused by later requests
+            logger.debug(f"Caching combined voice: {voice}")
+            self._voice_blends.put(blend_key, combined_tensor)
+            return voice, combined_tensor
         except Exception as e:
             logger.error(f"Failed to get voice path: {e}")
             raise
 
+    @staticmethod
+    def _get_blend_key(
+        split_voice: List[Union[str, Tuple[str, float]]], total_weight: float
+    ) -> Tuple[Tuple[str, float], ...]:
+        """Build a canonical key for a voice blend.
+
+        The key holds the effective weight applied to each voice, summed per
+        voice and sorted by name, so order, repeated voices, weight scaling and
+        the normalization setting all map equivalent blends to the same key.
+
+        Args:
+            split_voice: Parsed voice list of (name, weight) tuples and +/- operators
+            total_weight: Divisor applied to every weight
+
+        Returns:
+            Tuple of (voice name, effective weight) pairs
+        """
+        weights: Dict[str, float] = {}
+        for voice_index in range(0, len(split_voice), 2):
+            voice_name, voice_weight = split_voice[voice_index]
+            sign = -1 if voice_index > 0 and split_voice[voice_index - 1] == "-" else 1
+            weights[voice_name] = (
+                weights.get(voice_name, 0.0) + sign * voice_weight / total_weight
+            )
+        return tuple(sorted((name, round(weight, 6)) for name, weight in weights.items()))
+
     async def generate_audio_stream(
         self,
         text: str,
@@ -266,11 +429,48 @@ class TTSService:
         volume_multiplier: Optional[float] = 1.0,
         normalization_options: Optional[NormalizationOptions] = NormalizationOptions(),
         return_timestamps: Optional[bool] = False,
+        first_chunk_max_tokens: Optional[int] = None,
+        priority: str = "interactive",
+        failed_chunks: Optional[List[str]] = None,
     ) -> AsyncGenerator[AudioChunk, None]:
-        """Generate and stream audio chunks."""
+        """Generate and stream audio chunks.
+
+        first_chunk_max_tokens keeps the first chunk small for faster first
+        audio, None uses settings.first_chunk_max_tokens and 0 disables it.
+        Chunks are scheduled against other streams with the given priority,
+        "interactive" or "batch". Chunks that fail are skipped and their text
+        is appended to failed_chunks when given.
+        """
+        if output_format and settings.encode_queue_size > 0:
+            # Generate raw audio and encode it on the encode executor, so
+            # encoding chunk N overlaps with inference of chunk N+1
+            raw_chunks = self.generate_audio_stream(
+                text,
+                voice,
+                writer,
+                speed=speed,
+                output_format=None,
+                lang_code=lang_code,
+                volume_multiplier=volume_multiplier,
+                normalization_options=normalization_options,
+                return_timestamps=return_timestamps,
+                first_chunk_max_tokens=first_chunk_max_tokens,
+                priority=priority,
+                failed_chunks=failed_chunks,
+            )
+            async for chunk_data in self._encode_pipelined(raw_chunks, writer):
+                yield chunk_data
+            return
+
+        if first_chunk_max_tokens is None:
+            first_chunk_max_tokens = settings.first_chunk_max_tokens
+
+        scheduler_stream = get_scheduler().open_stream(priority)
         stream_normalizer = AudioNormalizer()
         chunk_index = 0
         current_offset = 0.0
+        cache_stats = {"hits": 0, "misses": 0}
+        text_chunks = None
         try:
             # Get backend
             backend = self.model_manager.get_backend()
@@ -285,12 +485,23 @@ class TTSService:
                 f"Using lang_code '{pipeline_lang_code}' for voice '{voice_name}' in audio stream"
             )
 
+            # Phonemes from splitting are only usable for English chunks without
+            # word timestamps, since raw phoneme input carries no word alignment
+            reuse_phonemes = (
+                settings.reuse_split_phonemes
+                and not return_timestamps
+                and pipeline_lang_code in ("a", "b")
+                and isinstance(backend, KokoroV1)
+            )
+
             # Process text in chunks with smart splitting, handling pause tags
-            async for chunk_text, tokens, pause_duration_s in smart_split(
+            text_chunks = smart_split(
                 text,
                 lang_code=pipeline_lang_code,
                 normalization_options=normalization_options,
-            ):
+                first_chunk_max_tokens=first_chunk_max_tokens,
+            )
+            async for chunk_text, tokens, pause_duration_s in text_chunks:
                 if pause_duration_s is not None and pause_duration_s > 0:
                     # --- Handle Pause Chunk ---
                     try:
@@ -317,15 +528,24 @@ class TTSService:
 
                         # Update offset based on silence duration
                         current_offset += pause_duration_s
+                        AUDIO_SECONDS.inc(pause_duration_s)
                         chunk_index += 1  # Count pause as a yielded chunk
 
                     except Exception as e:
                         logger.error(f"Failed to process pause chunk: {str(e)}")
+                        if failed_chunks is not None:
+                            failed_chunks.append(chunk_text)
                         continue
 
                 elif tokens or chunk_text.strip():  # Process if there are tokens OR non-whitespace text
                     # --- Handle Text Chunk ---
                     try:
+                        chunk_phonemes = None
+                        if reuse_phonemes and not CUSTOM_PHONEMES.search(chunk_text):
+                            chunk_phonemes = decode_tokens(tokens)
+                            if len(chunk_phonemes) > MAX_PHONEME_LENGTH:
+                                chunk_phonemes = None
+
                         # Process audio for chunk
                         async for chunk_data in self._process_chunk(
                             chunk_text,  # Pass text for Kokoro V1
@@ -341,6 +561,10 @@ class TTSService:
                             normalizer=stream_normalizer,
                             lang_code=pipeline_lang_code,  # Pass lang_code
                             return_timestamps=return_timestamps,
+                            phonemes=chunk_phonemes,
+                            cache_stats=cache_stats,
+                            scheduler_stream=scheduler_stream,
+                            failed_chunks=failed_chunks,
                         ):
                             if chunk_data.word_timestamps is not None:
                                 for timestamp in chunk_data.word_timestamps:
@@ -352,6 +576,7 @@ class TTSService:
                             if chunk_data.audio is not None and len(chunk_data.audio) > 0:
                                 chunk_duration = len(chunk_data.audio) / 24000
                                 current_offset += chunk_duration
+                                AUDIO_SECONDS.inc(chunk_duration)
 
                             # Yield the processed chunk (either formatted or raw)
                             if chunk_data.output is not None:
@@ -364,12 +589,21 @@ class TTSService:
                                 )
 
                         chunk_index += 1  # Increment chunk index after processing text
+                        CHUNKS.inc()
                     except Exception as e:
                         logger.error(
                             f"Failed to process audio for chunk: '{chunk_text[:100]}...'. Error: {str(e)}"
                         )
+                        if failed_chunks is not None:
+                            failed_chunks.append(chunk_text)
                         continue
 
+            if cache_stats["hits"] or cache_stats["misses"]:
+                logger.info(
+                    f"Sentence cache: {cache_stats['hits']} of "
+                    f"{cache_stats['hits'] + cache_stats['misses']} chunks served from cache"
+                )
+
             # Only finalize if we successfully processed at least one chunk
             if chunk_index > 0:
                 try:
@@ -387,15 +621,77 @@ class TTSService:
                         volume_multiplier=volume_multiplier,
                         normalizer=stream_normalizer,
                         lang_code=pipeline_lang_code,  # Pass lang_code
+                        scheduler_stream=scheduler_stream,
+                        failed_chunks=failed_chunks,
                     ):
                         if chunk_data.output is not None:
                             yield chunk_data
                 except Exception as e:
                     logger.error(f"Failed to finalize audio stream: {str(e)}")
+                    if failed_chunks is not None:
+                        failed_chunks.append("")
 
         except Exception as e:
             logger.error(f"Error in phoneme audio generation: {str(e)}")
             raise e
+        finally:
+            # Stop splitting right away when the stream is closed or cancelled
+            if text_chunks is not None:
+                await text_chunks.aclose()
+
+    async def _encode_pipelined(
+        self,
+        chunks: AsyncGenerator[AudioChunk, None],
+        writer: StreamingAudioWriter,
+    ) -> AsyncGenerator[AudioChunk, None]:
+        """Encode raw chunks on the encode executor while later chunks are generated.
+
+        Chunks are handed over through a queue of encode_queue_size, so
+        inference never runs more than that many chunks ahead of encoding. A
+        single consumer feeds the writer, keeping output in order.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=settings.encode_queue_size)
+        executor = get_encode_executor()
+
+        async def produce():
+            try:
+                async for chunk_data in chunks:
+                    await queue.put(("chunk", chunk_data))
+                await queue.put(("done", None))
+            except Exception as e:
+                await queue.put(("error", e))
+            finally:
+                await chunks.aclose()
+
+        producer = asyncio.create_task(produce())
+        received = False
+        try:
+            while True:
+                kind, chunk_data = await queue.get()
+                if kind == "done":
+                    break
+                if kind == "error":
+                    raise chunk_data
+                received = True
+                if len(chunk_data.audio) == 0:
+                    # End of stream marker from the raw generator
+                    continue
+                yield await executor.run(AudioService.write_audio, chunk_data, writer)
+
+            # Only finalize if at least one chunk was generated
+            if received:
+                yield await executor.run(
+                    AudioService.write_audio,
+                    AudioChunk(np.array([], dtype=np.int16)),
+                    writer,
+                    is_last_chunk=True,
+                )
+        finally:
+            producer.cancel()
+            try:
+                await producer
+            except asyncio.CancelledError:
+                pass
 
     async def generate_audio(
         self,
@@ -407,8 +703,14 @@ class TTSService:
         volume_multiplier: Optional[float] = 1.0,
         normalization_options: Optional[NormalizationOptions] = NormalizationOptions(),
         lang_code: Optional[str] = None,
+        priority: str = "interactive",
+        failed_chunks: Optional[List[str]] = None,
     ) -> AudioChunk:
-        """Generate complete audio for text using streaming internally."""
+        """Generate complete audio for text using streaming internally.
+
+        The text of chunks that failed and were left out is appended to
+        failed_chunks when given.
+        """
         audio_data_chunks = []
 
         try:
@@ -422,6 +724,10 @@ class TTSService:
                 return_timestamps=return_timestamps,
                 lang_code=lang_code,
                 output_format=None,
+                # Nothing is played before the whole audio is done
+                first_chunk_max_tokens=0,
+                priority=priority,
+                failed_chunks=failed_chunks,
             ):
                 if len(audio_stream_data.audio) > 0:
                     audio_data_chunks.append(audio_stream_data)
@@ -478,27 +784,31 @@ class TTSService:
                     f"Using lang_code '{pipeline_lang_code}' for voice '{voice_name}' in phoneme pipeline"
                 )
 
+                # Go through the model manager like text chunks do, so the
+                # replica dispatcher, batcher and default volume apply
+                chunks = self.model_manager.generate_from_tokens(
+                    phonemes,  # Pass raw phonemes string
+                    (voice_name, voice_path),
+                    speed=speed,
+                    lang_code=pipeline_lang_code,
+                )
                 try:
-                    # Use backend's pipeline management
-                    for r in backend._get_pipeline(
-                        pipeline_lang_code
-                    ).generate_from_tokens(
-                        tokens=phonemes,  # Pass raw phonemes string
-                        voice=voice_path,
-                        speed=speed,
-                    ):
-                        if r.audio is not None:
-                            result = r
+                    async for chunk in chunks:
+                        if chunk.audio is not None:
+                            result = chunk
                             break
                 except Exception as e:
                     logger.error(f"Failed to generate from phonemes: {e}")
                     raise RuntimeError(f"Phoneme generation failed: {e}")
+                finally:
+                    # Hand the replica back right away
+                    await chunks.aclose()
 
                 if result is None or result.audio is None:
                     raise ValueError("No audio generated")
 
                 processing_time = time.time() - start_time
-                return result.audio.numpy(), processing_time
+                return result.audio, processing_time
             else:
                 raise ValueError(
                     "Phoneme generation only supported with Kokoro V1 backend"
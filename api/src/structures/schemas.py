@@ -121,6 +121,15 @@ class OpenAISpeechRequest(BaseModel):
         default=NormalizationOptions(),
         description="Options for the normalization system",
     )
+    first_chunk_max_tokens: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="Token budget of the first streamed chunk. Smaller values start playback sooner, later chunks grow back to the regular size. 0 disables, defaults to the server setting. Only applies to streamed responses.",
+    )
+    priority: Literal["interactive", "batch"] = Field(
+        default="interactive",
+        description="Scheduling priority. Interactive requests are synthesized ahead of batch requests, batch requests use the remaining capacity.",
+    )
 
 
 class CaptionedSpeechRequest(BaseModel):
@@ -169,3 +178,12 @@ class CaptionedSpeechRequest(BaseModel):
         default=NormalizationOptions(),
         description="Options for the normalization system",
     )
+    first_chunk_max_tokens: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="Token budget of the first streamed chunk. Smaller values start playback sooner, later chunks grow back to the regular size. 0 disables, defaults to the server setting. Only applies to streamed responses.",
+    )
+    priority: Literal["interactive", "batch"] = Field(
+        default="interactive",
+        description="Scheduling priority. Interactive requests are synthesized ahead of batch requests, batch requests use the remaining capacity.",
+    )
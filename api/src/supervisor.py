@@ -0,0 +1,231 @@
+"""
+Pre-fork supervisor: load the model once and serve it from several workers.
+
+    python -m api.src.supervisor
+
+The supervisor loads the weights and voices, binds the listening socket
+and forks PREFORK_WORKERS processes that all accept on it. Workers share
+the weight pages copy-on-write, so each one only adds its own activations
+and pipelines. A worker that dies is forked again from the supervisor.
+"""
+
+import asyncio
+import os
+import signal
+import socket
+import time
+from typing import Callable, Dict, Tuple
+
+import torch
+import uvicorn
+from loguru import logger
+from torch.nn.utils import remove_weight_norm
+
+from .core import paths
+from .core.config import settings
+from .core.model_config import model_config
+from .main import app
+
+# Workers that exit sooner than this after starting count as crashing on startup
+MIN_UPTIME_SECONDS = 5.0
+
+
+def fold_weight_norm(model: torch.nn.Module) -> int:
+    """Bake weight-normed layers into plain weights.
+
+    Weight norm recomputes each weight from its magnitude and direction
+    before every forward pass, which would give every worker a private copy
+    of those weights. Folded once in the supervisor, they stay shared.
+
+    Returns:
+        Number of layers folded
+    """
+    folded = 0
+    for module in model.modules():
+        if hasattr(module, "weight_g"):
+            remove_weight_norm(module)
+            folded += 1
+    return folded
+
+
+async def preload() -> None:
+    """Load the model and voices into the process-wide managers.
+
+    Only the PyTorch backend on CPU is loaded here. CUDA and ONNX Runtime
+    start threads that do not survive a fork, so those workers load the
+    model themselves, the ONNX export being cached here first.
+    """
+    from .inference.kokoro_v1_onnx import KokoroV1Onnx
+    from .inference.model_manager import get_manager
+    from .inference.voice_manager import get_manager as get_voice_manager
+
+    model_path = await paths.get_model_path(model_config.pytorch_kokoro_v1_file)
+    if settings.inference_backend == "onnx":
+        config_path = os.path.join(os.path.dirname(model_path), "config.json")
+        KokoroV1Onnx._load_or_export(config_path, model_path)
+        return
+    if settings.get_device() != "cpu":
+        logger.warning("Workers load the model themselves on GPU")
+        return
+
+    model_manager = await get_manager()
+    await model_manager.initialize()
+    # Replicas set their thread count, workers set theirs after the fork
+    torch.set_num_threads(1)
+    # The batcher thread would not survive the fork, see start_batchers
+    batching_enabled = settings.batching_enabled
+    settings.batching_enabled = False
+    try:
+        await model_manager.load_model(model_config.pytorch_kokoro_v1_file)
+    finally:
+        settings.batching_enabled = batching_enabled
+    folded = fold_weight_norm(model_manager.get_backend()._model)
+    logger.info(f"Preloaded model, folded {folded} weight-normed layers")
+
+    voice_manager = await get_voice_manager()
+    voices = await voice_manager.list_voices()
+    for voice in voices:
+        await voice_manager.load_voice(voice, device="cpu")
+    logger.info(f"Preloaded {len(voices)} voices")
+
+
+def start_batchers() -> None:
+    """Start the micro-batching threads of the preloaded replicas in a worker."""
+    from .inference.model_manager import ModelManager
+
+    manager = ModelManager._instance
+    if not settings.batching_enabled or manager is None or manager._replicas is None:
+        return
+    for replica in manager._replicas.replicas:
+        # Models loaded after the fork start their own
+        if replica.backend.is_loaded:
+            replica.backend._start_batcher()
+
+
+def bind_socket(host: str, port: int) -> socket.socket:
+    """Bind the listening socket shared by all workers."""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def serve(sock: socket.socket, threads: int) -> None:
+    """Run the API in a worker process, accepting on the shared socket."""
+    torch.set_num_threads(threads)
+    start_batchers()
+    uvicorn.Server(uvicorn.Config(app)).run(sockets=[sock])
+
+
+class Supervisor:
+    """Keeps a fixed number of forked worker processes running."""
+
+    def __init__(
+        self,
+        workers: int,
+        target: Callable[[int], None],
+        restart_delay: float = 1.0,
+    ):
+        """Initialize supervisor.
+
+        Args:
+            workers: Number of worker processes
+            target: Run in each forked worker with its slot number
+            restart_delay: Wait before restarting a worker that crashed on startup
+        """
+        self.workers = max(1, workers)
+        self.target = target
+        self.restart_delay = restart_delay
+        self.restarts = 0
+        # Running workers by pid: (slot, start time)
+        self._children: Dict[int, Tuple[int, float]] = {}
+        self._stopping = False
+
+    def start(self) -> None:
+        """Fork all workers."""
+        for slot in range(self.workers):
+            self._spawn(slot)
+
+    def _spawn(self, slot: int) -> int:
+        pid = os.fork()
+        if pid == 0:
+            # Worker: the supervisor's handlers must not run here
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            code = 0
+            try:
+                self.target(slot)
+            except BaseException:
+                logger.exception(f"Worker {slot} failed")
+                code = 1
+            finally:
+                os._exit(code)
+        self._children[pid] = (slot, time.monotonic())
+        logger.info(f"Started worker {slot} (pid {pid})")
+        return pid
+
+    def watch(self) -> None:
+        """Reap exited workers and restart them until stopped."""
+        while self._children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            if pid not in self._children:
+                continue
+            slot, started = self._children.pop(pid)
+            if self._stopping:
+                continue
+            logger.warning(
+                f"Worker {slot} (pid {pid}) exited with status "
+                f"{os.waitstatus_to_exitcode(status)}, restarting"
+            )
+            if time.monotonic() - started < MIN_UPTIME_SECONDS:
+                time.sleep(self.restart_delay)
+                if self._stopping:
+                    continue
+            self.restarts += 1
+            self._spawn(slot)
+
+    def stop(self, sig: int = signal.SIGTERM) -> None:
+        """Stop restarting workers and pass sig on to them."""
+        self._stopping = True
+        for pid in list(self._children):
+            try:
+                os.kill(pid, sig)
+            except ProcessLookupError:
+                pass
+
+
+def main() -> None:
+    workers = max(1, settings.prefork_workers)
+    threads = settings.prefork_threads or max(
+        1, (os.cpu_count() or 1) // (workers * max(1, settings.model_replicas))
+    )
+
+    # Forked children cannot use intra-op thread pools the parent started
+    torch.set_num_threads(1)
+    asyncio.run(preload())
+    sock = bind_socket(settings.host, settings.port)
+    logger.info(
+        f"Serving on {settings.host}:{settings.port} with {workers} workers, "
+        f"{threads} torch threads each"
+    )
+
+    supervisor = Supervisor(
+        workers,
+        lambda slot: serve(sock, threads),
+        restart_delay=settings.prefork_restart_delay,
+    )
+    signal.signal(signal.SIGTERM, lambda sig, frame: supervisor.stop(sig))
+    signal.signal(signal.SIGINT, lambda sig, frame: supervisor.stop(signal.SIGTERM))
+    supervisor.start()
+    supervisor.watch()
+    sock.close()
+
+
+if __name__ == "__main__":
+    main()
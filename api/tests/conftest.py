@@ -1,3 +1,4 @@
+import json
 import os
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -6,6 +7,7 @@ import numpy as np
 import pytest
 import pytest_asyncio
 import torch
+from kokoro import KModel
 
 from api.src.inference.model_manager import ModelManager
 from api.src.inference.voice_manager import VoiceManager
@@ -22,6 +24,63 @@ def mock_voice_tensor():
     return torch.load(voice_path, map_location="cpu", weights_only=False)
 
 
+@pytest.fixture(scope="module")
+def tiny_model_path(tmp_path_factory):
+    """Weights of a tiny Kokoro with random weights, next to its config.json."""
+    config_path = os.path.join(
+        os.path.dirname(os.path.dirname(__file__)), "src/models/v1_0/config.json"
+    )
+    with open(config_path, encoding="utf-8") as f:
+        config = json.load(f)
+    config["n_layer"] = 1
+    config["plbert"].update(
+        hidden_size=32, num_attention_heads=2, intermediate_size=64, num_hidden_layers=1
+    )
+    config["istftnet"].update(resblock_kernel_sizes=[3], resblock_dilation_sizes=[[1, 3, 5]])
+
+    model_dir = tmp_path_factory.mktemp("kokoro")
+    (model_dir / "config.json").write_text(json.dumps(config))
+    empty_path = model_dir / "empty.pth"
+    torch.save({}, empty_path)
+
+    torch.manual_seed(0)
+    model = KModel(config=config, model=str(empty_path))
+    model_path = model_dir / "kokoro.pth"
+    torch.save(
+        {
+            name: getattr(model, name).state_dict()
+            for name in ["bert", "bert_encoder", "predictor", "text_encoder", "decoder"]
+        },
+        model_path,
+    )
+    return str(model_path)
+
+
+def _spectral_distance(a, b):
+    """Log-spectral distance over the length both have."""
+    length = min(len(a), len(b))
+    spectra = [
+        torch.stft(
+            audio[:length],
+            n_fft=1024,
+            hop_length=256,
+            window=torch.hann_window(1024),
+            return_complex=True,
+        )
+        .abs()
+        .add(1e-5)
+        .log()
+        for audio in (a, b)
+    ]
+    return (spectra[0] - spectra[1]).pow(2).mean().sqrt().item()
+
+
+@pytest.fixture
+def spectral_distance():
+    """Compare audio whose vocoder phases are random, where samples differ."""
+    return _spectral_distance
+
+
 @pytest.fixture
 def mock_audio_output():
     """Load pre-generated test audio for consistent testing."""
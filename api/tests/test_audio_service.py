@@ -254,3 +254,102 @@ async def test_buffer_position_after_conversion(sample_audio):
     assert isinstance(audio_chunk2.output, bytes)
     assert isinstance(audio_chunk2, AudioChunk)
     assert len(audio_chunk1.output) == len(audio_chunk2.output)
+
+
+def _find_first_last_non_silent_reference(audio_data, amplitude_threshold):
+    """Sample-by-sample scan the vectorized implementation must match"""
+    start = next(
+        (i for i in range(len(audio_data)) if abs(audio_data[i]) > amplitude_threshold),
+        None,
+    )
+    end = next(
+        (
+            i
+            for i in range(len(audio_data) - 1, -1, -1)
+            if abs(audio_data[i]) > amplitude_threshold
+        ),
+        None,
+    )
+    return start, end
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_find_first_last_non_silent_matches_scan(seed):
+    """Test that vectorized silence detection matches a sample scan"""
+    rng = np.random.default_rng(seed)
+    normalizer = AudioNormalizer()
+    # Quiet noise with a loud burst somewhere in the middle
+    audio = rng.integers(-100, 100, size=24000, dtype=np.int16)
+    burst_start = int(rng.integers(0, 12000))
+    burst_end = burst_start + int(rng.integers(1, 12000))
+    audio[burst_start:burst_end] = rng.integers(
+        -20000, 20000, size=burst_end - burst_start, dtype=np.int16
+    )
+
+    threshold = np.iinfo(np.int16).max * (10 ** (-45 / 20))
+    expected_start, expected_end = _find_first_last_non_silent_reference(
+        audio, threshold
+    )
+    # Last chunk pads the end by samples_to_pad_start, independent of settings
+    start, end = normalizer.find_first_last_non_silent(
+        audio, "", 1.0, is_last_chunk=True
+    )
+
+    assert start == max(expected_start - normalizer.samples_to_pad_start, 0)
+    assert end == min(expected_end + normalizer.samples_to_pad_start, len(audio))
+
+
+def test_find_first_last_non_silent_all_silent():
+    """Test that fully silent audio is returned untrimmed"""
+    normalizer = AudioNormalizer()
+    audio = np.zeros(4800, dtype=np.int16)
+    assert normalizer.find_first_last_non_silent(audio, "", 1.0) == (0, 4800)
+
+
+def test_find_first_last_non_silent_long_quiet_tail():
+    """Test that a burst followed by a long quiet tail is found in a 10s chunk"""
+    normalizer = AudioNormalizer()
+    audio = np.zeros(240000, dtype=np.int16)
+    audio[24000:48000] = 10000
+
+    start, end = normalizer.find_first_last_non_silent(
+        audio, "", 1.0, is_last_chunk=True
+    )
+
+    assert start == 24000 - normalizer.samples_to_pad_start
+    assert end == 47999 + normalizer.samples_to_pad_start
+
+
+def test_combine_copies_each_chunk_once():
+    """Test combining chunks into one preallocated buffer"""
+    from api.src.structures.schemas import WordTimestamp
+
+    first_timestamps = [WordTimestamp(word="a", start_time=0.0, end_time=0.1)]
+    chunks = [
+        AudioChunk(np.arange(3, dtype=np.int16), word_timestamps=first_timestamps),
+        AudioChunk(np.arange(3, 5, dtype=np.int16), word_timestamps=[]),
+        AudioChunk(
+            np.arange(5, 9, dtype=np.int16),
+            word_timestamps=[WordTimestamp(word="b", start_time=0.2, end_time=0.3)],
+        ),
+    ]
+
+    combined = AudioChunk.combine(chunks)
+
+    np.testing.assert_array_equal(combined.audio, np.arange(9, dtype=np.int16))
+    assert combined.audio.dtype == np.int16
+    assert [t.word for t in combined.word_timestamps] == ["a", "b"]
+    # Inputs are not modified
+    assert len(first_timestamps) == 1
+    assert not np.shares_memory(combined.audio, chunks[0].audio)
+
+
+def test_combine_without_timestamps():
+    """Test that chunks without timestamps combine to None timestamps"""
+    chunks = [
+        AudioChunk(np.ones(2, dtype=np.int16), word_timestamps=None),
+        AudioChunk(np.ones(2, dtype=np.int16), word_timestamps=None),
+    ]
+    combined = AudioChunk.combine(chunks)
+    assert len(combined.audio) == 4
+    assert combined.word_timestamps is None
@@ -0,0 +1,231 @@
+import asyncio
+import os
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import torch
+from kokoro import KModel
+
+from api.src.core.config import settings
+from api.src.inference.batching import BatchedModel, BatchScheduler, forward_batch
+from api.src.inference.executor import InferenceExecutor
+from api.src.inference.kokoro_v1 import KokoroV1
+
+
+def fake_forward_batch(model, input_ids, ref_s, speeds):
+    """Echo each item's token count and speed back as its audio."""
+    return [
+        KModel.Output(
+            audio=torch.tensor([float(len(ids)), float(speed)]),
+            pred_dur=torch.ones(len(ids), dtype=torch.long),
+        )
+        for ids, speed in zip(input_ids, speeds.tolist())
+    ]
+
+
+@pytest.fixture
+def model():
+    model = MagicMock()
+    model.vocab = {"a": 1, "b": 2, "c": 3}
+    model.context_length = 8
+    return model
+
+
+def submit_concurrently(scheduler, requests):
+    results = [None] * len(requests)
+
+    def worker(i, phonemes, speed):
+        results[i] = scheduler.submit(phonemes, torch.zeros(1, 256), speed)
+
+    threads = [
+        threading.Thread(target=worker, args=(i, *request))
+        for i, request in enumerate(requests)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    return results
+
+
+def test_concurrent_submits_share_a_batch(model):
+    """Test that requests arriving within the window run as one batch."""
+    requests = [("a", 1.0), ("ab", 1.5), ("abc", 2.0)]
+    with patch(
+        "api.src.inference.batching.forward_batch", side_effect=fake_forward_batch
+    ) as mock_forward:
+        scheduler = BatchScheduler(model, window_ms=200, max_batch_size=8)
+        results = submit_concurrently(scheduler, requests)
+        scheduler.shutdown()
+
+    mock_forward.assert_called_once()
+    # Each caller gets back its own output
+    for (phonemes, speed), output in zip(requests, results):
+        assert output.audio.tolist() == [len(phonemes) + 2, speed]
+    assert scheduler.stats()["batch_sizes"] == {3: 1}
+
+
+def test_max_batch_size_splits_batches(model):
+    """Test that batches never exceed the configured size."""
+    with patch(
+        "api.src.inference.batching.forward_batch", side_effect=fake_forward_batch
+    ):
+        scheduler = BatchScheduler(model, window_ms=200, max_batch_size=2)
+        results = submit_concurrently(scheduler, [("a", 1.0)] * 5)
+        scheduler.shutdown()
+
+    assert all(result is not None for result in results)
+    stats = scheduler.stats()
+    assert stats["items"] == 5
+    assert max(stats["batch_sizes"]) <= 2
+
+
+def test_batch_errors_reach_every_caller(model):
+    """Test that a failed batch raises in each waiting request."""
+    with patch(
+        "api.src.inference.batching.forward_batch",
+        side_effect=RuntimeError("forward failed"),
+    ):
+        scheduler = BatchScheduler(model, window_ms=0)
+        with pytest.raises(RuntimeError, match="forward failed"):
+            scheduler.submit("a", torch.zeros(1, 256))
+        scheduler.shutdown()
+
+
+def test_too_long_input_rejected(model):
+    """Test that inputs beyond the context length are rejected up front."""
+    scheduler = BatchScheduler(model)
+    with pytest.raises(ValueError, match="too long"):
+        scheduler.submit("abcabcabc", torch.zeros(1, 256))
+    scheduler.shutdown()
+
+
+def test_batched_model_matches_kmodel_call(model):
+    """Test the KModel call signature used by KPipeline."""
+    scheduler = MagicMock()
+    output = KModel.Output(audio=torch.ones(3), pred_dur=torch.ones(1))
+    scheduler.submit.return_value = output
+    batched = BatchedModel(model, scheduler)
+
+    assert batched("a", torch.zeros(1, 256), 1.0, return_output=True) is output
+    assert torch.equal(batched("a", torch.zeros(1, 256), 1.0), output.audio)
+    assert batched.device is model.device
+
+
+@pytest.mark.asyncio
+async def test_cancelled_request_leaves_its_batch(model):
+    """Test that a forward pass is dropped if its request is cancelled while queued."""
+    executor = InferenceExecutor("thread", workers=1)
+
+    def generate():
+        yield scheduler.submit("abc", torch.zeros(1, 256), 1.0)
+
+    with patch(
+        "api.src.inference.batching.forward_batch", side_effect=fake_forward_batch
+    ) as mock_forward:
+        scheduler = BatchScheduler(model, window_ms=300, max_batch_size=8)
+        request = asyncio.ensure_future(executor.iterate(generate).__anext__())
+        await asyncio.sleep(0.1)
+        request.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await request
+        # Let the batch window close
+        await asyncio.sleep(0.4)
+        scheduler.shutdown()
+        executor.shutdown(wait=True)
+
+    mock_forward.assert_not_called()
+    assert scheduler.stats()["cancelled"] == 1
+
+
+def test_shutdown_fails_queued_and_later_submits(model):
+    """Test that forwards not yet batched fail on shutdown instead of hanging."""
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_forward_batch(*args):
+        started.set()
+        release.wait(5)
+        return fake_forward_batch(*args)
+
+    with patch(
+        "api.src.inference.batching.forward_batch", side_effect=slow_forward_batch
+    ):
+        scheduler = BatchScheduler(model, window_ms=0, max_batch_size=1)
+        results = {}
+
+        def worker(name):
+            try:
+                results[name] = scheduler.submit("a", torch.zeros(1, 256))
+            except RuntimeError as e:
+                results[name] = e
+
+        running = threading.Thread(target=worker, args=("running",))
+        running.start()
+        assert started.wait(5)
+        queued = threading.Thread(target=worker, args=("queued",))
+        queued.start()
+        while not scheduler._queue.qsize():
+            time.sleep(0.01)
+        scheduler.shutdown()
+        release.set()
+        running.join(timeout=5)
+        queued.join(timeout=5)
+
+        with pytest.raises(RuntimeError, match="shut down"):
+            scheduler.submit("a", torch.zeros(1, 256))
+
+    assert isinstance(results["running"], KModel.Output)
+    assert isinstance(results["queued"], RuntimeError)
+
+
+def test_forward_batch_durations_match_kmodel(tiny_model_path):
+    """Test that padded batches predict the same durations as single forwards."""
+    config_path = os.path.join(os.path.dirname(tiny_model_path), "config.json")
+    model = KModel(config=config_path, model=tiny_model_path).eval()
+    requests = [("həlˈO", 1.0), ("ðə kwˈɪk bɹˈWn fˈɑks", 1.3), ("wˈʌn", 0.8)]
+    torch.manual_seed(0)
+    ref_s = torch.randn(len(requests), 256)
+
+    input_ids = [
+        torch.LongTensor([0, *(model.vocab[p] for p in phonemes if p in model.vocab), 0])
+        for phonemes, _ in requests
+    ]
+    outputs = forward_batch(
+        model, input_ids, ref_s, torch.tensor([speed for _, speed in requests])
+    )
+
+    with torch.no_grad():
+        for i, (phonemes, speed) in enumerate(requests):
+            expected = model(phonemes, ref_s[i : i + 1], speed, return_output=True)
+            assert torch.equal(outputs[i].pred_dur, expected.pred_dur)
+            assert outputs[i].audio.shape == expected.audio.shape
+
+
+@pytest.mark.parametrize(
+    "executor, workers, replicas, started",
+    [
+        ("thread", 2, 1, True),
+        ("thread", 1, 1, False),
+        ("device_queue", 2, 1, False),
+        ("thread", 2, 2, False),
+    ],
+)
+def test_batcher_needs_concurrent_forwards(model, executor, workers, replicas, started):
+    """Test that the batcher is only started where forwards can overlap."""
+    backend = KokoroV1()
+    backend._model = model
+    with patch.multiple(
+        settings,
+        inference_executor=executor,
+        inference_workers=workers,
+        model_replicas=replicas,
+    ):
+        backend._start_batcher()
+
+    assert (backend._batcher is not None) == started
+    assert (backend._forward_model is model) != started
+    if backend._batcher is not None:
+        backend._batcher.shutdown()
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from api.src.services.encoder_pool import ENCODER_POOL_REQUESTS, EncoderPool
+from api.src.services.streaming_audio_writer import StreamingAudioWriter
+
+
+@pytest.fixture
+def pool():
+    pool = EncoderPool(size=2)
+    yield pool
+    pool.shutdown()
+
+
+def wait_for_refill(pool):
+    # The refill executor has a single worker, so this runs after pending refills
+    pool._refill_executor.submit(lambda: None).result()
+
+
+def encode(writer, audio):
+    data = writer.write_chunk(audio) + writer.write_chunk(finalize=True)
+    return without_ogg_serials(data) if writer.format == "opus" else data
+
+
+def without_ogg_serials(data):
+    """Zero the stream serial, random per container, and the checksum of each Ogg page."""
+    data = bytearray(data)
+    offset = 0
+    while offset < len(data):
+        assert data[offset : offset + 4] == b"OggS"
+        segments = data[offset + 26]
+        lacing = data[offset + 27 : offset + 27 + segments]
+        data[offset + 14 : offset + 18] = bytes(4)
+        data[offset + 22 : offset + 26] = bytes(4)
+        offset += 27 + segments + sum(lacing)
+    return bytes(data)
+
+
+@pytest.mark.parametrize("format", ["mp3", "aac", "flac", "wav", "opus"])
+def test_prewarmed_writer_output_matches(pool, format):
+    """Test that prewarmed writers produce the same bytes as fresh ones."""
+    audio = (np.sin(np.arange(24000) / 10) * 8000).astype(np.int16)
+    pool.prewarm([format])
+    wait_for_refill(pool)
+
+    pooled = pool.acquire(format)
+    assert encode(pooled, audio) == encode(StreamingAudioWriter(format, 24000), audio)
+
+
+def test_acquire_counts_hits_and_misses(pool):
+    """Test pool hits after prewarming and refill after acquire."""
+    hits = ENCODER_POOL_REQUESTS.value(format="opus", result="hit")
+    misses = ENCODER_POOL_REQUESTS.value(format="opus", result="miss")
+
+    pool.acquire("opus").close()  # Cold pool
+    wait_for_refill(pool)
+    assert pool.idle_counts() == {("opus",): 2}
+
+    pool.acquire("opus").close()
+    wait_for_refill(pool)
+
+    assert ENCODER_POOL_REQUESTS.value(format="opus", result="miss") == misses + 1
+    assert ENCODER_POOL_REQUESTS.value(format="opus", result="hit") == hits + 1
+    assert pool.idle_counts() == {("opus",): 2}
+
+
+def test_release_reuses_only_unused_writers(pool):
+    """Test that written writers are closed instead of returned."""
+    unused = StreamingAudioWriter("mp3", 24000)
+    used = StreamingAudioWriter("mp3", 24000)
+    used.write_chunk(np.zeros(2400, dtype=np.int16))
+
+    pool.release(unused)
+    pool.release(used)
+
+    assert pool.idle_counts() == {("mp3",): 1}
+    assert used.closed
+    assert pool.acquire("mp3") is unused
+
+
+@pytest.mark.parametrize("format", ["mp3", "pcm"])
+def test_finalized_or_written_writer_not_fresh(format):
+    """Test that writers finalized without audio, or pcm ones written to, are not reused."""
+    finalized = StreamingAudioWriter(format, 24000)
+    finalized.write_chunk(np.array([], dtype=np.int16))
+    assert finalized.is_fresh
+    finalized.write_chunk(finalize=True)
+    assert not finalized.is_fresh
+
+    written = StreamingAudioWriter(format, 24000)
+    written.write_chunk(np.zeros(2400, dtype=np.int16))
+    assert not written.is_fresh
+
+
+def test_pcm_and_disabled_pool_bypass(pool):
+    """Test that pcm and a zero-size pool create writers directly."""
+    assert pool.acquire("pcm").format == "pcm"
+    wait_for_refill(pool)
+    assert pool.idle_counts() == {}
+
+    disabled = EncoderPool(size=0)
+    disabled.prewarm(["mp3"])
+    disabled.acquire("mp3").close()
+    wait_for_refill(disabled)
+    assert disabled.idle_counts() == {}
+    disabled.shutdown()
@@ -0,0 +1,81 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from api.src.inference.executor import InferenceExecutor
+
+
+@pytest.fixture
+def executor():
+    """Create a thread executor for testing."""
+    executor = InferenceExecutor("thread", workers=1, name="test-inference")
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_iterate_yields_in_order(executor):
+    """Test that items from the worker generator arrive in order."""
+
+    def produce():
+        for i in range(5):
+            yield i
+
+    items = [item async for item in executor.iterate(produce)]
+    assert items == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_iterate_runs_off_event_loop(executor):
+    """Test that blocking work runs on a worker thread without stalling the loop."""
+    loop_thread = threading.get_ident()
+    worker_threads = []
+    ticks = 0
+
+    def produce():
+        worker_threads.append(threading.get_ident())
+        time.sleep(0.2)  # Simulate a blocking forward pass
+        yield "audio"
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker_task = asyncio.create_task(ticker())
+    items = [item async for item in executor.iterate(produce)]
+    ticker_task.cancel()
+
+    assert items == ["audio"]
+    assert worker_threads[0] != loop_thread
+    assert ticks > 5  # Event loop kept running during the blocking call
+
+
+@pytest.mark.asyncio
+async def test_iterate_propagates_errors(executor):
+    """Test that worker exceptions are raised in the consumer."""
+
+    def produce():
+        yield 1
+        raise RuntimeError("forward failed")
+
+    received = []
+    with pytest.raises(RuntimeError, match="forward failed"):
+        async for item in executor.iterate(produce):
+            received.append(item)
+    assert received == [1]
+
+
+@pytest.mark.asyncio
+async def test_run_returns_result(executor):
+    """Test running a single blocking call."""
+    assert await executor.run(lambda a, b: a + b, 2, b=3) == 5
+
+
+def test_invalid_mode():
+    """Test that unknown executor modes are rejected."""
+    with pytest.raises(ValueError, match="Unsupported inference executor"):
+        InferenceExecutor("process")
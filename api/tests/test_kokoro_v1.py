@@ -136,11 +136,9 @@ async def test_generate_uses_correct_pipeline(kokoro_backend):
     # Mock voice path handling
     with (
         patch("api.src.core.paths.load_voice_tensor") as mock_load_voice,
-        patch("api.src.core.paths.save_voice_tensor"),
-        patch("tempfile.gettempdir") as mock_tempdir,
+        patch("torch.save") as mock_save,
     ):
         mock_load_voice.return_value = torch.ones(1)
-        mock_tempdir.return_value = "/tmp"
 
         # Mock KPipeline
         mock_pipeline = MagicMock()
@@ -152,14 +150,13 @@ async def test_generate_uses_correct_pipeline(kokoro_backend):
 
             # Should create pipeline with Spanish lang_code
             assert "e" in kokoro_backend._pipelines
-            # Use ANY to match the temp file path since it's dynamic
             mock_pipeline.assert_called_with(
                 "test",
-                voice=ANY,  # Don't check exact path since it's dynamic
+                voice=ANY,
                 speed=1.0,
                 model=kokoro_backend._model,
             )
-            # Verify the voice path is a temp file path
+            # Voice is passed as an in-memory tensor, no temp file round trip
             call_args = mock_pipeline.call_args
-            assert isinstance(call_args[1]["voice"], str)
-            assert call_args[1]["voice"].startswith("/tmp/temp_voice_")
+            assert isinstance(call_args[1]["voice"], torch.Tensor)
+            mock_save.assert_not_called()
@@ -0,0 +1,128 @@
+"""Tests for the ONNX Runtime backend, exported from a tiny random-weight model"""
+
+import os
+import shutil
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import torch
+from kokoro import KModel
+
+pytest.importorskip("onnxruntime")
+pytest.importorskip("onnx")
+
+from api.src.inference.kokoro_v1_onnx import (  # noqa: E402
+    KokoroV1Onnx,
+    get_onnx_path,
+)
+from api.src.inference.model_manager import ModelManager  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def reference(tiny_model_path):
+    """PyTorch model with the same weights, as exported."""
+    config_path = os.path.join(os.path.dirname(tiny_model_path), "config.json")
+    return KModel(config=config_path, model=tiny_model_path, disable_complex=True).eval()
+
+
+@pytest.fixture(scope="module")
+def onnx_backend(tiny_model_path):
+    """Backend loaded from the tiny model, exporting it on first load."""
+    import asyncio
+
+    model_path = tiny_model_path
+    backend = KokoroV1Onnx()
+    with patch(
+        "api.src.inference.kokoro_v1_onnx.paths.get_model_path",
+        AsyncMock(return_value=model_path),
+    ):
+        asyncio.run(backend.load_model(model_path))
+    yield backend
+    backend.unload()
+
+
+def test_export_is_cached_next_to_weights(tmp_path, tiny_model_path, onnx_backend):
+    """The export is written once and reused while it is newer than the weights"""
+    assert onnx_backend.is_loaded
+    assert onnx_backend.session_pool.model == get_onnx_path(tiny_model_path)
+
+    # A copy, the shared weights' export is used by the other tests
+    model_path = str(tmp_path / "kokoro.pth")
+    shutil.copy(tiny_model_path, model_path)
+    onnx_path = get_onnx_path(model_path)
+    with patch(
+        "api.src.inference.kokoro_v1_onnx.export_onnx", return_value=b"exported"
+    ) as export:
+        assert KokoroV1Onnx._load_or_export(None, model_path) == onnx_path
+        assert KokoroV1Onnx._load_or_export(None, model_path) == onnx_path
+        export.assert_called_once()
+
+        # Newer weights invalidate the cached export
+        export.return_value = b"exported again"
+        os.utime(model_path, (os.path.getmtime(onnx_path) + 10,) * 2)
+        assert KokoroV1Onnx._load_or_export(None, model_path) == onnx_path
+        assert export.call_count == 2
+        with open(onnx_path, "rb") as f:
+            assert f.read() == b"exported again"
+
+
+@pytest.mark.parametrize("speed", [1.0, 1.5])
+def test_matches_pytorch_forward(reference, onnx_backend, spectral_distance, speed):
+    """ONNX predicts the same durations as PyTorch and close audio.
+
+    The exported vocoder draws its random phases and noise from ONNX Runtime,
+    which torch seeds do not reach, so samples never match. The audio is
+    checked to be no further from PyTorch than PyTorch with other phases.
+    """
+    phonemes = "həlˈO wˈɜɹld, ðɪs ɪz ə tˈɛst."
+    torch.manual_seed(0)
+    ref_s = torch.randn(1, 256)
+
+    with torch.no_grad():
+        torch.manual_seed(1)
+        expected = reference(phonemes, ref_s, speed, return_output=True)
+        torch.manual_seed(2)
+        rerun = reference(phonemes, ref_s, speed, return_output=True)
+    output = onnx_backend._forward_model(phonemes, ref_s, speed, return_output=True)
+
+    assert torch.equal(output.pred_dur, expected.pred_dur)
+    assert output.audio.shape == expected.audio.shape
+    assert torch.isfinite(output.audio).all()
+    assert spectral_distance(output.audio, expected.audio) <= 1.1 * spectral_distance(
+        rerun.audio, expected.audio
+    )
+
+    stats = onnx_backend.session_pool.stats()
+    assert stats["available_sessions"] == stats["max_sessions"]
+    assert sum(session["runs"] for session in stats["sessions"]) > 0
+
+
+def test_pipelines_do_not_load_pytorch_model(onnx_backend):
+    """Pipelines are created without a model, forwards pass the ONNX one"""
+    assert onnx_backend._pipeline_model is False
+    assert onnx_backend._batcher is None
+    assert onnx_backend.device == "cpu"
+
+
+@pytest.mark.asyncio
+async def test_manager_selects_backend_from_settings():
+    """INFERENCE_BACKEND picks the backend the manager initializes"""
+    manager = ModelManager()
+    with patch("api.src.inference.model_manager.settings") as mock_settings:
+        mock_settings.inference_backend = "onnx"
+        mock_settings.use_gpu = True
+        mock_settings.model_replicas = 1
+        await manager.initialize()
+        assert isinstance(manager.get_backend(), KokoroV1Onnx)
+        assert manager.current_backend == "kokoro_v1_onnx"
+        assert manager._device == "cpu"
+        assert manager.session_pools == {}
+
+        mock_settings.inference_backend = "pytorch"
+        await manager.initialize()
+        assert not isinstance(manager.get_backend(), KokoroV1Onnx)
+        assert manager.current_backend == "kokoro_v1"
+
+        mock_settings.inference_backend = "tensorrt"
+        with pytest.raises(RuntimeError, match="Unknown inference backend"):
+            await manager.initialize()
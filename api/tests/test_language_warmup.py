@@ -0,0 +1,102 @@
+"""Tests for building and warming language pipelines at startup"""
+
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.src.inference.kokoro_v1 import KokoroV1
+from api.src.inference.kokoro_v1_onnx import KokoroV1Onnx
+from api.src.inference.model_manager import ModelManager
+from api.src.main import app
+
+
+def test_pipelines_built_once_per_language_in_parallel():
+    """Each language is built once, different languages at the same time"""
+    backend = KokoroV1()
+    backend._model = MagicMock()
+    building = []
+    overlap = []
+
+    def build(lang_code, **kwargs):
+        building.append(lang_code)
+        overlap.append(len(building))
+        time.sleep(0.2)
+        building.remove(lang_code)
+        return MagicMock(name=lang_code)
+
+    with patch("api.src.inference.kokoro_v1.KPipeline", side_effect=build) as kpipeline:
+        threads = [
+            threading.Thread(target=backend._get_pipeline, args=(lang_code,))
+            for lang_code in ("e", "e", "j", "j")
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert kpipeline.call_count == 2
+    assert max(overlap) == 2
+    assert set(backend._pipelines) == {"e", "j"}
+
+
+@pytest.mark.parametrize("backend_class", [KokoroV1, KokoroV1Onnx])
+def test_replicas_share_pipeline_locks(backend_class):
+    """Replicas building the same language wait on the same lock"""
+    primary, replica = backend_class(0), backend_class(1)
+    with patch("api.src.inference.kokoro_v1.settings.batching_enabled", False):
+        replica.share_model(primary)
+
+    assert replica._pipelines is primary._pipelines
+    assert replica._pipeline_locks is primary._pipeline_locks
+
+
+@pytest.mark.asyncio
+async def test_warmup_languages_times_each_language():
+    """New languages are warmed in their own language, failures do not stop startup"""
+    manager = ModelManager()
+    backend = MagicMock(_pipelines={"a": MagicMock()})
+    manager._backend = backend
+    warmed = []
+
+    async def generate(text, voice, lang_code=None):
+        if lang_code == "z":
+            raise RuntimeError("no G2P")
+        warmed.append((lang_code, text))
+        yield None
+
+    with patch.object(manager, "generate", generate), patch(
+        "api.src.inference.model_manager.paths.get_voice_path",
+        AsyncMock(return_value="af_heart.pt"),
+    ):
+        assert not manager.ready
+        timings = await manager.warmup_languages(["a", "e", "j", "z", "e"])
+
+    assert manager.ready
+    assert set(timings) == {"e", "j"}
+    assert sorted(call.args[0] for call in backend._get_pipeline.call_args_list) == [
+        "e",
+        "j",
+        "z",
+    ]
+    assert sorted(warmed) == [
+        ("e", "Texto de calentamiento."),
+        ("j", "ウォームアップのテキストです。"),
+    ]
+
+
+def test_readiness_waits_for_warmup():
+    """The readiness check fails until the languages are warmed up"""
+    manager = ModelManager()
+    client = TestClient(app)
+    with patch.object(ModelManager, "_instance", manager):
+        response = client.get("/health/ready")
+        assert response.status_code == 503
+        assert response.json() == {"status": "warming_up"}
+
+        manager._ready = True
+        response = client.get("/health/ready")
+        assert response.status_code == 200
+        assert response.json() == {"status": "ready"}
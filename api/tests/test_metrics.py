@@ -0,0 +1,133 @@
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.src.core.metrics import ERRORS, REQUESTS, Registry, _Metric, register_cache
+from api.src.main import app
+from api.src.routers import development
+
+
+@pytest.fixture
+def registry():
+    return Registry()
+
+
+def test_counter_render(registry):
+    """Test counter exposition with labels."""
+    errors = registry.counter("test_errors_total", "Errors", ["type"])
+    errors.inc(type="ValueError")
+    errors.inc(2, type="ValueError")
+    errors.inc(type='Quote"d')
+
+    text = registry.render()
+    assert "# TYPE test_errors_total counter" in text
+    assert 'test_errors_total{type="ValueError"} 3' in text
+    assert 'test_errors_total{type="Quote\\"d"} 1' in text
+
+
+def test_counter_rejects_decrease_and_bad_labels(registry):
+    """Test that misuse raises instead of corrupting the series."""
+    counter = registry.counter("test_total", "Total", ["stage"])
+    with pytest.raises(ValueError):
+        counter.inc(-1, stage="g2p")
+    with pytest.raises(ValueError):
+        counter.inc(other="x")
+
+
+def test_metric_base_is_abstract():
+    """Test that metric types must implement rendering."""
+    with pytest.raises(TypeError):
+        _Metric("test_base", "Base")
+
+
+def test_histogram_buckets_are_cumulative(registry):
+    """Test histogram bucket, sum and count lines."""
+    histogram = registry.histogram("test_seconds", "Latency", ["stage"], buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.7, 3.0):
+        histogram.observe(value, stage="forward")
+
+    text = registry.render()
+    assert 'test_seconds_bucket{stage="forward",le="0.1"} 1' in text
+    assert 'test_seconds_bucket{stage="forward",le="1"} 3' in text
+    assert 'test_seconds_bucket{stage="forward",le="+Inf"} 4' in text
+    assert 'test_seconds_sum{stage="forward"} 4.25' in text
+    assert 'test_seconds_count{stage="forward"} 4' in text
+
+
+def test_histogram_time_context(registry):
+    """Test timing a block."""
+    histogram = registry.histogram("test_block_seconds", "Block", ["stage"])
+    with histogram.time(stage="trim"):
+        pass
+    assert histogram.count(stage="trim") == 1
+
+
+def test_gauge_collect_callback(registry):
+    """Test gauges computed at scrape time."""
+    inflight = registry.gauge("test_inflight", "In flight")
+    inflight.inc()
+    inflight.inc()
+    inflight.dec()
+    registry.gauge("test_cache_entries", "Entries", ["cache"], collect=lambda: {("voices",): 5})
+
+    text = registry.render()
+    assert "test_inflight 1" in text
+    assert 'test_cache_entries{cache="voices"} 5' in text
+
+
+def test_observe_is_cheap(registry):
+    """Test that instrumentation overhead stays in the microsecond range."""
+    histogram = registry.histogram("test_overhead_seconds", "Overhead", ["stage"])
+    start = time.perf_counter()
+    for _ in range(100_000):
+        histogram.observe(0.01, stage="g2p")
+    per_call = (time.perf_counter() - start) / 100_000
+    assert per_call < 50e-6
+
+
+def test_metrics_endpoint():
+    """Test the /metrics endpoint exposes the service metrics."""
+    register_cache("test_cache", lambda: {"entries": 2, "bytes": 128})
+    response = TestClient(app).get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    for name in (
+        "kokoro_stage_duration_seconds",
+        "kokoro_time_to_first_byte_seconds",
+        "kokoro_requests_total",
+        "kokoro_chunks_total",
+        "kokoro_audio_seconds_total",
+        "kokoro_errors_total",
+        "kokoro_inflight_streams",
+    ):
+        assert f"# TYPE {name} " in response.text
+    assert 'kokoro_cache_entries{cache="test_cache"} 2' in response.text
+    assert 'kokoro_cache_bytes{cache="test_cache"} 128' in response.text
+
+
+def test_captioned_speech_counts_requests_and_errors():
+    """Test that captioned speech is counted like /v1/audio/speech."""
+    requests = REQUESTS.value(endpoint="captioned_speech", stream="false")
+    errors = ERRORS.value(type="RuntimeError")
+    app.dependency_overrides[development.get_tts_service] = lambda: MagicMock()
+    try:
+        with patch.object(
+            development, "get_tts_service", AsyncMock(return_value=MagicMock())
+        ), patch.object(
+            development,
+            "process_and_validate_voices",
+            AsyncMock(side_effect=RuntimeError("no voices")),
+        ):
+            response = TestClient(app).post(
+                "/dev/captioned_speech",
+                json={"input": "Hello", "voice": "af_heart", "stream": False},
+            )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 500
+    assert REQUESTS.value(endpoint="captioned_speech", stream="false") == requests + 1
+    assert ERRORS.value(type="RuntimeError") == errors + 1
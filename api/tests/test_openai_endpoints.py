@@ -1,6 +1,8 @@
 import asyncio
 import json
 import os
+import threading
+import time
 from typing import AsyncGenerator, Tuple
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -10,12 +12,14 @@ from fastapi.testclient import TestClient
 
 from api.src.core.config import settings
 from api.src.inference.base import AudioChunk
+from api.src.inference.executor import InferenceExecutor
 from api.src.main import app
 from api.src.routers.openai_compatible import (
     get_tts_service,
     load_openai_mappings,
     stream_audio_chunks,
 )
+from api.src.services.scheduler import ChunkScheduler, SchedulerFullError
 from api.src.services.streaming_audio_writer import StreamingAudioWriter
 from api.src.services.tts_service import TTSService
 from api.src.structures.schemas import OpenAISpeechRequest
@@ -170,6 +174,59 @@ async def test_stream_audio_chunks_client_disconnect():
     assert len(chunks) == 0  # Should stop immediately due to disconnect
 
 
+@pytest.mark.asyncio
+async def test_stream_audio_chunks_cancels_generation_on_disconnect():
+    """Test that a disconnect stops inference and frees the slot within one chunk"""
+    executor = InferenceExecutor("thread", workers=1)
+    scheduler = ChunkScheduler(max_concurrent=1)
+    produced = []
+    forward_closed = threading.Event()
+
+    def forward():
+        try:
+            for i in range(100):
+                time.sleep(0.5)
+                produced.append(i)
+                yield i
+        finally:
+            forward_closed.set()
+
+    async def mock_stream(*args, **kwargs):
+        async with scheduler.open_stream().slot():
+            async for _ in executor.iterate(forward):
+                yield AudioChunk(np.zeros(10, np.int16), output=b"chunk")
+
+    mock_service = AsyncMock()
+    mock_service.generate_audio_stream = mock_stream
+    mock_service.list_voices.return_value = ["test_voice"]
+    disconnected = False
+
+    async def is_disconnected():
+        return disconnected
+
+    mock_request = MagicMock()
+    mock_request.is_disconnected = is_disconnected
+    request = OpenAISpeechRequest(input="Test text", voice="test_voice")
+    writer = StreamingAudioWriter("mp3", 24000)
+
+    chunks = stream_audio_chunks(mock_service, request, mock_request, writer)
+    await chunks.__anext__()
+    disconnected = True
+    start = time.perf_counter()
+    remaining = [chunk async for chunk in chunks]
+    stopped_after = time.perf_counter() - start
+    writer.close()
+
+    # The stream ends without waiting for the chunk being generated
+    assert remaining == []
+    assert stopped_after < 0.4
+    # The worker finishes at most the item it was producing
+    assert forward_closed.wait(timeout=1)
+    assert len(produced) <= 2
+    assert scheduler.stats()["active"] == 0
+    executor.shutdown(wait=True)
+
+
 def test_openai_voice_mapping(mock_tts_service, mock_openai_mappings):
     """Test OpenAI voice name mapping"""
     mock_tts_service.list_voices.return_value = ["am_adam", "bf_isabella"]
@@ -189,6 +246,31 @@ def test_openai_voice_mapping(mock_tts_service, mock_openai_mappings):
     assert mock_tts_service.generate_audio.call_args[1]["voice"] == "am_adam"
 
 
+def test_speech_rejected_when_queue_full(mock_tts_service, mock_openai_mappings):
+    """Test that a full scheduler queue returns 429 with Retry-After"""
+    mock_tts_service.list_voices.return_value = ["am_adam", "bf_isabella"]
+    scheduler = MagicMock()
+    scheduler.check_admission.side_effect = SchedulerFullError("batch", 64, 7)
+    with patch(
+        "api.src.routers.openai_compatible.get_scheduler", return_value=scheduler
+    ):
+        response = client.post(
+            "/v1/audio/speech",
+            json={
+                "model": "tts-1",
+                "input": "Hello world",
+                "voice": "alloy",
+                "stream": False,
+                "priority": "batch",
+            },
+        )
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "7"
+    assert response.json()["detail"]["error"] == "server_busy"
+    scheduler.check_admission.assert_called_once_with("batch")
+    mock_tts_service.generate_audio.assert_not_called()
+
+
 def test_openai_voice_mapping_streaming(
     mock_tts_service, mock_openai_mappings, mock_audio_bytes
 ):
@@ -497,3 +579,91 @@ async def test_streaming_initialization_error():
 
     writer.close()
     assert "Failed to initialize stream" in str(exc.value)
+
+
+@pytest.fixture
+def response_cache(tmp_path):
+    """Enable an isolated response cache for the endpoint."""
+    from api.src.services.response_cache import ResponseCache
+
+    cache = ResponseCache(
+        memory_bytes=1024 * 1024, disk_bytes=1024 * 1024, cache_dir=str(tmp_path)
+    )
+    with patch(
+        "api.src.routers.openai_compatible.get_response_cache", return_value=cache
+    ):
+        yield cache
+
+
+@pytest.mark.parametrize("stream", [True, False])
+@patch("api.src.services.audio.AudioService.convert_audio")
+def test_openai_speech_response_cache(
+    mock_convert, stream, mock_tts_service, response_cache, test_voice, mock_audio_bytes
+):
+    """Test that repeated requests are served from the response cache"""
+    mock_convert.return_value = AudioChunk(
+        np.zeros(1000, np.int16), output=mock_audio_bytes
+    )
+    payload = {
+        "model": "kokoro",
+        "input": "Done.",
+        "voice": test_voice,
+        "response_format": "mp3",
+        "stream": stream,
+    }
+
+    first = client.post("/v1/audio/speech", json=payload)
+    second = client.post("/v1/audio/speech", json=payload)
+
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.content == first.content
+    assert len(second.content) > 0
+    if not stream:
+        mock_tts_service.generate_audio.assert_called_once()
+
+    stats = response_cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+    # A different speed is a different response
+    payload["speed"] = 1.5
+    assert client.post("/v1/audio/speech", json=payload).headers["X-Cache"] == "MISS"
+
+
+@pytest.mark.parametrize("stream", [True, False])
+@patch("api.src.services.audio.AudioService.convert_audio")
+def test_openai_speech_failed_chunks_not_cached(
+    mock_convert, stream, mock_tts_service, response_cache, test_voice, mock_audio_bytes
+):
+    """Test that audio with skipped chunks is served but not cached"""
+    mock_convert.return_value = AudioChunk(
+        np.zeros(1000, np.int16), output=mock_audio_bytes
+    )
+
+    async def failing_stream(*args, failed_chunks=None, **kwargs):
+        failed_chunks.append("Broken sentence.")
+        yield AudioChunk(np.ndarray([], np.int16), output=mock_audio_bytes)
+
+    async def failing_generate(*args, failed_chunks=None, **kwargs):
+        failed_chunks.append("Broken sentence.")
+        return AudioChunk(np.zeros(1000, np.int16))
+
+    mock_tts_service.generate_audio_stream = failing_stream
+    mock_tts_service.generate_audio.side_effect = failing_generate
+    payload = {
+        "model": "kokoro",
+        "input": "Fine sentence. Broken sentence.",
+        "voice": test_voice,
+        "response_format": "mp3",
+        "stream": stream,
+    }
+
+    first = client.post("/v1/audio/speech", json=payload)
+    second = client.post("/v1/audio/speech", json=payload)
+
+    assert first.status_code == 200
+    assert len(first.content) > 0
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "MISS"
+    assert response_cache.stats()["hits"] == 0
@@ -0,0 +1,109 @@
+from unittest.mock import MagicMock
+
+from misaki.token import MToken
+
+from api.src.core.phoneme_cache import PHONEME_CACHE_REQUESTS, PhonemeCache
+from api.src.services.text_processing import phonemizer
+
+
+def make_g2p():
+    def g2p(text):
+        tokens = [
+            MToken(word, "NN", " ", phonemes=word.upper(), _=MToken.Underscore(is_head=True))
+            for word in text.split()
+        ]
+        return " ".join(t.phonemes for t in tokens), tokens
+
+    return MagicMock(side_effect=g2p)
+
+
+def test_get_or_compute_counts_hits_and_misses():
+    """Test that repeated texts are computed once per language."""
+    cache = PhonemeCache(max_entries=10)
+    compute = MagicMock(side_effect=str.upper)
+    hits = PHONEME_CACHE_REQUESTS.value(backend="espeak", result="hit")
+
+    assert cache.get_or_compute("espeak", "a", "hello", compute) == "HELLO"
+    assert cache.get_or_compute("espeak", "a", "hello", compute) == "HELLO"
+    assert cache.get_or_compute("espeak", "b", "hello", compute) == "HELLO"
+
+    assert compute.call_count == 2
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+    assert PHONEME_CACHE_REQUESTS.value(backend="espeak", result="hit") == hits + 1
+
+
+def test_disabled_cache_always_computes():
+    """Test that a zero-size cache stores nothing."""
+    cache = PhonemeCache(max_entries=0)
+    compute = MagicMock(side_effect=str.upper)
+    cache.get_or_compute("espeak", "a", "hello", compute)
+    cache.get_or_compute("espeak", "a", "hello", compute)
+    assert compute.call_count == 2
+    assert cache.stats()["entries"] == 0
+
+
+def test_cached_g2p_returns_independent_tokens():
+    """Test that callers can write timestamps without touching the cache."""
+    g2p = make_g2p()
+    cached = PhonemeCache(max_entries=10).wrap_g2p(g2p, "a")
+
+    ps, tokens = cached("hello world")
+    tokens[0].start_ts = 1.5
+    ps_again, tokens_again = cached("hello world")
+
+    assert g2p.call_count == 1
+    assert ps_again == ps == "HELLO WORLD"
+    assert [t.text for t in tokens_again] == ["hello", "world"]
+    assert tokens_again[0].start_ts is None
+
+
+def test_cached_g2p_drops_tokens_for_other_languages():
+    """Test that non-English pipelines only cache phonemes."""
+    cached = PhonemeCache(max_entries=10).wrap_g2p(make_g2p(), "j")
+    assert cached("konnichiwa") == ("KONNICHIWA", None)
+
+
+def test_save_and_load_round_trip(tmp_path):
+    """Test that a restarted cache starts warm from the persistence file."""
+    path = str(tmp_path / "cache" / "phonemes.json")
+    cache = PhonemeCache(max_entries=10)
+    cache.get_or_compute("espeak", "a", "hello", str.upper)
+    cache.wrap_g2p(make_g2p(), "a")("hello world")
+    assert cache.save(path) == 2
+
+    restored = PhonemeCache(max_entries=10)
+    assert restored.load(path) == 2
+    g2p = make_g2p()
+    ps, tokens = restored.wrap_g2p(g2p, "a")("hello world")
+
+    g2p.assert_not_called()
+    assert ps == "HELLO WORLD"
+    assert tokens[0].text == "hello"
+    assert tokens[0].whitespace == " "
+    assert tokens[0]._.is_head is True
+    assert restored.get_or_compute("espeak", "a", "hello", MagicMock()) == "HELLO"
+
+
+def test_load_ignores_missing_and_corrupt_files(tmp_path):
+    """Test that a bad persistence file leaves the cache empty."""
+    cache = PhonemeCache(max_entries=10)
+    assert cache.load(str(tmp_path / "missing.json")) == 0
+
+    corrupt = tmp_path / "corrupt.json"
+    corrupt.write_text("{not json")
+    assert cache.load(str(corrupt)) == 0
+    assert cache.stats()["entries"] == 0
+
+
+def test_phonemize_uses_cache(monkeypatch):
+    """Test that espeak runs once for a repeated sentence."""
+    cache = PhonemeCache(max_entries=10)
+    monkeypatch.setattr(phonemizer, "get_phoneme_cache", lambda: cache)
+    backend = MagicMock()
+    backend.phonemize.return_value = " həlˈoʊ "
+    monkeypatch.setitem(phonemizer.phonemizers, "a", backend)
+
+    assert phonemizer.phonemize(" Hello ") == "həlˈoʊ"
+    assert phonemizer.phonemize("Hello") == "həlˈoʊ"
+    backend.phonemize.assert_called_once_with("Hello")
@@ -0,0 +1,117 @@
+"""Tests for the dynamic int8 model variant, on a tiny random-weight model"""
+
+import os
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import torch
+import torch.ao.nn.quantized.dynamic as nnqd
+from kokoro import KModel
+
+from api.src.inference import quantization
+from api.src.inference.batching import forward_batch
+from api.src.inference.kokoro_v1 import KokoroV1
+
+PHONEMES = "həlˈO wˈɜɹld, ðɪs ɪz ə tˈɛst."
+
+
+def config_path(model_path):
+    return os.path.join(os.path.dirname(model_path), "config.json")
+
+
+def test_linear_and_lstm_layers_quantized(tiny_model_path):
+    """Linear and LSTM weights are int8 and the model still runs, batched too"""
+    model = quantization.load_quantized_model(
+        config_path(tiny_model_path), tiny_model_path
+    )
+    layers = list(model.modules())
+    assert any(isinstance(m, nnqd.Linear) for m in layers)
+    assert any(isinstance(m, nnqd.LSTM) for m in layers)
+    assert not any(type(m) in (torch.nn.Linear, torch.nn.LSTM) for m in layers)
+
+    torch.manual_seed(0)
+    ref_s = torch.randn(1, 256)
+    input_ids = torch.LongTensor([0, *map(model.vocab.get, "həlˈO"), 0])
+    (batched,) = forward_batch(model, [input_ids], ref_s, torch.ones(1))
+    assert torch.isfinite(batched.audio).all()
+
+
+def test_quantized_close_to_fp32(tiny_model_path, spectral_distance):
+    """Durations stay within a frame of fp32, audio as close as another fp32 run.
+
+    With random weights the vocoder output is noise-like and a duration one
+    frame off shifts all audio after it, so the audio is only checked to be
+    no further from fp32 than fp32 with other random phases.
+    """
+    model = quantization.load_quantized_model(
+        config_path(tiny_model_path), tiny_model_path
+    )
+    fp32 = KModel(config=config_path(tiny_model_path), model=tiny_model_path).eval()
+    torch.manual_seed(0)
+    ref_s = torch.randn(1, 256)
+    with torch.no_grad():
+        torch.manual_seed(1)
+        expected = fp32(PHONEMES, ref_s, return_output=True)
+        torch.manual_seed(2)
+        rerun = fp32(PHONEMES, ref_s, return_output=True)
+        torch.manual_seed(1)
+        output = model(PHONEMES, ref_s, return_output=True)
+
+    assert output.pred_dur.shape == expected.pred_dur.shape
+    diff = (output.pred_dur - expected.pred_dur).abs()
+    assert diff.max() <= 1
+    assert (diff == 0).float().mean() >= 0.9
+    assert torch.isfinite(output.audio).all()
+    assert spectral_distance(output.audio, expected.audio) <= 1.1 * spectral_distance(
+        rerun.audio, expected.audio
+    )
+
+
+def test_quantized_weights_cached(tiny_model_path):
+    """Later loads reuse the cached weights unless the model or torch changed"""
+    config = config_path(tiny_model_path)
+    quantized_path = quantization.get_quantized_path(tiny_model_path)
+    first = quantization.load_quantized_model(config, tiny_model_path)
+    assert os.path.exists(quantized_path)
+
+    with patch.object(quantization, "KModel", wraps=KModel) as build:
+        cached = quantization.load_quantized_model(config, tiny_model_path)
+    # Only the untrained layout is built, the fp32 weights are not read
+    assert build.call_args.kwargs["model"] != tiny_model_path
+    ref_s = torch.randn(1, 256)
+    with torch.no_grad():
+        assert torch.equal(
+            first(PHONEMES, ref_s, return_output=True).pred_dur,
+            cached(PHONEMES, ref_s, return_output=True).pred_dur,
+        )
+
+    saved = torch.load(quantized_path, weights_only=False)
+    saved["torch_version"] = "0.0"
+    torch.save(saved, quantized_path)
+    with patch.object(quantization, "KModel", wraps=KModel) as build:
+        quantization.load_quantized_model(config, tiny_model_path)
+    assert build.call_args.kwargs["model"] == tiny_model_path
+
+
+@pytest.mark.asyncio
+async def test_backend_loads_quantized_on_cpu(tiny_model_path):
+    """MODEL_QUANTIZATION picks the quantized or fp32 model"""
+    backend = KokoroV1()
+    backend._device = "cpu"
+    with patch(
+        "api.src.inference.kokoro_v1.paths.get_model_path",
+        AsyncMock(return_value=tiny_model_path),
+    ), patch("api.src.inference.kokoro_v1.settings") as mock_settings, patch(
+        "api.src.inference.kokoro_v1.load_quantized_model",
+        wraps=quantization.load_quantized_model,
+    ) as load_quantized:
+        mock_settings.model_quantization = "int8"
+        mock_settings.batching_enabled = False
+        await backend.load_model(tiny_model_path)
+        load_quantized.assert_called_once()
+        assert any(isinstance(m, nnqd.Linear) for m in backend._model.modules())
+
+        mock_settings.model_quantization = "none"
+        await backend.load_model(tiny_model_path)
+        load_quantized.assert_called_once()
+        assert not any(isinstance(m, nnqd.Linear) for m in backend._model.modules())
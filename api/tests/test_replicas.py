@@ -0,0 +1,147 @@
+"""Tests for model replicas and their dispatcher"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+import torch
+
+from api.src.core.config import settings
+from api.src.inference.base import AudioChunk
+from api.src.inference.model_manager import ModelManager
+from api.src.inference.replicas import REPLICA_REQUESTS, ReplicaDispatcher
+
+
+@pytest.mark.asyncio
+async def test_dispatch_least_loaded_then_round_robin():
+    """Busy replicas are skipped, idle ones take turns"""
+    dispatcher = ReplicaDispatcher([MagicMock(), MagicMock(), MagicMock()])
+    requests = REPLICA_REQUESTS.value(replica="2")
+
+    async with dispatcher.acquire() as first:
+        async with dispatcher.acquire() as second:
+            async with dispatcher.acquire() as third:
+                assert [first.index, second.index, third.index] == [0, 1, 2]
+                assert [r["active"] for r in dispatcher.stats()] == [1, 1, 1]
+        # Replica 1 and 2 are idle again, 1 is next in turn
+        async with dispatcher.acquire() as fourth:
+            assert fourth.index == 1
+        async with dispatcher.acquire() as fifth:
+            assert fifth.index == 2
+
+    stats = dispatcher.stats()
+    assert [r["requests"] for r in stats] == [1, 2, 2]
+    assert all(r["active"] == 0 for r in stats)
+    assert all(r.busy_seconds > 0 for r in dispatcher.replicas)
+    assert REPLICA_REQUESTS.value(replica="2") == requests + 2
+    assert dispatcher.active_counts() == {("0",): 0, ("1",): 0, ("2",): 0}
+
+
+@pytest.mark.asyncio
+async def test_replicas_share_weights(tiny_model_path):
+    """Replicas run on the primary's weights with the cores split between them"""
+    threads = torch.get_num_threads()
+    manager = ModelManager()
+    try:
+        with patch("api.src.inference.model_manager.settings") as mock_settings, patch(
+            "api.src.inference.kokoro_v1.paths.get_model_path",
+            AsyncMock(return_value=tiny_model_path),
+        ), patch("os.cpu_count", return_value=8):
+            mock_settings.inference_backend = "pytorch"
+            mock_settings.use_gpu = False
+            mock_settings.model_replicas = 4
+            mock_settings.replica_threads = 0
+            await manager.initialize()
+            await manager.load_model(tiny_model_path)
+
+        assert torch.get_num_threads() == 2
+        backends = [r.backend for r in manager._replicas.replicas]
+        assert manager.get_backend() is backends[0]
+        assert all(b._model is backends[0]._model for b in backends)
+        assert all(b._pipelines is backends[0]._pipelines for b in backends)
+        assert len({id(b._executor) for b in backends}) == 4
+    finally:
+        torch.set_num_threads(threads)
+        manager.unload_all()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_generations_spread_over_replicas():
+    """Chunks generated at the same time run on different replicas"""
+    started = []
+    release = asyncio.Event()
+
+    def make_backend(index):
+        async def generate(*args, **kwargs):
+            started.append(index)
+            await release.wait()
+            yield AudioChunk(np.zeros(10, dtype=np.float32))
+
+        backend = MagicMock()
+        backend.generate = generate
+        return backend
+
+    manager = ModelManager()
+    manager._replicas = ReplicaDispatcher([make_backend(0), make_backend(1)])
+    manager._backend = manager._replicas.replicas[0].backend
+
+    async def consume():
+        return [chunk async for chunk in manager.generate("text", ("voice", "path"))]
+
+    tasks = [asyncio.create_task(consume()) for _ in range(2)]
+    while len(started) < 2:
+        await asyncio.sleep(0)
+    assert sorted(started) == [0, 1]
+    assert [r["active"] for r in manager.replica_stats()] == [1, 1]
+
+    release.set()
+    results = await asyncio.gather(*tasks)
+    assert all(len(chunks) == 1 for chunks in results)
+    assert [r["active"] for r in manager.replica_stats()] == [0, 0]
+
+
+@pytest.mark.asyncio
+async def test_replica_forwards_stay_within_core_budget():
+    """Forwards running at once on all replicas together use at most the cores"""
+    threads = torch.get_num_threads()
+    manager = ModelManager()
+    running = []
+    budgets = []
+    lock = threading.Lock()
+
+    def forward():
+        with lock:
+            running.append(None)
+            budgets.append(len(running) * torch.get_num_threads())
+        time.sleep(0.05)
+        with lock:
+            running.pop()
+
+    try:
+        with patch.multiple(
+            settings,
+            inference_backend="pytorch",
+            inference_executor="thread",
+            inference_workers=4,
+            use_gpu=False,
+            model_replicas=4,
+            replica_threads=0,
+        ), patch.dict(
+            "api.src.inference.executor._executors", clear=True
+        ), patch("os.cpu_count", return_value=8):
+            await manager.initialize()
+            executors = [r.backend._executor for r in manager._replicas.replicas]
+            await asyncio.gather(
+                *(executor.run(forward) for executor in executors for _ in range(4))
+            )
+            for executor in executors:
+                executor.shutdown(wait=True)
+    finally:
+        torch.set_num_threads(threads)
+
+    assert all(executor.workers == 1 for executor in executors)
+    assert len(budgets) == 16
+    assert max(budgets) <= 8
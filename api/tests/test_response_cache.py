@@ -0,0 +1,136 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from api.src.core.config import settings
+from api.src.core.model_config import model_config
+from api.src.services.response_cache import (
+    ResponseCache,
+    config_fingerprint,
+    iter_cached,
+)
+from api.src.structures.schemas import NormalizationOptions, OpenAISpeechRequest
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(memory_bytes=10, disk_bytes=20, cache_dir=str(tmp_path))
+
+
+def test_make_key_covers_output_options():
+    """Test that keys only change with options that affect the audio."""
+    request = OpenAISpeechRequest(input="Done.", voice="af_heart")
+    key = ResponseCache.make_key(request, "af_heart")
+
+    assert key == ResponseCache.make_key(
+        OpenAISpeechRequest(input="  Done.\n", voice="af_heart", stream=False),
+        "af_heart",
+    )
+    for changed in (
+        {"speed": 1.5},
+        {"response_format": "wav"},
+        {"lang_code": "b"},
+        {"volume_multiplier": 2.0},
+        {"normalization_options": NormalizationOptions(normalize=False)},
+    ):
+        other = OpenAISpeechRequest(input="Done.", voice="af_heart", **changed)
+        assert ResponseCache.make_key(other, "af_heart") != key
+    assert ResponseCache.make_key(request, "af_bella") != key
+
+
+@pytest.mark.parametrize(
+    "setting, value",
+    [
+        ("inference_backend", "onnx"),
+        ("model_quantization", "int8"),
+        ("model_dir", "/elsewhere"),
+        ("gap_trim_ms", 5),
+        ("dynamic_gap_trim_padding_ms", 100),
+    ],
+)
+def test_make_key_covers_server_config(setting, value):
+    """Test that responses made under another configuration are not served."""
+    request = OpenAISpeechRequest(input="Done.", voice="af_heart")
+    config_fingerprint.cache_clear()
+    key = ResponseCache.make_key(request, "af_heart")
+    try:
+        with patch.object(settings, setting, value):
+            config_fingerprint.cache_clear()
+            assert ResponseCache.make_key(request, "af_heart") != key
+    finally:
+        config_fingerprint.cache_clear()
+
+
+def test_make_key_covers_model_file(tmp_path):
+    """Test that replacing the model weights changes every key."""
+    request = OpenAISpeechRequest(input="Done.", voice="af_heart")
+    weights = tmp_path / model_config.pytorch_kokoro_v1_file
+    weights.parent.mkdir(parents=True, exist_ok=True)
+    weights.write_bytes(b"old")
+    try:
+        with patch.object(settings, "model_dir", str(tmp_path)):
+            config_fingerprint.cache_clear()
+            key = ResponseCache.make_key(request, "af_heart")
+            os.utime(weights, (os.path.getmtime(weights) + 10,) * 2)
+            config_fingerprint.cache_clear()
+            assert ResponseCache.make_key(request, "af_heart") != key
+    finally:
+        config_fingerprint.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_memory_and_disk_hits(cache, tmp_path):
+    """Test that entries are served from memory, then from disk once evicted."""
+    await cache.put("a", b"aaaaaa")
+    await cache.put("b", b"bbbbbb")  # Memory budget exceeded, a only on disk
+
+    assert await cache.get("b") == b"bbbbbb"
+    assert await cache.get("a") == b"aaaaaa"
+    assert await cache.get("missing") is None
+
+    stats = cache.stats()
+    assert stats["memory_hits"] == 1
+    assert stats["disk_hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == pytest.approx(2 / 3)
+    assert sorted(os.listdir(tmp_path)) == ["a.bin", "b.bin"]
+
+
+@pytest.mark.asyncio
+async def test_disk_eviction_removes_files(cache, tmp_path):
+    """Test that the disk tier stays within its byte budget."""
+    for key in "abc":
+        await cache.put(key, key.encode() * 8)
+
+    assert sorted(os.listdir(tmp_path)) == ["b.bin", "c.bin"]
+    assert cache.stats()["disk"]["bytes"] == 16
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_survives_restart(cache, tmp_path):
+    """Test that a new cache indexes existing files."""
+    await cache.put("a", b"aaaaaa")
+
+    reopened = ResponseCache(memory_bytes=10, disk_bytes=20, cache_dir=str(tmp_path))
+    assert await reopened.get("a") == b"aaaaaa"
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_stores_nothing(tmp_path):
+    """Test that zero budgets disable the cache."""
+    cache = ResponseCache(memory_bytes=0, disk_bytes=0, cache_dir=str(tmp_path / "off"))
+    await cache.put("a", b"aaaaaa")
+
+    assert not cache.enabled
+    assert await cache.get("a") is None
+    assert not os.path.exists(tmp_path / "off")
+
+
+@pytest.mark.asyncio
+async def test_iter_cached_reassembles():
+    """Test that streamed hits reproduce the cached bytes."""
+    data = os.urandom(200 * 1024)
+    parts = [part async for part in iter_cached(data)]
+    assert len(parts) == 4
+    assert b"".join(parts) == data
@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+
+from api.src.services.scheduler import (
+    QUEUE_WAIT_SECONDS,
+    ChunkScheduler,
+    SchedulerFullError,
+)
+
+
+async def run_chunk(stream, name, order, release):
+    async with stream.slot():
+        order.append(name)
+        await release.wait()
+
+
+async def queue_chunks(scheduler, chunks):
+    """Hold the only slot, queue chunks behind it and return them in run order."""
+    order = []
+    release = asyncio.Event()
+    blocker = asyncio.create_task(run_chunk(scheduler.open_stream(), "blocker", order, release))
+    await asyncio.sleep(0)
+    tasks = []
+    for stream, name in chunks:
+        tasks.append(asyncio.create_task(run_chunk(stream, name, order, release)))
+        await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(blocker, *tasks)
+    return order[1:]
+
+
+@pytest.mark.asyncio
+async def test_round_robin_between_streams():
+    """Test that a long stream takes turns with a stream that queued later."""
+    scheduler = ChunkScheduler(max_concurrent=1)
+    a, b = scheduler.open_stream(), scheduler.open_stream()
+    order = await queue_chunks(scheduler, [(a, "a1"), (a, "a2"), (a, "a3"), (b, "b1")])
+    assert order == ["a1", "b1", "a2", "a3"]
+
+
+@pytest.mark.asyncio
+async def test_interactive_chunks_go_before_batch():
+    """Test that batch work only gets slots nobody interactive is waiting for."""
+    scheduler = ChunkScheduler(max_concurrent=1)
+    batch = scheduler.open_stream("batch")
+    interactive = scheduler.open_stream("interactive")
+    waits = QUEUE_WAIT_SECONDS.count(priority="batch")
+    order = await queue_chunks(
+        scheduler, [(batch, "batch1"), (batch, "batch2"), (interactive, "interactive")]
+    )
+    assert order == ["interactive", "batch1", "batch2"]
+    assert QUEUE_WAIT_SECONDS.count(priority="batch") == waits + 2
+
+
+@pytest.mark.asyncio
+async def test_check_admission_rejects_full_queue():
+    """Test that requests are refused per priority once the queue is full."""
+    scheduler = ChunkScheduler(max_concurrent=1, max_queue_depth=1)
+    release = asyncio.Event()
+    order = []
+    tasks = [
+        asyncio.create_task(run_chunk(scheduler.open_stream("batch"), name, order, release))
+        for name in ("running", "waiting")
+    ]
+    await asyncio.sleep(0)
+
+    # Interactive chunks would not wait behind the queued batch chunk
+    scheduler.check_admission("interactive")
+    with pytest.raises(SchedulerFullError) as error:
+        scheduler.check_admission("batch")
+    assert error.value.retry_after >= 1
+
+    release.set()
+    await asyncio.gather(*tasks)
+    scheduler.check_admission("batch")
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_queue():
+    """Test that a chunk cancelled while waiting gives up its place."""
+    scheduler = ChunkScheduler(max_concurrent=1)
+    release = asyncio.Event()
+    order = []
+    running = asyncio.create_task(run_chunk(scheduler.open_stream(), "running", order, release))
+    await asyncio.sleep(0)
+    waiting = asyncio.create_task(run_chunk(scheduler.open_stream(), "waiting", order, release))
+    await asyncio.sleep(0)
+    assert scheduler.queue_depth() == 1
+
+    waiting.cancel()
+    await asyncio.sleep(0)
+    assert scheduler.queue_depth() == 0
+
+    release.set()
+    await running
+    assert order == ["running"]
+    assert scheduler.stats()["active"] == 0
+
+
+@pytest.mark.asyncio
+async def test_release_right_after_cancel_keeps_slot():
+    """Test that a slot released before a cancelled waiter resumes is not lost."""
+    scheduler = ChunkScheduler(max_concurrent=1)
+    held = scheduler.open_stream().slot()
+    await held.__aenter__()
+    order = []
+    waiting = asyncio.create_task(
+        run_chunk(scheduler.open_stream(), "waiting", order, asyncio.Event())
+    )
+    await asyncio.sleep(0)
+
+    # Both in the same tick, before the waiter sees its cancellation
+    waiting.cancel()
+    await held.__aexit__(None, None, None)
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+
+    assert order == []
+    assert scheduler.stats()["active"] == 0
+    assert scheduler.queue_depth() == 0
+    release = asyncio.Event()
+    release.set()
+    await asyncio.wait_for(
+        run_chunk(scheduler.open_stream(), "next", order, release), timeout=1
+    )
+    assert order == ["next"]
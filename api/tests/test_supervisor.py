@@ -0,0 +1,160 @@
+"""Tests for the pre-fork supervisor"""
+
+import os
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import torch
+from kokoro import KModel
+
+from api.src.core.config import settings
+from api.src.inference.model_manager import ModelManager
+from api.src.supervisor import Supervisor, fold_weight_norm, preload, start_batchers
+
+
+def test_dead_workers_restarted(tmp_path):
+    """Workers that exit are forked again until the supervisor stops"""
+    log = tmp_path / "starts.log"
+
+    def target(slot):
+        with open(log, "a") as f:
+            f.write(f"{slot}\n")
+        time.sleep(0.05)
+        raise RuntimeError("worker crashed")
+
+    supervisor = Supervisor(2, target, restart_delay=0)
+    supervisor.start()
+    watcher = threading.Thread(target=supervisor.watch)
+    watcher.start()
+    try:
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            if log.exists() and len(log.read_text().split()) >= 6:
+                break
+            time.sleep(0.05)
+    finally:
+        supervisor.stop()
+        watcher.join(timeout=10)
+
+    assert not watcher.is_alive()
+    starts = log.read_text().split()
+    assert starts.count("0") >= 2 and starts.count("1") >= 2
+    assert supervisor.restarts >= 4
+    assert not supervisor._children
+
+
+def test_stop_terminates_workers():
+    """Stopping passes the signal on and nothing is restarted"""
+    supervisor = Supervisor(2, lambda slot: time.sleep(60), restart_delay=0)
+    supervisor.start()
+    pids = list(supervisor._children)
+    supervisor.stop()
+    supervisor.watch()
+
+    assert supervisor.restarts == 0
+    for pid in pids:
+        with pytest.raises(ProcessLookupError):
+            os.kill(pid, 0)
+
+
+def test_fold_weight_norm_keeps_output(tiny_model_path):
+    """Folded weights give the same audio as weight norm"""
+    config_path = os.path.join(os.path.dirname(tiny_model_path), "config.json")
+    model = KModel(config=config_path, model=tiny_model_path).eval()
+    phonemes = "həlˈO wˈɜɹld."
+    ref_s = torch.randn(1, 256)
+
+    with torch.no_grad():
+        torch.manual_seed(1)
+        expected = model(phonemes, ref_s, return_output=True)
+        assert fold_weight_norm(model) > 0
+        torch.manual_seed(1)
+        output = model(phonemes, ref_s, return_output=True)
+
+    assert not any(hasattr(m, "weight_g") for m in model.modules())
+    assert torch.equal(output.pred_dur, expected.pred_dur)
+    assert torch.allclose(output.audio, expected.audio, atol=1e-4)
+
+
+@pytest.mark.asyncio
+async def test_warmup_uses_preloaded_model():
+    """Workers forked with a loaded model only warm it up"""
+    manager = ModelManager()
+    manager._backend = MagicMock(is_loaded=True)
+    manager._device = "cpu"
+
+    async def generate(*args, **kwargs):
+        yield None
+
+    with patch.object(manager, "initialize", AsyncMock()) as initialize, patch.object(
+        manager, "load_model", AsyncMock()
+    ) as load_model, patch.object(manager, "generate", generate), patch(
+        "api.src.inference.model_manager.paths.list_voices",
+        AsyncMock(return_value=["af_heart"]),
+    ), patch(
+        "api.src.inference.model_manager.paths.get_voice_path",
+        AsyncMock(return_value="af_heart.pt"),
+    ):
+        device, _, voices = await manager.initialize_with_warmup(MagicMock())
+
+    initialize.assert_not_called()
+    load_model.assert_not_called()
+    assert (device, voices) == ("cpu", 1)
+
+
+@pytest.mark.asyncio
+async def test_batcher_started_after_fork(tiny_model_path):
+    """Batched forwards run in a forked worker"""
+    manager = ModelManager()
+    voice_manager = MagicMock(list_voices=AsyncMock(return_value=[]))
+    with patch.object(ModelManager, "_instance", manager), patch.multiple(
+        settings,
+        batching_enabled=True,
+        inference_executor="thread",
+        inference_workers=2,
+        inference_backend="pytorch",
+        use_gpu=False,
+        model_replicas=1,
+    ), patch(
+        "api.src.supervisor.paths.get_model_path",
+        AsyncMock(return_value=tiny_model_path),
+    ), patch(
+        "api.src.inference.kokoro_v1.paths.get_model_path",
+        AsyncMock(return_value=tiny_model_path),
+    ), patch(
+        "api.src.inference.voice_manager.get_manager",
+        AsyncMock(return_value=voice_manager),
+    ):
+        threads = torch.get_num_threads()
+        try:
+            await preload()
+        finally:
+            torch.set_num_threads(threads)
+        backend = manager.get_backend()
+        assert backend._batcher is None
+
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                start_batchers()
+                output = backend._batcher.submit("həlˈO", torch.randn(1, 256))
+                code = 0 if output.audio.numel() > 0 else 1
+            finally:
+                os._exit(code)
+
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            done, status = os.waitpid(pid, os.WNOHANG)
+            if done:
+                break
+            time.sleep(0.05)
+        else:
+            os.kill(pid, 9)
+            os.waitpid(pid, 0)
+            pytest.fail("Batched forward in the forked worker did not finish")
+        manager.unload_all()
+
+    assert os.waitstatus_to_exitcode(status) == 0
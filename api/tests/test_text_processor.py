@@ -1,10 +1,18 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
 import pytest
 
+from api.src.core.phoneme_cache import PhonemeCache
+from api.src.services.text_processing import phonemizer, process_pool, text_processor
 from api.src.services.text_processing.text_processor import (
     get_sentence_info,
+    is_safe_cut,
     process_text_chunk,
+    process_text_chunks,
     smart_split,
 )
+from api.src.structures.schemas import NormalizationOptions
 
 
 def test_process_text_chunk_basic():
@@ -44,6 +52,136 @@ def test_get_sentence_info():
         assert count == len(tokens)
         assert count > 0
 
+def test_process_text_chunks_matches_single():
+    """Test that batched G2P gives the same tokens as per-chunk processing."""
+    texts = ["Hello world.", "...", "Mr. Smith paid $5,", "", "Nineteen ninety-nine!"]
+    with patch.object(phonemizer, "get_phoneme_cache", lambda: PhonemeCache(0)):
+        assert process_text_chunks(texts) == [process_text_chunk(t) for t in texts]
+
+
+def test_get_sentence_info_phonemizes_in_one_call():
+    """Test that all sentences of a text go to espeak together."""
+    text = "This is sentence one. This is sentence two! What about three?"
+    phonemizer.phonemize("warm up")
+    backend = phonemizer.phonemizers["a"].backend
+    with patch.object(
+        phonemizer, "get_phoneme_cache", lambda: PhonemeCache(0)
+    ), patch.object(backend, "phonemize", wraps=backend.phonemize) as espeak:
+        results = get_sentence_info(text)
+
+    espeak.assert_called_once()
+    assert [sentence for sentence, _, _ in results] == [
+        "This is sentence one.",
+        "This is sentence two!",
+        "What about three?",
+    ]
+
+
+def english_sentences(text):
+    normalized = text_processor.normalize_part(text, "a", NormalizationOptions())
+    return text_processor.split_sentences(normalized, "a")
+
+
+def test_is_safe_cut_rejects_rules_spanning_the_cut():
+    """Test that cuts are refused where normalization looks across them."""
+    text = "He met Dr. Smith. Then he left."
+    assert not is_safe_cut(text, text.index("Smith"), english_sentences)
+    assert is_safe_cut(text, text.index("Then"), english_sentences)
+
+
+@pytest.mark.asyncio
+async def test_smart_split_incremental_matches_whole_text():
+    """Test that processing the text in pieces keeps the chunk boundaries."""
+    paragraph = (
+        "Dr. Smith paid $5.50 at 5:00 pm. The U.S. and the U.K. agreed, etc. "
+        "Call 555-123-4567 now! Say [Kokoro](/kˈOkəɹO/) twice. "
+    )
+    text = "\n".join(paragraph * (i % 4 + 1) for i in range(40))
+
+    incremental = [chunk async for chunk in smart_split(text)]
+    with patch.object(text_processor, "iter_pieces", lambda text, process: iter([text])):
+        whole = [chunk async for chunk in smart_split(text)]
+
+    assert incremental == whole
+    assert len(list(text_processor.iter_pieces(text, english_sentences))) > 1
+
+
+@pytest.mark.asyncio
+async def test_smart_split_yields_before_processing_whole_text():
+    """Test that the first chunk does not wait for the rest of the text."""
+    text = "This is a fairly ordinary sentence for testing. " * 500
+    with patch.object(
+        text_processor, "get_sentence_info", wraps=text_processor.get_sentence_info
+    ) as sentence_info:
+        chunks = smart_split(text)
+        await chunks.__anext__()
+        processed = sum(len(call.args[0]) for call in sentence_info.call_args_list)
+        await chunks.aclose()
+
+    assert processed < len(text) / 4
+
+
+@pytest.mark.asyncio
+async def test_text_process_pool_map_keeps_order():
+    """Test that pool results come back in item order."""
+    pool = process_pool.TextProcessPool(workers=2, min_chars=0)
+    pool._executor = ThreadPoolExecutor(max_workers=2)
+    try:
+        results = [result async for result in pool.map(divmod, range(10), 3)]
+    finally:
+        pool.shutdown()
+    assert results == [divmod(i, 3) for i in range(10)]
+
+
+@pytest.mark.asyncio
+async def test_smart_split_process_pool_matches_in_process(monkeypatch):
+    """Test that long texts give the same chunks when split in the pool."""
+    text = "Dr. Smith paid $5.50 at 5:00 pm. The U.S. agreed, etc. " * 100
+    in_process = [chunk async for chunk in smart_split(text)]
+
+    # Threads stand in for worker processes, which run the same functions
+    pool = process_pool.TextProcessPool(workers=2, min_chars=1000)
+    pool._executor = ThreadPoolExecutor(max_workers=2)
+    monkeypatch.setattr(text_processor, "get_text_process_pool", lambda: pool)
+    with patch.object(pool, "map", wraps=pool.map) as pool_map:
+        pooled = [chunk async for chunk in smart_split(text)]
+        short = [chunk async for chunk in smart_split("Too short for the pool.")]
+    pool.shutdown()
+
+    assert pooled == in_process
+    assert pool_map.call_count == 1
+    assert len(short) == 1
+
+
+@pytest.mark.asyncio
+async def test_smart_split_small_first_chunk():
+    """Test that chunks ramp up from a small first chunk to the regular size."""
+    text = (
+        "When the morning train finally pulled into the station, after a long, slow "
+        "and uneventful night, the passengers gathered their bags and stepped out. "
+    ) * 30
+
+    regular = [chunk async for chunk in smart_split(text)]
+    ramped = [chunk async for chunk in smart_split(text, first_chunk_max_tokens=60)]
+    sizes = [len(tokens) for _, tokens, _ in ramped]
+
+    assert sizes[0] <= 60
+    assert len(ramped) > len(regular)
+    # Chunks grow until they reach the regular size
+    assert sizes[1] > sizes[0]
+    assert max(sizes) > 175
+    assert " ".join(t for t, _, _ in ramped) == " ".join(t for t, _, _ in regular)
+
+
+@pytest.mark.asyncio
+async def test_smart_split_first_chunk_disabled_keeps_chunks():
+    """Test that a zero or too large first chunk budget changes nothing."""
+    text = "This is a fairly ordinary sentence for testing. " * 60
+    regular = [chunk async for chunk in smart_split(text)]
+    assert [chunk async for chunk in smart_split(text, first_chunk_max_tokens=0)] == regular
+    assert [chunk async for chunk in smart_split(text, first_chunk_max_tokens=1000)] == regular
+
+
 @pytest.mark.asyncio
 async def test_smart_split_short_text():
     """Test smart splitting with text under max tokens."""
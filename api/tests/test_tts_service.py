@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import numpy as np
@@ -5,6 +6,9 @@ import pytest
 import torch
 import os
 
+from api.src.core.config import settings
+from api.src.inference.base import AudioChunk
+from api.src.inference.kokoro_v1 import KokoroV1
 from api.src.services.tts_service import TTSService
 
 
@@ -93,21 +97,58 @@ async def test_get_voice_path_combined():
         patch("api.src.services.tts_service.get_voice_manager") as mock_get_voice,
         patch("torch.load") as mock_load,
         patch("torch.save") as mock_save,
-        patch("tempfile.gettempdir") as mock_temp,
     ):
         mock_get_model.return_value = model_manager
         mock_get_voice.return_value = voice_manager
-        mock_temp.return_value = "/tmp"
-        mock_load.return_value = torch.ones(10)
+        mock_load.side_effect = lambda *args, **kwargs: torch.ones(10)
 
         service = await TTSService.create("test_output")
-        name, path = await service._get_voices_path("voice1+voice2")
+        name, voice_tensor = await service._get_voices_path("voice1+voice2")
         assert name == "voice1+voice2"
-        # Verify the path points to a temporary file with expected format
-        assert path.startswith("/tmp/")
-        assert "voice1+voice2" in path
-        assert path.endswith(".pt")
-        mock_save.assert_called_once()
+        # Blend is kept in memory instead of being written to a temp file
+        assert isinstance(voice_tensor, torch.Tensor)
+        assert torch.allclose(voice_tensor, torch.ones(10))
+        mock_save.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_voice_path_combined_cached():
+    """Test that equivalent voice blends are served from the blend cache."""
+    model_manager = AsyncMock()
+    voice_manager = AsyncMock()
+    voice_manager.get_voice_path.side_effect = lambda name: f"/path/to/{name}.pt"
+
+    with (
+        patch("api.src.services.tts_service.get_model_manager") as mock_get_model,
+        patch("api.src.services.tts_service.get_voice_manager") as mock_get_voice,
+        patch("torch.load") as mock_load,
+    ):
+        mock_get_model.return_value = model_manager
+        mock_get_voice.return_value = voice_manager
+        mock_load.side_effect = lambda *args, **kwargs: torch.ones(10)
+
+        service = await TTSService.create("test_output")
+        _, first = await service._get_voices_path("voice1(2)+voice2(1)")
+        assert mock_load.call_count == 2
+
+        # Same mix with different order and weight scale hits the cache
+        _, second = await service._get_voices_path("voice2(2)+voice1(4)")
+        assert second is first
+        assert mock_load.call_count == 2
+
+        # A different mix is blended again
+        _, third = await service._get_voices_path("voice1(1)+voice2(1)")
+        assert third is not first
+        assert mock_load.call_count == 4
+        assert service._voice_blends.stats()["hits"] == 1
+
+
+def test_blend_key_canonical():
+    """Test canonical blend keys for equivalent and different blends."""
+    key = TTSService._get_blend_key
+    assert key([("a", 2), "+", ("b", 1)], 3) == key([("b", 2), "+", ("a", 4)], 6)
+    assert key([("a", 1), "+", ("a", 1)], 2) == key([("a", 1)], 1)
+    assert key([("a", 1), "-", ("b", 1)], 2) != key([("a", 1), "+", ("b", 1)], 2)
 
 
 @pytest.mark.asyncio
@@ -128,3 +169,234 @@ async def test_list_voices():
         voices = await service.list_voices()
         assert voices == ["voice1", "voice2"]
         voice_manager.list_voices.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_generate_audio_stream_reuses_split_phonemes():
+    """Test that splitter phonemes are fed to the model when enabled."""
+    phoneme_calls = []
+
+    async def mock_generate_from_tokens(phonemes, voice, speed=1.0, lang_code=None):
+        phoneme_calls.append(phonemes)
+        yield AudioChunk(np.full(4800, 0.5, dtype=np.float32), word_timestamps=None)
+
+    model_manager = MagicMock()
+    model_manager.get_backend.return_value = MagicMock(spec=KokoroV1)
+    model_manager.generate_from_tokens = mock_generate_from_tokens
+    model_manager.generate = MagicMock(side_effect=AssertionError("G2P ran twice"))
+    voice_manager = AsyncMock()
+    voice_manager.get_voice_path.return_value = "/path/to/af_heart.pt"
+
+    service = TTSService()
+    service.model_manager = model_manager
+    service._voice_manager = voice_manager
+
+    with patch.object(settings, "reuse_split_phonemes", True):
+        chunks = [
+            chunk
+            async for chunk in service.generate_audio_stream(
+                "Hello world. How are you?", "af_heart", writer=None, output_format=None
+            )
+        ]
+
+    assert len(phoneme_calls) == 1
+    # Sentences are joined with a space, like the chunk text
+    assert ". " in phoneme_calls[0]
+    assert any(len(chunk.audio) > 0 for chunk in chunks)
+
+
+@pytest.mark.asyncio
+async def test_generate_audio_stream_sentence_cache():
+    """Test that chunks shared between requests only run inference once."""
+    generated = []
+
+    async def mock_generate(text, voice, speed=1.0, lang_code=None, return_timestamps=False):
+        generated.append(text)
+        yield AudioChunk(np.full(4800, 0.5, dtype=np.float32), word_timestamps=None)
+
+    model_manager = MagicMock()
+    model_manager.get_backend.return_value = MagicMock(spec=KokoroV1)
+    model_manager.generate = mock_generate
+    voice_manager = AsyncMock()
+    voice_manager.get_voice_path.return_value = "/path/to/af_heart.pt"
+
+    with patch.object(settings, "sentence_cache_enabled", True):
+        service = TTSService()
+    service.model_manager = model_manager
+    service._voice_manager = voice_manager
+
+    async def synthesize(text, speed=1.0):
+        chunks = [
+            chunk
+            async for chunk in service.generate_audio_stream(
+                text, "af_heart", writer=None, speed=speed, output_format=None
+            )
+        ]
+        return np.concatenate([chunk.audio for chunk in chunks])
+
+    first = await synthesize("This message is confidential.")
+    second = await synthesize(
+        "This message is confidential.[pause:0.1s]Thanks for reading."
+    )
+    assert len(generated) == 2
+    assert "Thanks" in generated[1]
+    # Cached audio is the same trimmed int16 PCM
+    assert second.dtype == np.int16
+    np.testing.assert_array_equal(second[: len(first)], first)
+
+    # Speed is part of the key
+    await synthesize("This message is confidential.", speed=1.5)
+    assert len(generated) == 3
+
+    stats = service.sentence_cache_info()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 3
+
+
+@pytest.mark.asyncio
+async def test_generate_from_phonemes_uses_model_manager():
+    """Test that phoneme requests go through the model manager's replicas."""
+    calls = []
+
+    async def mock_generate_from_tokens(phonemes, voice, speed=1.0, lang_code=None):
+        calls.append((phonemes, voice, speed, lang_code))
+        yield AudioChunk(np.full(4800, 0.5, dtype=np.float32), word_timestamps=None)
+
+    model_manager = MagicMock()
+    model_manager.get_backend.return_value = MagicMock(spec=KokoroV1)
+    model_manager.generate_from_tokens = mock_generate_from_tokens
+    voice_manager = AsyncMock()
+    voice_manager.get_voice_path.return_value = "/path/to/af_heart.pt"
+
+    service = TTSService()
+    service.model_manager = model_manager
+    service._voice_manager = voice_manager
+
+    audio, _ = await service.generate_from_phonemes("həlˈO", "af_heart", speed=1.2)
+
+    assert calls == [
+        ("həlˈO", ("af_heart", "/path/to/af_heart.pt"), 1.2, "a")
+    ]
+    np.testing.assert_array_equal(audio, np.full(4800, 0.5, dtype=np.float32))
+
+
+def make_streaming_service(mock_generate):
+    model_manager = MagicMock()
+    model_manager.get_backend.return_value = MagicMock(spec=KokoroV1)
+    model_manager.generate = mock_generate
+    voice_manager = AsyncMock()
+    voice_manager.get_voice_path.return_value = "/path/to/af_heart.pt"
+    service = TTSService()
+    service.model_manager = model_manager
+    service._voice_manager = voice_manager
+    return service
+
+
+async def collect_stream(service, text, output_format):
+    from api.src.services.streaming_audio_writer import StreamingAudioWriter
+
+    writer = StreamingAudioWriter(output_format, 24000)
+    return [
+        chunk
+        async for chunk in service.generate_audio_stream(
+            text, "af_heart", writer=writer, output_format=output_format
+        )
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("output_format", ["mp3", "wav", "pcm"])
+async def test_pipelined_encoding_matches_serial(output_format):
+    """Test that encoding on the encode executor produces the same stream."""
+
+    async def mock_generate(text, voice, speed=1.0, lang_code=None, return_timestamps=False):
+        audio = np.sin(np.arange(12000) / (5 + len(text) % 7)).astype(np.float32) * 0.5
+        yield AudioChunk(audio, word_timestamps=None)
+
+    service = make_streaming_service(mock_generate)
+    text = "First sentence.[pause:0.2s]Second sentence.[pause:0.1s]Third one."
+
+    with patch.object(settings, "encode_queue_size", 0):
+        serial = await collect_stream(service, text, output_format)
+    with patch.object(settings, "encode_queue_size", 2):
+        pipelined = await collect_stream(service, text, output_format)
+
+    assert b"".join(c.output for c in pipelined) == b"".join(c.output for c in serial)
+    assert [len(c.audio) for c in pipelined] == [len(c.audio) for c in serial]
+
+
+@pytest.mark.asyncio
+async def test_pipelined_encoding_overlaps_and_applies_backpressure():
+    """Test that inference runs ahead of encoding by at most the queue size."""
+    import time
+
+    from api.src.services.audio import AudioService
+
+    generated = []
+    encoded = []
+    max_ahead = 0
+
+    async def mock_generate(text, voice, speed=1.0, lang_code=None, return_timestamps=False):
+        await asyncio.sleep(0.05)  # Inference
+        generated.append(text)
+        yield AudioChunk(np.full(2400, 0.5, dtype=np.float32), word_timestamps=None)
+
+    write_audio = AudioService.write_audio
+
+    def slow_write_audio(audio_chunk, writer, is_last_chunk=False):
+        nonlocal max_ahead
+        max_ahead = max(max_ahead, len(generated) - len(encoded))
+        time.sleep(0.05)  # Encoding, on the encode executor
+        if not is_last_chunk:
+            encoded.append(len(audio_chunk.audio))
+        return write_audio(audio_chunk, writer, is_last_chunk)
+
+    service = make_streaming_service(mock_generate)
+    text = "[pause:0s]".join(f"Sentence {i}." for i in range(6))
+
+    with (
+        patch.object(settings, "encode_queue_size", 1),
+        patch.object(AudioService, "write_audio", side_effect=slow_write_audio),
+    ):
+        start = time.perf_counter()
+        chunks = await collect_stream(service, text, "pcm")
+        elapsed = time.perf_counter() - start
+
+    assert len(encoded) == 6
+    assert b"".join(c.output for c in chunks)
+    # Serial would take 6 * (0.05 + 0.05) = 0.6s
+    assert elapsed < 0.5
+    # One chunk in the queue, one being handed over, one being encoded
+    assert max_ahead <= 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("encode_queue_size", [0, 2])
+async def test_generate_audio_stream_records_failed_chunks(encode_queue_size):
+    """Test that chunks skipped after a failure are reported to the caller."""
+
+    async def mock_generate(text, voice, speed=1.0, lang_code=None, return_timestamps=False):
+        if "Broken" in text:
+            raise RuntimeError("inference failed")
+        yield AudioChunk(np.full(2400, 0.5, dtype=np.float32), word_timestamps=None)
+
+    from api.src.services.streaming_audio_writer import StreamingAudioWriter
+
+    service = make_streaming_service(mock_generate)
+    writer = StreamingAudioWriter("pcm", 24000)
+    failed_chunks = []
+
+    with patch.object(settings, "encode_queue_size", encode_queue_size):
+        chunks = [
+            chunk
+            async for chunk in service.generate_audio_stream(
+                "Fine sentence.[pause:0s]Broken sentence.",
+                "af_heart",
+                writer=writer,
+                output_format="pcm",
+                failed_chunks=failed_chunks,
+            )
+        ]
+
+    assert b"".join(chunk.output for chunk in chunks)
+    assert failed_chunks == ["Broken sentence."]
@@ -0,0 +1,66 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import torch
+
+from api.src.inference.voice_manager import VoiceManager
+
+
+@pytest.fixture
+def voice_manager():
+    """Create a fresh VoiceManager with a small cache."""
+    manager = VoiceManager()
+    manager._voices.max_entries = 2
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_load_voice_from_path_caches(voice_manager):
+    """Test that repeat loads are served from memory."""
+    with patch(
+        "api.src.core.paths.load_voice_tensor",
+        new=AsyncMock(return_value=torch.ones(3)),
+    ) as mock_load:
+        first = await voice_manager.load_voice_from_path("/voices/a.pt", "cpu")
+        second = await voice_manager.load_voice_from_path("/voices/a.pt", "cpu")
+
+    assert first is second
+    mock_load.assert_awaited_once()
+    info = voice_manager.cache_info()
+    assert info["loaded_voices"] == 1
+    assert info["hits"] == 1
+    assert info["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_load_voice_from_path_evicts_lru(voice_manager):
+    """Test LRU eviction once the cache size is exceeded."""
+    with patch(
+        "api.src.core.paths.load_voice_tensor",
+        new=AsyncMock(side_effect=lambda path, device: torch.ones(1)),
+    ) as mock_load:
+        await voice_manager.load_voice_from_path("/voices/a.pt", "cpu")
+        await voice_manager.load_voice_from_path("/voices/b.pt", "cpu")
+        await voice_manager.load_voice_from_path("/voices/a.pt", "cpu")  # a is now newest
+        await voice_manager.load_voice_from_path("/voices/c.pt", "cpu")  # evicts b
+        await voice_manager.load_voice_from_path("/voices/a.pt", "cpu")
+        assert mock_load.await_count == 3
+        await voice_manager.load_voice_from_path("/voices/b.pt", "cpu")
+        assert mock_load.await_count == 4
+
+    info = voice_manager.cache_info()
+    assert info["loaded_voices"] == 2
+    assert info["evictions"] == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_keyed_by_device(voice_manager):
+    """Test that the same voice on different devices is cached separately."""
+    with patch(
+        "api.src.core.paths.load_voice_tensor",
+        new=AsyncMock(side_effect=lambda path, device: torch.ones(1)),
+    ) as mock_load:
+        await voice_manager.load_voice_from_path("/voices/a.pt", "cpu")
+        await voice_manager.load_voice_from_path("/voices/a.pt", "meta")
+
+    assert mock_load.await_count == 2
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Inference Backend Benchmark - fp32 PyTorch against int8 and ONNX Runtime on CPU.
+
+Phonemizes sentences from benchmark_text.txt once with espeak, then runs
+every forward pass on the fp32 PyTorch model, its dynamic int8 variant and
+its ONNX export, reporting the real-time factor and weight size of each,
+how many segments got the same predicted durations, and the accuracy
+against fp32. The vocoder samples random phases, so audio is compared by
+log-spectral distance next to the distance between two fp32 runs rather
+than sample by sample. Runs in-process, no server needed; the int8 weights
+and the export are cached next to the model like the server does.
+
+    python benchmark/benchmark_backends.py --sentences 20 --threads 4
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import torch
+from kokoro import KModel
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from api.src.inference.kokoro_v1_onnx import (  # noqa: E402
+    KokoroV1Onnx,
+    OnnxModel,
+    OnnxSessionPool,
+)
+from api.src.inference.quantization import load_quantized_model  # noqa: E402
+from api.src.services.text_processing import normalize_text, phonemize  # noqa: E402
+from api.src.structures.schemas import NormalizationOptions  # noqa: E402
+
+MODEL_DIR = Path(__file__).resolve().parents[1] / "api" / "src" / "models" / "v1_0"
+VOICE = Path(__file__).resolve().parents[1] / "api" / "src" / "voices" / "v1_0" / "af_heart.pt"
+TEXT_FILE = Path(__file__).parent / "benchmark_text.txt"
+SAMPLE_RATE = 24000
+
+
+def log_spectrum(audio):
+    spec = torch.stft(
+        audio, n_fft=1024, hop_length=256, window=torch.hann_window(1024), return_complex=True
+    )
+    return torch.log(spec.abs() + 1e-5)
+
+
+def spectral_distance(a, b):
+    return (log_spectrum(a) - log_spectrum(b)).pow(2).mean().sqrt().item()
+
+
+def run(model, phonemes, voice):
+    outputs, elapsed = [], 0.0
+    for ps in phonemes:
+        ref_s = voice[len(ps) - 1]
+        start = time.perf_counter()
+        with torch.no_grad():
+            outputs.append(model(ps, ref_s, 1.0, return_output=True))
+        elapsed += time.perf_counter() - start
+    return outputs, elapsed
+
+
+def weights_mb(model):
+    buffer = io.BytesIO()
+    torch.save(model.state_dict(), buffer)
+    return buffer.tell() / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", default=str(MODEL_DIR / "kokoro-v1_0.pth"))
+    parser.add_argument("--voice", default=str(VOICE))
+    parser.add_argument("--sentences", type=int, default=20)
+    parser.add_argument("--threads", type=int, default=0, help="0 for library default")
+    parser.add_argument(
+        "--backends", nargs="+", default=["int8", "onnx"], choices=["int8", "onnx"]
+    )
+    args = parser.parse_args()
+
+    logger.remove()
+    if args.threads:
+        torch.set_num_threads(args.threads)
+    config_path = os.path.join(os.path.dirname(args.model), "config.json")
+    with open(config_path, encoding="utf-8") as f:
+        config = json.load(f)
+    voice = torch.load(args.voice, weights_only=True).float()
+
+    sentences = [s for s in TEXT_FILE.read_text().split(". ") if s.strip()]
+    phonemes = [
+        phonemize(normalize_text(sentence + ".", NormalizationOptions()))[:500]
+        for sentence in sentences[: args.sentences]
+    ]
+
+    torch_model = KModel(config=config, model=args.model).eval()
+    run(torch_model, phonemes[:1], voice)
+    expected, torch_time = run(torch_model, phonemes, voice)
+    again, _ = run(torch_model, phonemes, voice)
+    seconds = sum(len(o.audio) for o in expected) / SAMPLE_RATE
+    baseline = np.mean([spectral_distance(a.audio, b.audio) for a, b in zip(expected, again)])
+
+    print(f"{len(phonemes)} segments, {seconds:.1f}s of audio")
+    print(f"{'backend':>8} {'time':>9} {'RTF':>6} {'speedup':>8} {'weights':>9} "
+          f"{'durations':>10} {'distance':>9}")
+    print(f"{'pytorch':>8} {torch_time:8.3f}s {torch_time / seconds:6.3f} {1:7.2f}x "
+          f"{weights_mb(torch_model):7.1f}MB {'-':>10} {baseline:9.3f}")
+
+    for backend in args.backends:
+        if backend == "int8":
+            model = load_quantized_model(config_path, args.model)
+            size = f"{weights_mb(model):7.1f}MB"
+        else:
+            model = OnnxModel(
+                config["vocab"],
+                config["plbert"]["max_position_embeddings"],
+                OnnxSessionPool(
+                    KokoroV1Onnx._load_or_export(config_path, args.model),
+                    intra_op_threads=args.threads,
+                ),
+            )
+            size = f"{'-':>9}"
+        run(model, phonemes[:1], voice)
+        outputs, elapsed = run(model, phonemes, voice)
+
+        # Quantization can shift a duration by a frame, compare the overlap
+        same = sum(torch.equal(a.pred_dur, b.pred_dur) for a, b in zip(expected, outputs))
+        distance = np.mean([
+            spectral_distance(a.audio[: len(b.audio)], b.audio[: len(a.audio)])
+            for a, b in zip(expected, outputs)
+        ])
+        print(f"{backend:>8} {elapsed:8.3f}s {elapsed / seconds:6.3f} "
+              f"{torch_time / elapsed:7.2f}x {size} "
+              f"{same:>4}/{len(outputs):<5} {distance:9.3f}")
+    print("distance: log-spectral distance to fp32, pytorch row is its run-to-run distance")
+
+
+if __name__ == "__main__":
+    main()
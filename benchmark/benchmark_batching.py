@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Kokoro TTS Micro-batching Benchmark - throughput vs p50/p95 latency.
+
+Run once against a server started with BATCHING_ENABLED=false and once with
+BATCHING_ENABLED=true (plus INFERENCE_WORKERS >= concurrency), then compare.
+Works on CPU-only servers.
+
+    python benchmark/benchmark_batching.py --concurrency 1 2 4 8 --requests 32
+"""
+
+import argparse
+import concurrent.futures
+import statistics
+import time
+
+import requests
+
+KOKORO_URL = "http://localhost:8880/v1/audio/speech"
+VOICE = "af_heart"
+SENTENCES = [
+    "The quick brown fox jumps over the lazy dog.",
+    "Batching short requests together keeps the model busy.",
+    "Every request still gets its own audio back.",
+    "Latency should stay close to the unbatched baseline.",
+]
+
+
+def generate_tts(text):
+    payload = {"input": text, "voice": VOICE, "response_format": "pcm", "stream": False}
+    start = time.perf_counter()
+    resp = requests.post(KOKORO_URL, json=payload, timeout=300)
+    elapsed = time.perf_counter() - start
+    if resp.status_code != 200:
+        raise RuntimeError(f"HTTP {resp.status_code}: {resp.text[:200]}")
+    # 16-bit mono PCM
+    return elapsed, len(resp.content) / 2 / 24000
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run_level(concurrency, total_requests):
+    texts = [SENTENCES[i % len(SENTENCES)] for i in range(total_requests)]
+    start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(generate_tts, texts))
+    wall = time.perf_counter() - start
+
+    latencies = [r[0] for r in results]
+    audio_seconds = sum(r[1] for r in results)
+    return {
+        "concurrency": concurrency,
+        "requests_per_s": total_requests / wall,
+        "audio_s_per_s": audio_seconds / wall,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "mean_ms": statistics.mean(latencies) * 1000,
+    }
+
+
+def main():
+    global KOKORO_URL
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--requests", type=int, default=32)
+    parser.add_argument("--url", default=KOKORO_URL)
+    args = parser.parse_args()
+    KOKORO_URL = args.url
+
+    # Warm up pipelines and caches
+    generate_tts(SENTENCES[0])
+
+    print(f"{'conc':>4} {'req/s':>8} {'audio s/s':>10} {'p50 ms':>8} {'p95 ms':>8} {'mean ms':>8}")
+    for concurrency in args.concurrency:
+        r = run_level(concurrency, args.requests)
+        print(
+            f"{r['concurrency']:>4} {r['requests_per_s']:>8.2f} {r['audio_s_per_s']:>10.2f} "
+            f"{r['p50_ms']:>8.0f} {r['p95_ms']:>8.0f} {r['mean_ms']:>8.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Kokoro TTS Encode Pipeline Benchmark - overlap of inference and encoding.
+
+Streams the same long text a few times and reads the per-stage histograms
+from /metrics to show how much of the encode time was hidden behind
+inference. Run once against a server started with ENCODE_QUEUE_SIZE=0
+(serial, encoding inline on the event loop) and once with the default
+pipelined setting, then compare wall time and overlap.
+
+    python benchmark/benchmark_encode_pipeline.py --format mp3 --runs 3
+"""
+
+import argparse
+import re
+import time
+from pathlib import Path
+
+import requests
+
+KOKORO_URL = "http://localhost:8880"
+VOICE = "af_heart"
+TEXT_FILE = Path(__file__).parent / "benchmark_text.txt"
+
+STAGE_SUM = re.compile(
+    r'^kokoro_stage_duration_seconds_sum\{stage="(\w+)"\} ([0-9.e+-]+)$', re.M
+)
+
+
+def stage_sums():
+    text = requests.get(f"{KOKORO_URL}/metrics", timeout=10).text
+    return {stage: float(value) for stage, value in STAGE_SUM.findall(text)}
+
+
+def stream_once(text, response_format):
+    payload = {
+        "input": text,
+        "voice": VOICE,
+        "response_format": response_format,
+        "stream": True,
+    }
+    start = time.perf_counter()
+    first_byte = None
+    size = 0
+    with requests.post(
+        f"{KOKORO_URL}/v1/audio/speech", json=payload, stream=True, timeout=600
+    ) as resp:
+        resp.raise_for_status()
+        for chunk in resp.iter_content(chunk_size=None):
+            if chunk and first_byte is None:
+                first_byte = time.perf_counter() - start
+            size += len(chunk)
+    return time.perf_counter() - start, first_byte or 0.0, size
+
+
+def main():
+    global KOKORO_URL
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--format", default="mp3")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--chars", type=int, default=4000, help="Characters of text per request")
+    parser.add_argument("--url", default=KOKORO_URL)
+    args = parser.parse_args()
+    KOKORO_URL = args.url
+
+    text = TEXT_FILE.read_text()[: args.chars]
+    stream_once("Warm up.", args.format)
+
+    print(f"{'run':>3} {'wall s':>8} {'ttfb s':>8} {'forward s':>10} {'encode s':>9} {'overlap':>8}")
+    for run in range(args.runs):
+        before = stage_sums()
+        wall, ttfb, _ = stream_once(text, args.format)
+        after = stage_sums()
+        delta = {stage: after.get(stage, 0.0) - before.get(stage, 0.0) for stage in after}
+        forward = delta.get("forward", 0.0)
+        encode = delta.get("encode", 0.0)
+        # Share of encode time that ran concurrently with other stages
+        busy = sum(delta.values())
+        overlap = max(0.0, busy - wall) / encode if encode else 0.0
+        print(
+            f"{run:>3} {wall:>8.2f} {ttfb:>8.2f} {forward:>10.2f} {encode:>9.2f} {min(overlap, 1.0):>8.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
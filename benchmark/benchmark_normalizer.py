@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Text Normalizer Benchmark - normalize_text time on large inputs.
+
+Times the current normalize_text, which combines independent rules into a
+few scanners, against the previous one-rule-per-pass implementation on
+documents built from benchmark_text.txt plus a line exercising every rule
+group, and checks that both produce the same output. Runs in-process, no
+server needed.
+
+    python benchmark/benchmark_normalizer.py --sizes 10000 100000 1000000
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from api.src.services.text_processing import normalizer as n  # noqa: E402
+from api.src.structures.schemas import NormalizationOptions  # noqa: E402
+
+TEXT_FILE = Path(__file__).parent / "benchmark_text.txt"
+MIXED_LINE = (
+    "Dr. Smith paid $5.50 at 5:00 pm, 1,000 km/h. Yeah, see www.example.com/a?b=c "
+    "or me@example.com, call +1 (555) 123-4567 about the U.S. and the B's.\n"
+)
+
+
+def normalize_text_sequential(text, normalization_options):
+    """Previous implementation: one pass over the text per rule."""
+    if normalization_options.email_normalization:
+        text = n.EMAIL_PATTERN.sub(n.handle_email, text)
+    if normalization_options.url_normalization:
+        text = n.URL_PATTERN.sub(n.handle_url, text)
+    if normalization_options.unit_normalization:
+        text = n.UNIT_PATTERN.sub(n.handle_units, text)
+    if normalization_options.optional_pluralization_normalization:
+        text = re.sub(r"\(s\)", "s", text)
+    if normalization_options.phone_normalization:
+        text = re.sub(
+            r"(\+?\d{1,2})?([ .-]?)(\(?\d{3}\)?)[\s.-](\d{3})[\s.-](\d{4})",
+            n.handle_phone_number,
+            text,
+        )
+    text = text.replace(chr(8216), "'").replace(chr(8217), "'")
+    text = text.replace("«", chr(8220)).replace("»", chr(8221))
+    text = text.replace(chr(8220), '"').replace(chr(8221), '"')
+    for a, b in zip("、。！，：；？–", ",.!,:;?-"):
+        text = text.replace(a, b + " ")
+    text = n.TIME_PATTERN.sub(n.handle_time, text)
+    text = re.sub(r"[^\S \n]", " ", text)
+    text = re.sub(r"  +", " ", text)
+    text = re.sub(r"(?<=\n) +(?=\n)", "", text)
+    text = text.replace("\n", " ")
+    text = text.replace("\r", " ")
+    text = re.sub(r"\bD[Rr]\.(?= [A-Z])", "Doctor", text)
+    text = re.sub(r"\b(?:Mr\.|MR\.(?= [A-Z]))", "Mister", text)
+    text = re.sub(r"\b(?:Ms\.|MS\.(?= [A-Z]))", "Miss", text)
+    text = re.sub(r"\b(?:Mrs\.|MRS\.(?= [A-Z]))", "Mrs", text)
+    text = re.sub(r"\betc\.(?! [A-Z])", "etc", text)
+    text = re.sub(r"(?i)\b(y)eah?\b", r"\1e'a", text)
+    text = re.sub(r"(?<=\d),(?=\d)", "", text)
+    text = n.MONEY_PATTERN.sub(n.handle_money, text)
+    text = n.NUMBER_PATTERN.sub(n.handle_numbers, text)
+    text = re.sub(r"\d*\.\d+", n.handle_decimal, text)
+    if normalization_options.replace_remaining_symbols:
+        for symbol, replacement in n.SYMBOL_REPLACEMENTS.items():
+            text = text.replace(symbol, replacement)
+    text = re.sub(r"(?<=\d)-(?=\d)", " to ", text)
+    text = re.sub(r"(?<=\d)S", " S", text)
+    text = re.sub(r"(?<=[BCDFGHJ-NP-TV-Z])'?s\b", "'S", text)
+    text = re.sub(r"(?<=X')S\b", "s", text)
+    text = re.sub(
+        r"(?:[A-Za-z]\.){2,} [a-z]", lambda m: m.group().replace(".", "-"), text
+    )
+    text = re.sub(r"(?i)(?<=[A-Z])\.(?=[A-Z])", "-", text)
+    text = re.sub(r"\s{2,}", " ", text)
+    return text
+
+
+def best_time(normalize, text, options, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = normalize(text, options)
+        times.append(time.perf_counter() - start)
+    return result, min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    options = NormalizationOptions()
+    source = TEXT_FILE.read_text() + MIXED_LINE
+    print(f"{'chars':>9} {'sequential ms':>14} {'combined ms':>12} {'speedup':>8}")
+    for size in args.sizes:
+        text = (source * (size // len(source) + 1))[:size]
+        expected, sequential = best_time(normalize_text_sequential, text, options, args.runs)
+        result, combined = best_time(n.normalize_text, text, options, args.runs)
+        assert result == expected
+        print(
+            f"{size:>9} {sequential * 1000:>14.1f} {combined * 1000:>12.1f} "
+            f"{sequential / combined:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
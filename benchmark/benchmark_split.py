@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Smart Split Benchmark - chunking time for long documents.
+
+Runs smart_split over a document built from benchmark_text.txt with the
+phoneme cache disabled, so every sentence goes through espeak, and
+compares the batched G2P path with phonemizing one sentence per call.
+Runs in-process, no server needed.
+
+    python benchmark/benchmark_split.py --chars 50000 --njobs 1
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from api.src.core import phoneme_cache  # noqa: E402
+from api.src.core.config import settings  # noqa: E402
+from api.src.services.text_processing import text_processor  # noqa: E402
+
+TEXT_FILE = Path(__file__).parent / "benchmark_text.txt"
+
+
+def process_one_by_one(texts, language="a"):
+    """Previous behaviour: one espeak call per sentence."""
+    return [text_processor.process_text_chunk(text, language) for text in texts]
+
+
+async def split(text):
+    start = time.perf_counter()
+    chunks = [chunk async for chunk in text_processor.smart_split(text)]
+    return chunks, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chars", type=int, default=50000)
+    parser.add_argument("--njobs", type=int, default=1)
+    args = parser.parse_args()
+
+    settings.phonemizer_njobs = args.njobs
+    phoneme_cache._instance = phoneme_cache.PhonemeCache(0)
+    source = TEXT_FILE.read_text()
+    text = (source * (args.chars // len(source) + 1))[: args.chars]
+
+    asyncio.run(split("Warm up the phonemizer."))
+    batched, batched_time = asyncio.run(split(text))
+    with patch.object(text_processor, "process_text_chunks", process_one_by_one):
+        single, single_time = asyncio.run(split(text))
+
+    assert batched == single
+    print(f"{len(text)} chars, {len(batched)} chunks")
+    print(f"     batched: {batched_time:7.3f}s")
+    print(f"per-sentence: {single_time:7.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Smart Split First-Chunk Benchmark - time to the first chunk by input size.
+
+Measures how long smart_split takes to yield its first chunk for documents
+of increasing length, with the incremental splitter and with the whole
+text part normalized and phonemized up front. The phoneme cache is
+disabled so every run does the full work. Runs in-process, no server needed.
+
+    python benchmark/benchmark_split_ttfb.py --sizes 1000 10000 100000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from api.src.core import phoneme_cache  # noqa: E402
+from api.src.services.text_processing import text_processor  # noqa: E402
+
+TEXT_FILE = Path(__file__).parent / "benchmark_text.txt"
+
+
+async def first_chunk(text):
+    start = time.perf_counter()
+    async for _ in text_processor.smart_split(text):
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    phoneme_cache._instance = phoneme_cache.PhonemeCache(0)
+    source = TEXT_FILE.read_text()
+    asyncio.run(first_chunk("Warm up the phonemizer."))
+
+    print(f"{'chars':>8} {'incremental ms':>15} {'whole part ms':>14}")
+    for size in args.sizes:
+        text = (source * (size // len(source) + 1))[:size]
+        incremental = min(asyncio.run(first_chunk(text)) for _ in range(args.runs))
+        with patch.object(text_processor, "iter_pieces", lambda text, process: iter([text])):
+            whole = min(asyncio.run(first_chunk(text)) for _ in range(args.runs))
+        print(f"{size:>8} {incremental * 1000:>15.1f} {whole * 1000:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
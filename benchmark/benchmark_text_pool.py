@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Text Process Pool Benchmark - smart_split throughput by worker count.
+
+Splits a long document built from benchmark_text.txt in the server process
+and with the text process pool at each worker count, checking that every
+run produces the same chunks. The phoneme cache is disabled so every run
+does the full work, and workers are prewarmed before timing. Runs
+in-process, no server needed.
+
+    python benchmark/benchmark_text_pool.py --chars 200000 --workers 2 4
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from api.src.core import phoneme_cache  # noqa: E402
+from api.src.core.config import settings  # noqa: E402
+from api.src.services.text_processing import process_pool, text_processor  # noqa: E402
+
+TEXT_FILE = Path(__file__).parent / "benchmark_text.txt"
+
+
+async def split(text):
+    start = time.perf_counter()
+    chunks = [chunk async for chunk in text_processor.smart_split(text)]
+    return chunks, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chars", type=int, default=200000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4])
+    args = parser.parse_args()
+
+    logger.remove()
+    # Spawned workers read their settings from the environment
+    os.environ["PHONEME_CACHE_SIZE"] = "0"
+    settings.phoneme_cache_size = 0
+    phoneme_cache._instance = phoneme_cache.PhonemeCache(0)
+    source = TEXT_FILE.read_text()
+    text = (source * (args.chars // len(source) + 1))[: args.chars]
+
+    process_pool._instance = process_pool.TextProcessPool(0, 0)
+    asyncio.run(split("Warm up the phonemizer."))
+    expected, baseline = asyncio.run(split(text))
+    print(f"{len(text)} chars, {len(expected)} chunks")
+    print(f"   in process: {baseline:7.3f}s")
+
+    for workers in args.workers:
+        pool = process_pool._instance = process_pool.TextProcessPool(workers, 0)
+        start = time.perf_counter()
+        # Wait for every worker to finish its warm-up
+        asyncio.run(split(text[:20000]))
+        print(f"{workers:>3} workers started in {time.perf_counter() - start:.1f}s")
+        chunks, elapsed = asyncio.run(split(text))
+        pool.shutdown()
+        assert chunks == expected
+        print(f"{workers:>3} workers: {elapsed:7.3f}s ({baseline / elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
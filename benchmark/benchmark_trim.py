@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Silence Trim Benchmark - find_first_last_non_silent time per chunk.
+
+Times the vectorized silence detection against a sample-by-sample scan on
+chunks with a speech-like burst followed by a long quiet tail, the worst
+case for a scan, and checks that both find the same bounds. Runs
+in-process, no server needed.
+
+    python benchmark/benchmark_trim.py --seconds 1 10 30
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from api.src.services.audio import AudioNormalizer  # noqa: E402
+
+SAMPLE_RATE = 24000
+
+
+def find_first_last_non_silent_scan(audio_data, amplitude_threshold):
+    """Previous implementation: scan sample by sample from both ends."""
+    start = next(
+        (i for i in range(len(audio_data)) if abs(audio_data[i]) > amplitude_threshold),
+        None,
+    )
+    end = next(
+        (
+            i
+            for i in range(len(audio_data) - 1, -1, -1)
+            if abs(audio_data[i]) > amplitude_threshold
+        ),
+        None,
+    )
+    return start, end
+
+
+def best_time(func, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return result, min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, nargs="+", default=[1, 10, 30])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    normalizer = AudioNormalizer()
+    threshold = np.iinfo(np.int16).max * (10 ** (-45 / 20))
+    print(f"{'seconds':>8} {'scan ms':>10} {'vectorized ms':>14} {'speedup':>8}")
+    for seconds in args.seconds:
+        audio = np.zeros(int(seconds * SAMPLE_RATE), dtype=np.int16)
+        audio[len(audio) // 240 : len(audio) // 5] = 10000
+        (first, last), scan = best_time(
+            lambda: find_first_last_non_silent_scan(audio, threshold), args.runs
+        )
+        (start, end), vectorized = best_time(
+            lambda: normalizer.find_first_last_non_silent(
+                audio, "", 1.0, is_last_chunk=True
+            ),
+            args.runs,
+        )
+        assert start == max(first - normalizer.samples_to_pad_start, 0)
+        assert end == min(last + normalizer.samples_to_pad_start, len(audio))
+        print(
+            f"{seconds:>8g} {scan * 1000:>10.2f} {vectorized * 1000:>14.3f} "
+            f"{scan / vectorized:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()